@@ -0,0 +1,146 @@
+"""
+--------------------------------------------------------------------------
+Trach-Hero Game
+--------------------------------------------------------------------------
+License:   
+Copyright 2025 - Meghan Paral
+
+Redistribution and use in source and binary forms, with or without 
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this 
+list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice, 
+this list of conditions and the following disclaimer in the documentation 
+and/or other materials provided with the distribution.
+
+3. Neither the name of the copyright holder nor the names of its contributors 
+may be used to endorse or promote products derived from this software without 
+specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" 
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE 
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE 
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE 
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL 
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR 
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER 
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, 
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE 
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+--------------------------------------------------------------------------
+
+File: countdown.py
+Author: Meghan Paral
+Date:  10/19/2026
+Description: Live countdown on a display. A background renderer shows the time left to a
+             deadline (time.monotonic()) as M:SS with the colon, and as seconds with
+             tenths below 10 s. It sleeps until the visible value changes (never faster
+             than the frame rate cap), so the display only gets a write when the digits
+             change, and count_to() / clear() only set the deadline, so game loops never wait.
+"""
+
+import math
+import threading
+import time
+
+# --- COUNTDOWN CONFIGURATION ---
+COUNTDOWN_FPS = 10        # Max redraws per second (the tenths digit needs 10)
+TENTHS_BELOW = 10         # Seconds left below which tenths are shown
+EPSILON = 0.001           # Wake just past the moment the digits change
+
+
+def format_remaining(seconds):
+    """
+    Returns (text, colon, seconds until the text changes) for the time left.
+    Values are rounded up, so "0:01" / "0.1" stay until the deadline.
+    """
+    seconds = max(0.0, seconds)
+    tenths = math.ceil(seconds * 10)
+    if tenths < TENTHS_BELOW * 10:
+        text = f"{tenths // 10:3d}.{tenths % 10}"       # "  9.7"
+        return text, False, seconds - (tenths - 1) * 0.1
+    whole = math.ceil(seconds)
+    text = f"{whole // 60:2d}{whole % 60:02d}"          # " 030" + colon = " 0:30"
+    # Next change: the seconds tick down, or tenths take over
+    return text, True, seconds - max(whole - 1, TENTHS_BELOW - 0.1)
+
+
+class Countdown:
+    def __init__(self, display, rate=COUNTDOWN_FPS):
+        """display: a Display (or its output pipeline proxy)."""
+        self.display = display
+        self.period = 1.0 / rate
+        self.cond = threading.Condition()
+        self.deadline = None          # time.monotonic() the countdown ends at
+        self.shown = None             # (text, colon) on the display
+        self.frames = 0               # Redraws
+        self.running = False
+        self.thread = None
+
+    def count_to(self, deadline):
+        """Counts down to deadline (time.monotonic()); replaces a running countdown."""
+        with self.cond:
+            self.deadline = deadline
+            self.shown = None
+            self.cond.notify()
+
+    def clear(self):
+        """Stops redrawing; the display keeps its last frame until new content."""
+        with self.cond:
+            self.deadline = None
+            self.cond.notify()
+
+    def _run(self):
+        last = 0.0
+        with self.cond:
+            while self.running:
+                if self.deadline is None:
+                    self.cond.wait()
+                    continue
+                now = time.monotonic()
+                # Frame rate cap
+                if now < last + self.period:
+                    self.cond.wait(last + self.period - now)
+                    continue
+                text, colon, change = format_remaining(self.deadline - now)
+                if (text, colon) != self.shown:
+                    # Drawn under the lock, so no frame lands after clear()
+                    self.display.show_text(text, colon)
+                    self.shown = (text, colon)
+                    self.frames += 1
+                    last = now
+                if self.deadline - now <= 0:
+                    self.deadline = None     # Holds "0.0"
+                    continue
+                self.cond.wait(change + EPSILON)
+
+    def start(self):
+        """Starts the renderer thread."""
+        if self.thread is None:
+            self.running = True
+            self.thread = threading.Thread(target=self._run, daemon=True)
+            self.thread.start()
+
+    def stop(self):
+        """Stops the renderer thread."""
+        with self.cond:
+            self.running = False
+            self.deadline = None
+            self.cond.notify()
+        if self.thread is not None:
+            self.thread.join(1.0)
+            self.thread = None
+
+# --- TEST CODE ---
+if __name__ == "__main__":
+    class Console:
+        def show_text(self, text, colon=False):
+            print(f"{text[:2]}:{text[2:]}" if colon else text)
+    countdown = Countdown(Console())
+    countdown.start()
+    countdown.count_to(time.monotonic() + 12)
+    time.sleep(12.5)
+    countdown.stop()
+    print(f"{countdown.frames} frames")
@@ -0,0 +1,207 @@
+"""
+--------------------------------------------------------------------------
+Trach-Hero Game
+--------------------------------------------------------------------------
+License:   
+Copyright 2025 - Meghan Paral
+
+Redistribution and use in source and binary forms, with or without 
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this 
+list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice, 
+this list of conditions and the following disclaimer in the documentation 
+and/or other materials provided with the distribution.
+
+3. Neither the name of the copyright holder nor the names of its contributors 
+may be used to endorse or promote products derived from this software without 
+specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" 
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE 
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE 
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE 
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL 
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR 
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER 
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, 
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE 
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+--------------------------------------------------------------------------
+
+File: display_manager.py
+Author: Meghan Paral
+Date:  10/19/2026
+Description: Several HT16K33 displays (0x70 - 0x77) on one I2C bus. All units share one
+             bus handle; the output pipeline flushes their frames through a per-bus
+             scheduler with a fixed frame budget, so higher priority displays (score)
+             go before lower ones (decoration), equal priorities take turns, and the
+             bus load stays the same however many displays are added.
+"""
+
+import threading
+
+from display_driver import Display
+
+try:
+    import smbus          # Shared handle for the block writes
+except ImportError:
+    smbus = None
+
+# --- DISPLAY BUS CONFIGURATION ---
+FIRST_ADDRESS = 0x70      # HT16K33 address range (A0-A2 jumpers)
+LAST_ADDRESS = 0x77
+FRAME_BUDGET = 60         # Display writes per second on one bus, shared by all its displays
+AGING_TIME = 0.5          # A waiting display gains one priority level per this many seconds
+
+# Flush priorities (lower goes first)
+PRIORITY_SCORE = 0
+PRIORITY_TIMER = 1
+PRIORITY_DECORATION = 2
+
+
+class SharedBus:
+    """
+    One SMBus handle for every display on a bus; every HT16K33 write (frames and
+    commands) goes through it. smbus selects the address and writes in two system
+    calls, so each transaction holds the lock (effects write from their own threads).
+    """
+
+    def __init__(self, bus):
+        self.handle = smbus.SMBus(bus)
+        self.lock = threading.Lock()
+        self.transactions = 0
+
+    def write_i2c_block_data(self, address, register, data):
+        with self.lock:
+            self.transactions += 1
+            self.handle.write_i2c_block_data(address, register, data)
+
+    def write_byte(self, address, value):
+        with self.lock:
+            self.transactions += 1
+            self.handle.write_byte(address, value)
+
+
+class BusScheduler:
+    """Flushes the pending display frames of one bus within its frame budget."""
+
+    def __init__(self, bus, budget=FRAME_BUDGET):
+        self.bus = bus
+        self.budget = budget
+        self.shared = None            # SharedBus, if the displays have one
+        self.seen = 0                 # Its transaction count after the last flush
+        self.entries = []             # [priority, last flush, proxy]
+        self.tokens = 1.0             # Writes that may go out now
+        self.refilled = None
+        self.writes = 0
+        self.deferred = 0             # Frames pushed to a later tick by the budget
+
+    def add(self, proxy, priority=PRIORITY_DECORATION):
+        self.entries.append([priority, 0.0, proxy])
+
+    def proxies(self):
+        return [entry[2] for entry in self.entries]
+
+    def flush(self, now, force=False):
+        """
+        Applies pending frames, highest priority first and the longest waiting first
+        among equals; waiting raises the priority (AGING_TIME) so no display starves.
+        Returns (writes, frames still pending).
+        """
+        if self.refilled is not None:
+            burst = max(1, len(self.entries))
+            self.tokens = min(burst, self.tokens + (now - self.refilled) * self.budget)
+        self.refilled = now
+        if self.shared is not None:
+            # Writes since the last flush (effects, commands) come out of the same budget
+            self.tokens -= self.shared.transactions - self.seen
+
+        pending = [entry for entry in self.entries if entry[2].pending()]
+        pending.sort(key=lambda entry: entry[0] - (now - entry[1]) / AGING_TIME)
+        writes = 0
+        waiting = 0
+        for entry in pending:
+            if self.tokens < 1 and not force:
+                waiting += 1
+                continue
+            done = entry[2].apply()
+            if done:
+                entry[1] = now
+                self.tokens -= done
+                writes += done
+            elif entry[2].pending():
+                waiting += 1          # Busy proxy, retried next tick
+        if self.shared is not None:
+            self.seen = self.shared.transactions
+        self.writes += writes
+        self.deferred += waiting
+        return writes, waiting
+
+
+class DisplayManager:
+    def __init__(self, pipeline, bus=2, budget=FRAME_BUDGET):
+        """
+        Addresses several HT16K33 units on one bus through the output pipeline.
+        budget: display writes per second for the whole bus.
+        """
+        self.pipeline = pipeline
+        self.bus = bus
+        self.i2c = None
+        if smbus is not None:
+            try:
+                self.i2c = SharedBus(bus)
+            except OSError as e:
+                print(f"Warning: I2C bus {bus} unavailable: {e}")
+        scheduler = pipeline.bus_scheduler(bus, budget)
+        if self.i2c is not None:
+            scheduler.shared = self.i2c
+            scheduler.seen = self.i2c.transactions
+        self.displays = {}            # name -> PipelinedDisplay
+        self.addresses = {}           # name -> I2C address
+
+    def add(self, name, address=None, priority=PRIORITY_DECORATION):
+        """Adds a display (address None = next free one). Returns its pipelined proxy."""
+        used = set(self.addresses.values())
+        if address is None:
+            free = [a for a in range(FIRST_ADDRESS, LAST_ADDRESS + 1) if a not in used]
+            if not free:
+                raise ValueError(f"All HT16K33 addresses on bus {self.bus} are in use")
+            address = free[0]
+        if not FIRST_ADDRESS <= address <= LAST_ADDRESS:
+            raise ValueError(f"HT16K33 address must be 0x70 - 0x77, not {address:#x}")
+        if address in used:
+            raise ValueError(f"Address {address:#x} is already used on bus {self.bus}")
+
+        proxy = self.pipeline.display(Display(self.bus, address, i2c=self.i2c), self.bus, priority)
+        self.displays[name] = proxy
+        self.addresses[name] = address
+        return proxy
+
+    def __getitem__(self, name):
+        return self.displays[name]
+
+    def __contains__(self, name):
+        return name in self.displays
+
+    def get(self, name, default=None):
+        return self.displays.get(name, default)
+
+    def clear(self):
+        for display in self.displays.values():
+            display.clear()
+
+    def sleep(self, dim=False):
+        for display in self.displays.values():
+            display.sleep(dim)
+
+    def wake(self):
+        for display in self.displays.values():
+            display.wake()
+
+    def report(self):
+        scheduler = self.pipeline.schedulers[self.bus]
+        return (f"Displays on bus {self.bus}: {len(self.displays)} units, "
+                f"{scheduler.writes} writes, {scheduler.deferred} frames deferred by the budget")
@@ -39,7 +39,7 @@ Description:
 
 """
 
-import Adafruit_BBIO.GPIO as GPIO
+from gpio_backend import GPIO, event_time
 import time
 
 class Button:
@@ -54,12 +54,26 @@ class Button:
         """
         return GPIO.input(self.pin) == 0
 
-    def wait_for_press(self):
-        """Blocks execution until the button is pressed (signal goes LOW)."""
+    def wait_for_press(self, timeout=None):
+        """
+        Blocks execution until the button is pressed (signal goes LOW).
+        Returns the time of the press (time.monotonic() clock; the edge's kernel
+        timestamp on the cdev backend, now if the button was already held).
+        With a timeout (seconds) returns None if no press happened in time.
+        """
         if self.is_active():
-            return
+            return time.monotonic()  # No edge consumed: there is no edge time
         # Otherwise wait for the voltage to drop (Falling Edge)
-        GPIO.wait_for_edge(self.pin, GPIO.FALLING)
+        if timeout is None:
+            result = GPIO.wait_for_edge(self.pin, GPIO.FALLING)
+        else:
+            result = GPIO.wait_for_edge(self.pin, GPIO.FALLING, int(timeout * 1000))
+        if hasattr(GPIO, "last_event_time"):
+            # cdev backend: None on timeout, the edge carries a kernel timestamp
+            return None if result is None else event_time(self.pin)
+        # Adafruit_BBIO returns None on an edge and False on a timeout (the
+        # opposite of RPi.GPIO), so the level decides
+        return time.monotonic() if self.is_active() else None
 
     def wait_for_release(self):
         """Blocks execution until the button is released (signal goes HIGH)."""
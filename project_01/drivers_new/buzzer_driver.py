@@ -37,39 +37,73 @@ Date:  12/02/2025
 Description: A simple driver that controls a buzzer for audio feedback, enabling tones or alerts during gameplay events.
 """
 
-import Adafruit_BBIO.PWM as PWM
+from pwm_backend import PWM
+import melody
+from melody import HEARTBEAT_MELODY, ALARM_MELODY
 import time
 
 class Buzzer:
     def __init__(self, pin):
         self.pin = pin
-        PWM.start(self.pin, 0, 2000, 0)
+        self.frequency = 2000
+        self.duty = 0
+        PWM.start(self.pin, self.duty, self.frequency, 0)
+
+    def _set(self, frequency=None, duty=None):
+        """Only reprograms the PWM when the frequency / duty actually change."""
+        if frequency is not None and frequency != self.frequency:
+            PWM.set_frequency(self.pin, frequency)
+            self.frequency = frequency
+        if duty is not None and duty != self.duty:
+            PWM.set_duty_cycle(self.pin, duty)
+            self.duty = duty
 
     def tone(self, frequency, duration=None):
         """
         Plays a tone at the specified frequency (Hz).
         If duration is provided, plays for that time and then stops.
         """
-        PWM.set_frequency(self.pin, frequency)
-        PWM.set_duty_cycle(self.pin, 50) # 50% Duty Cycle = Max Volume
+        self._set(frequency, 50) # 50% Duty Cycle = Max Volume
         
         if duration:
             time.sleep(duration)
             self.off()
 
+    def _step(self, steps, i):
+        """Programs the compiled step at index i (see melody.py); duty 0 = rest."""
+        if steps[i + 1] == 0:
+            self.off()
+        elif hasattr(PWM, "set_pwm"):
+            PWM.set_pwm(self.pin, steps[i], steps[i + 1])  # Backend skips unchanged values
+            self.frequency = None
+            self.duty = None
+        else:
+            self._set(steps[i + 3], steps[i + 4])
+
+    def play(self, tune):
+        """
+        Plays a melody (RTTTL / "freq:ms" text, or an array from melody.compile_melody)
+        and silences the buzzer afterwards. The text is compiled once and cached.
+        """
+        steps = melody.compile_melody(tune) if isinstance(tune, str) else tune
+        deadline = time.monotonic()
+        for i in range(0, len(steps), melody.STEP_SIZE):
+            self._step(steps, i)
+            deadline += steps[i + 2] / 1e6
+            time.sleep(max(0, deadline - time.monotonic()))
+        self.off()
+
     def heartbeat(self):
         """Plays a 'lub-dub' heartbeat sound."""
-        self.tone(1000, 0.1) # Lub
-        time.sleep(0.1)
-        self.tone(1000, 0.1) # Dub
+        self.play(HEARTBEAT_MELODY)
 
     def alarm(self):
         """Plays a high-pitched alarm chirp."""
-        self.tone(3000, 0.2)
+        self.play(ALARM_MELODY)
 
     def off(self):
         """Silences the buzzer."""
-        PWM.set_duty_cycle(self.pin, 0)
+        self._set(duty=0)
 
     def cleanup(self):
         """Stops PWM and cleans up."""
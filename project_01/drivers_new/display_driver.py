@@ -38,19 +38,38 @@ Description: A driver for the HT16K33 LED display that shows numbers or short te
 """
 
 import ht16k33
+import threading
 import time
 import os
 
+SCROLL_FPS = 6            # Marquee frames (one-character shifts) per second
+DIGITS = 4                # Window width of the marquee
+
+# Hardware blink rates (Hz -> HT16K33 setting)
+BLINK_RATES = {
+    0: ht16k33.HT16K33_BLINK_OFF,
+    2: ht16k33.HT16K33_BLINK_2HZ,
+    1: ht16k33.HT16K33_BLINK_1HZ,
+    0.5: ht16k33.HT16K33_BLINK_HALFHZ,
+}
+
 class Display:
-    def __init__(self):
+    def __init__(self, bus=2, address=0x70, i2c=None):
         """
         Wrapper HT16K33 library
+        i2c: bus handle shared by several displays (see display_manager.py)
         """
         os.system("config-pin P1_26 i2c")
         os.system("config-pin P1_28 i2c")
 
+        # Effects run in a background thread; writes are serialized
+        self.lock = threading.RLock()
+        self.effect = None          # Running effect thread
+        self.effect_cancel = None   # Event that stops it
+        self.effect_content = False # Effect owns the digits (new content cancels it)
+
         try:
-            self.display = ht16k33.HT16K33(2, 0x70)
+            self.display = ht16k33.HT16K33(bus, address, i2c=i2c)
             self.display.setup(ht16k33.HT16K33_BLINK_OFF, ht16k33.HT16K33_BRIGHTNESS_HIGHEST)
             self.clear()
         except Exception as e:
@@ -58,22 +77,153 @@ class Display:
 
     def show_number(self, number):
         """Displays a number (0-9999)."""
-        try:
-            self.display.update(int(number))
-        except ValueError:
-            self.display.text("Err")
+        self._new_content()
+        with self.lock:
+            try:
+                self.display.update(int(number))
+            except ValueError:
+                self.display.text("Err")
 
-    def show_text(self, text):
-        """Displays text (limited to 4 chars)."""
-        self.display.text(str(text))
+    def show_text(self, text, colon=False):
+        """
+        Displays text: up to 4 characters in one buffer write (colon included),
+        longer messages scroll in the background (see scroll()).
+        """
+        text = str(text)
+        segments = self.display.encode_text(text)
+        if len(segments) > DIGITS:
+            self.scroll(text)
+            return
+        self._new_content()
+        with self.lock:
+            self.display.write_buffer(segments, colon)
 
     def clear(self):
         """Turns off all LEDs."""
-        self.display.blank()
+        self._new_content()
+        with self.lock:
+            self.display.blank()
+
+    # ---------------------------------------------------------
+    # Effects: the chip animates, the caller never waits
+    # ---------------------------------------------------------
+    def _start_effect(self, run, then=None, content=False):
+        """Runs run(cancel_event) in the background, replacing any running effect."""
+        self.cancel_effect()
+        cancel = threading.Event()
+        self.effect_content = content
+
+        def effect():
+            run(cancel)
+            if then is not None and not cancel.is_set():
+                then()
+
+        self.effect_cancel = cancel
+        self.effect = threading.Thread(target=effect, daemon=True)
+        self.effect.start()
+
+    def cancel_effect(self):
+        """Stops a running effect (its then-callback is skipped)."""
+        if self.effect_cancel is not None:
+            self.effect_cancel.set()
+        if self.effect is not None and self.effect is not threading.current_thread():
+            self.effect.join()
+        self.effect = None
+        self.effect_cancel = None
+        self.effect_content = False
+
+    def _new_content(self):
+        """New digits replace a running marquee (blinks and fades keep going)."""
+        if self.effect_content and self.effect is not threading.current_thread():
+            self.cancel_effect()
+
+    def effect_running(self):
+        return self.effect is not None and self.effect.is_alive()
+
+    def blink(self, rate=2, duration=None, then=None):
+        """
+        Hardware blink at 2, 1 or 0.5 Hz (0 = off) - one command, the chip does the rest.
+        With a duration, blinking stops after that many seconds and then() is called.
+        """
+        with self.lock:
+            self.display.set_blink(BLINK_RATES[rate])
+        if duration is None:
+            return
+
+        def run(cancel):
+            cancel.wait(duration)
+            with self.lock:
+                self.display.set_blink(ht16k33.HT16K33_BLINK_OFF)
+        self._start_effect(run, then)
+
+    def set_brightness(self, level):
+        """Brightness 0 (darkest) - 15 (brightest)."""
+        with self.lock:
+            self.display.set_brightness(level)
+
+    def fade(self, level, duration, then=None):
+        """Steps the brightness to level over duration seconds in the background."""
+        start = self.display.brightness
+        steps = abs(level - start)
+        if steps == 0:
+            if then is not None:
+                then()
+            return
+        direction = 1 if level > start else -1
+
+        def run(cancel):
+            for i in range(1, steps + 1):
+                if cancel.wait(duration / steps):
+                    return
+                self.set_brightness(start + direction * i)
+        self._start_effect(run, then)
+
+    def scroll(self, text, fps=SCROLL_FPS, loops=1, then=None):
+        """
+        Scrolls a message of any length right to left in the background.
+        The message is encoded once into a segment strip; every frame is one
+        buffer write of a 4-digit window. loops=0 repeats until new content.
+        """
+        blank = bytes(DIGITS)
+        strip = blank + bytes(self.display.encode_text(str(text))) + blank
+        frames = len(strip) - DIGITS + 1
+        period = 1.0 / fps
+
+        def run(cancel):
+            deadline = time.monotonic()
+            loop = 0
+            while loops == 0 or loop < loops:
+                for i in range(frames):
+                    with self.lock:
+                        if cancel.is_set():
+                            return
+                        self.display.write_buffer(strip[i:i + DIGITS])
+                    deadline += period
+                    if cancel.wait(max(0, deadline - time.monotonic())):
+                        return
+                loop += 1
+        self._start_effect(run, then, content=True)
+
+    def sleep(self, dim=False):
+        """Low-power idle: dims to the lowest level (dim=True) or stops the chip's oscillator."""
+        self.cancel_effect()
+        with self.lock:
+            if dim:
+                self.display.set_brightness(ht16k33.HT16K33_BRIGHTNESS_DARKEST)
+            else:
+                self.display.standby()
+
+    def wake(self):
+        """Back to full brightness (no blinking) after sleep()."""
+        with self.lock:
+            self.display.blink = ht16k33.HT16K33_BLINK_OFF
+            self.display.brightness = ht16k33.HT16K33_BRIGHTNESS_HIGHEST
+            self.display.wake()
 
     def colon(self, state):
         """Turns the colon on (True) or off (False)."""
-        self.display.set_colon(state)
+        with self.lock:
+            self.display.set_colon(state)
 
 # --- TEST CODE ---
 if __name__ == "__main__":
@@ -89,6 +239,11 @@ if __name__ == "__main__":
         disp.show_text("PLAY")
         time.sleep(1)
         
+        print("Blinking 2 Hz for 2 s, then fading out (non-blocking)...")
+        disp.blink(2, 2.0, then=lambda: disp.fade(0, 1.0))
+        time.sleep(3.5)
+        disp.set_brightness(15)
+
         print("Clearing (Should go dark)...")
         disp.clear()
         print("Test Complete.")
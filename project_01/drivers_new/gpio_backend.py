@@ -0,0 +1,84 @@
+"""
+--------------------------------------------------------------------------
+Trach-Hero Game
+--------------------------------------------------------------------------
+License:   
+Copyright 2025 - Meghan Paral
+
+Redistribution and use in source and binary forms, with or without 
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this 
+list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice, 
+this list of conditions and the following disclaimer in the documentation 
+and/or other materials provided with the distribution.
+
+3. Neither the name of the copyright holder nor the names of its contributors 
+may be used to endorse or promote products derived from this software without 
+specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" 
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE 
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE 
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE 
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL 
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR 
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER 
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, 
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE 
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+--------------------------------------------------------------------------
+
+File: gpio_backend.py
+Author: Meghan Paral
+Date:  10/19/2026
+Description: Picks the GPIO backend the drivers import as `GPIO`.
+             TRACH_GPIO_BACKEND=cdev -> gpio_cdev (Linux GPIO character device),
+             anything else           -> Adafruit_BBIO.GPIO (default)
+"""
+
+import os
+import time
+
+BACKEND = os.environ.get("TRACH_GPIO_BACKEND", "adafruit").lower()
+
+if BACKEND == "cdev":
+    import gpio_cdev as GPIO
+else:
+    import Adafruit_BBIO.GPIO as GPIO
+
+
+def output_many(values):
+    """Writes {channel: value}; a single ioctl per bank on the cdev backend."""
+    if hasattr(GPIO, "output_many"):
+        GPIO.output_many(values)
+    else:
+        for channel, value in values.items():
+            GPIO.output(channel, value)
+
+
+def bank_of(channel):
+    """
+    Output group of a pin: its GPIO bank on the cdev backend (one ioctl writes
+    a bank), the pin itself otherwise.
+    """
+    if hasattr(GPIO, "line_of"):
+        try:
+            return GPIO.line_of(channel)[0]
+        except ValueError:
+            pass                      # Unknown pin: a group of its own
+    return channel
+
+
+def event_time(channel):
+    """
+    Timestamp (time.monotonic() clock) of the edge being handled: the kernel
+    timestamp on the cdev backend, the time of the call otherwise.
+    """
+    if hasattr(GPIO, "last_event_time"):
+        stamp = GPIO.last_event_time(channel)
+        if stamp is not None:
+            return stamp
+    return time.monotonic()
@@ -0,0 +1,473 @@
+"""
+--------------------------------------------------------------------------
+Trach-Hero Game
+--------------------------------------------------------------------------
+License:   
+Copyright 2025 - Meghan Paral
+
+Redistribution and use in source and binary forms, with or without 
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this 
+list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice, 
+this list of conditions and the following disclaimer in the documentation 
+and/or other materials provided with the distribution.
+
+3. Neither the name of the copyright holder nor the names of its contributors 
+may be used to endorse or promote products derived from this software without 
+specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" 
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE 
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE 
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE 
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL 
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR 
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER 
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, 
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE 
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+--------------------------------------------------------------------------
+
+File: gpio_cdev.py
+Author: Meghan Paral
+Date:  10/19/2026
+Description: GPIO backend on the Linux GPIO character device (/dev/gpiochipN, v1 ioctl ABI).
+             Drop-in for the Adafruit_BBIO.GPIO calls the drivers use (setup, input, output,
+             wait_for_edge, add_event_detect, ...). Line handles stay open, several lines of
+             one bank can be read / written with a single ioctl (setup_group, output_many,
+             input_many) and edge events carry kernel timestamps (last_event_time).
+             Select it with TRACH_GPIO_BACKEND=cdev (see gpio_backend.py).
+"""
+
+import fcntl
+import glob
+import os
+import select
+import struct
+import threading
+import time
+
+# --- ADAFRUIT-COMPATIBLE CONSTANTS ---
+HIGH = 1
+LOW = 0
+OUT = 0
+IN = 1
+RISING = 1
+FALLING = 2
+BOTH = 3
+PUD_OFF = 0               # Pulls are set by the pinmux (config-pin), not here
+PUD_DOWN = 1
+PUD_UP = 2
+
+# --- PIN MAP (PocketBeagle header pin -> kernel GPIO number) ---
+# Bank = number // 32, line offset = number % 32
+PIN_MAP = {
+    "P1_02": 87, "P1_04": 89, "P1_06": 5, "P1_08": 2, "P1_10": 3, "P1_12": 4,
+    "P1_20": 20, "P1_26": 12, "P1_28": 13, "P1_29": 117, "P1_31": 114,
+    "P1_33": 111, "P1_34": 26, "P1_35": 88, "P1_36": 110,
+    "P2_01": 50, "P2_02": 59, "P2_03": 23, "P2_04": 58, "P2_05": 30,
+    "P2_06": 57, "P2_07": 31, "P2_08": 60, "P2_09": 15, "P2_10": 52,
+    "P2_11": 14, "P2_17": 65, "P2_18": 47, "P2_19": 27, "P2_20": 64,
+    "P2_22": 46, "P2_24": 44, "P2_25": 41, "P2_27": 40, "P2_28": 116,
+    "P2_29": 7, "P2_30": 113, "P2_31": 19, "P2_32": 112, "P2_33": 45,
+    "P2_34": 115, "P2_35": 86,
+}
+# The USR0-USR3 LEDs (GPIO 53-56) are owned by the leds-gpio driver; a line
+# request for them fails with EBUSY, so they are driven through /sys/class/leds.
+
+# Register base address of each AM335x GPIO bank (matched against chip labels)
+BANK_ADDRESS = ["44e07000", "4804c000", "481ac000", "481ae000"]
+
+# --- KERNEL ABI (include/uapi/linux/gpio.h, v1) ---
+GPIOHANDLES_MAX = 64
+GPIOHANDLE_REQUEST_INPUT = 1 << 0
+GPIOHANDLE_REQUEST_OUTPUT = 1 << 1
+GPIOEVENT_REQUEST_RISING_EDGE = 1 << 0
+GPIOEVENT_REQUEST_FALLING_EDGE = 1 << 1
+GPIOEVENT_EVENT_RISING_EDGE = 0x01
+GPIOEVENT_EVENT_FALLING_EDGE = 0x02
+
+CHIPINFO_STRUCT = struct.Struct("=32s32sI")
+HANDLE_REQUEST_STRUCT = struct.Struct("=64II64B32sIi")
+EVENT_REQUEST_STRUCT = struct.Struct("=III32si")
+EVENT_DATA_STRUCT = struct.Struct("=QI4x")
+HANDLE_DATA_SIZE = GPIOHANDLES_MAX
+
+def _iowr(nr, size):
+    return (3 << 30) | (size << 16) | (0xB4 << 8) | nr
+
+def _ior(nr, size):
+    return (2 << 30) | (size << 16) | (0xB4 << 8) | nr
+
+GPIO_GET_CHIPINFO_IOCTL = _ior(0x01, CHIPINFO_STRUCT.size)
+GPIO_GET_LINEHANDLE_IOCTL = _iowr(0x03, HANDLE_REQUEST_STRUCT.size)
+GPIO_GET_LINEEVENT_IOCTL = _iowr(0x04, EVENT_REQUEST_STRUCT.size)
+GPIOHANDLE_GET_LINE_VALUES_IOCTL = _iowr(0x08, HANDLE_DATA_SIZE)
+GPIOHANDLE_SET_LINE_VALUES_IOCTL = _iowr(0x09, HANDLE_DATA_SIZE)
+
+CONSUMER = b"trach-hero"
+
+EDGE_TO_FLAGS = {
+    RISING: GPIOEVENT_REQUEST_RISING_EDGE,
+    FALLING: GPIOEVENT_REQUEST_FALLING_EDGE,
+    BOTH: GPIOEVENT_REQUEST_RISING_EDGE | GPIOEVENT_REQUEST_FALLING_EDGE,
+}
+EVENT_TO_EDGE = {
+    GPIOEVENT_EVENT_RISING_EDGE: RISING,
+    GPIOEVENT_EVENT_FALLING_EDGE: FALLING,
+}
+
+# ------------------------------------------------------------------------
+# Line handles
+# ------------------------------------------------------------------------
+class LineHandle:
+    """One open request for one or more lines of a chip (one fd, one ioctl per access)."""
+
+    def __init__(self, fd, offsets, output, values=None):
+        self.fd = fd
+        self.offsets = list(offsets)
+        self.output = output
+        self.values = bytearray(HANDLE_DATA_SIZE)   # Last written output values
+        if values:
+            self.values[:len(values)] = bytes(values)
+        self.lock = threading.Lock()
+
+    def get_values(self):
+        data = bytearray(HANDLE_DATA_SIZE)
+        fcntl.ioctl(self.fd, GPIOHANDLE_GET_LINE_VALUES_IOCTL, data, True)
+        return list(data[:len(self.offsets)])
+
+    def set_values(self, changes):
+        """changes: {index: value}; all lines of the handle are written in one ioctl."""
+        with self.lock:
+            for index, value in changes.items():
+                self.values[index] = 1 if value else 0
+            fcntl.ioctl(self.fd, GPIOHANDLE_SET_LINE_VALUES_IOCTL, self.values)
+
+    def close(self):
+        os.close(self.fd)
+
+
+class EventLine:
+    """Edge-event request for one input line; events carry kernel timestamps."""
+
+    def __init__(self, channel, fd):
+        self.channel = channel
+        self.fd = fd
+        self.callbacks = []
+        self.bouncetime = 0
+        self.last_dispatch = None
+        self.last_event = (None, None)  # (edge, timestamp seconds)
+        self.thread = None
+        self.stop_r, self.stop_w = os.pipe()
+
+    def get_value(self):
+        data = bytearray(HANDLE_DATA_SIZE)
+        fcntl.ioctl(self.fd, GPIOHANDLE_GET_LINE_VALUES_IOCTL, data, True)
+        return data[0]
+
+    def read_event(self, timeout=None):
+        """
+        Returns (edge, timestamp seconds) of the next event, or None on timeout.
+        Timestamps use CLOCK_MONOTONIC (kernel 5.7+), the same clock as time.monotonic().
+        """
+        ready, _, _ = select.select([self.fd, self.stop_r], [], [], timeout)
+        if self.fd not in ready:
+            return None
+        data = os.read(self.fd, EVENT_DATA_STRUCT.size)
+        timestamp_ns, event_id = EVENT_DATA_STRUCT.unpack(data)
+        return (EVENT_TO_EDGE.get(event_id), timestamp_ns / 1e9)
+
+    def drain(self):
+        """Discards events that happened before now."""
+        while self.read_event(0) is not None:
+            pass
+
+    def dispatch_loop(self, edge):
+        while self.callbacks:
+            event = self.read_event()
+            if event is None:
+                break
+            if (edge != BOTH) and (event[0] != edge):
+                continue
+            if (self.last_dispatch is not None) and \
+               (event[1] - self.last_dispatch) * 1000 < self.bouncetime:
+                continue
+            self.last_dispatch = event[1]
+            self.last_event = event
+            for callback in list(self.callbacks):
+                callback(self.channel)
+
+    def close(self):
+        self.callbacks = []
+        os.write(self.stop_w, b"x")
+        if self.thread is not None and self.thread is not threading.current_thread():
+            self.thread.join(1.0)
+        os.close(self.fd)
+        os.close(self.stop_r)
+        os.close(self.stop_w)
+
+# ------------------------------------------------------------------------
+# Module state
+# ------------------------------------------------------------------------
+_chips = {}               # bank -> chip fd
+_lines = {}               # channel -> (LineHandle, index)
+_events = {}              # channel -> EventLine
+_lock = threading.RLock()
+
+
+def normalize(channel):
+    """'P2_2' -> 'P2_02' (Adafruit accepts both spellings)."""
+    if "_" in channel:
+        header, number = channel.split("_")
+        return f"{header}_{int(number):02d}"
+    return channel
+
+
+def line_of(channel):
+    """Returns (bank, line offset) of a header pin."""
+    try:
+        number = PIN_MAP[normalize(channel)]
+    except KeyError:
+        raise ValueError(f"Unknown GPIO channel {channel}")
+    return number // 32, number % 32
+
+
+def _chip_fd(bank):
+    """Opens the gpiochip of a bank (matched by label, falling back to gpiochip<bank>)."""
+    if bank in _chips:
+        return _chips[bank]
+
+    path = f"/dev/gpiochip{bank}"
+    for candidate in sorted(glob.glob("/dev/gpiochip*")):
+        fd = os.open(candidate, os.O_RDWR)
+        info = bytearray(CHIPINFO_STRUCT.size)
+        fcntl.ioctl(fd, GPIO_GET_CHIPINFO_IOCTL, info, True)
+        os.close(fd)
+        name, label, _ = CHIPINFO_STRUCT.unpack(info)
+        label = label.rstrip(b"\0").decode()
+        if (BANK_ADDRESS[bank] in label) or label.startswith(f"gpio-{bank * 32}-"):
+            path = candidate
+            break
+
+    _chips[bank] = os.open(path, os.O_RDWR)
+    return _chips[bank]
+
+
+def _release(channel):
+    """
+    Drops any earlier request of a channel (lines can only be requested once).
+    A line of a group handle is split out: the kernel only frees whole requests,
+    so the rest of the group is requested again (outputs keep their values).
+    """
+    if channel in _events:
+        _events.pop(channel).close()
+    if channel in _lines:
+        handle, _ = _lines.pop(channel)
+        rest = [(c, index) for c, (h, index) in _lines.items() if h is handle]
+        handle.close()
+        if rest:
+            bank = line_of(rest[0][0])[0]
+            direction = OUT if handle.output else IN
+            regroup = _request(bank, [handle.offsets[index] for _, index in rest], direction,
+                               [handle.values[index] for _, index in rest])
+            for new_index, (c, _) in enumerate(rest):
+                _lines[c] = (regroup, new_index)
+
+
+def _request(bank, offsets, direction, initial):
+    """initial: one output value for every line, or a list with one per line."""
+    flags = GPIOHANDLE_REQUEST_OUTPUT if direction == OUT else GPIOHANDLE_REQUEST_INPUT
+    defaults = list(initial) if isinstance(initial, (list, tuple)) else [initial] * len(offsets)
+    request = bytearray(HANDLE_REQUEST_STRUCT.pack(
+        *(offsets + [0] * (GPIOHANDLES_MAX - len(offsets))), flags,
+        *(defaults + [0] * (GPIOHANDLES_MAX - len(defaults))),
+        CONSUMER, len(offsets), 0))
+    fcntl.ioctl(_chip_fd(bank), GPIO_GET_LINEHANDLE_IOCTL, request, True)
+    fd = HANDLE_REQUEST_STRUCT.unpack(request)[-1]
+    return LineHandle(fd, offsets, direction == OUT, defaults)
+
+# ------------------------------------------------------------------------
+# Adafruit_BBIO.GPIO compatible API
+# ------------------------------------------------------------------------
+def setup(channel, direction, pull_up_down=PUD_OFF, initial=LOW, delay=0):
+    """Requests one line as input or output (the fd stays open)."""
+    channel = normalize(channel)
+    with _lock:
+        _release(channel)
+        bank, offset = line_of(channel)
+        _lines[channel] = (_request(bank, [offset], direction, initial), 0)
+
+
+def setup_group(channels, direction, initial=LOW):
+    """
+    Requests several lines together: one handle (fd) per GPIO bank, so
+    output_many / input_many touch each bank with a single ioctl.
+    """
+    channels = [normalize(c) for c in channels]
+    by_bank = {}
+    for channel in channels:
+        bank, offset = line_of(channel)
+        by_bank.setdefault(bank, []).append((channel, offset))
+
+    with _lock:
+        for channel in channels:
+            _release(channel)
+        for bank, members in by_bank.items():
+            handle = _request(bank, [offset for _, offset in members], direction, initial)
+            for index, (channel, _) in enumerate(members):
+                _lines[channel] = (handle, index)
+
+
+def _handle(channel):
+    channel = normalize(channel)
+    try:
+        return _lines[channel]
+    except KeyError:
+        raise RuntimeError(f"Channel {channel} is not set up")
+
+
+def input(channel):
+    channel = normalize(channel)
+    if channel in _events:
+        return _events[channel].get_value()
+    handle, index = _handle(channel)
+    if handle.output:
+        return handle.values[index]
+    return handle.get_values()[index]
+
+
+def output(channel, value):
+    handle, index = _handle(channel)
+    handle.set_values({index: value})
+
+
+def output_many(values):
+    """Writes {channel: value}; one ioctl per bank handle."""
+    per_handle = {}
+    for channel, value in values.items():
+        handle, index = _handle(channel)
+        per_handle.setdefault(id(handle), (handle, {}))[1][index] = value
+    for handle, changes in per_handle.values():
+        handle.set_values(changes)
+
+
+def input_many(channels):
+    """Reads several channels; one ioctl per bank handle. Returns a list of values."""
+    cache = {}
+    result = []
+    for channel in channels:
+        channel = normalize(channel)
+        if channel in _events:
+            result.append(_events[channel].get_value())
+            continue
+        handle, index = _handle(channel)
+        if handle.output:
+            result.append(handle.values[index])
+            continue
+        if id(handle) not in cache:
+            cache[id(handle)] = handle.get_values()
+        result.append(cache[id(handle)][index])
+    return result
+
+
+def _event_line(channel, edge):
+    """Turns a channel into an edge-event request (kept open)."""
+    channel = normalize(channel)
+    with _lock:
+        if channel in _events:
+            return _events[channel]
+        _release(channel)
+        bank, offset = line_of(channel)
+        request = bytearray(EVENT_REQUEST_STRUCT.pack(
+            offset, GPIOHANDLE_REQUEST_INPUT, EDGE_TO_FLAGS[BOTH], CONSUMER, 0))
+        fcntl.ioctl(_chip_fd(bank), GPIO_GET_LINEEVENT_IOCTL, request, True)
+        _events[channel] = EventLine(channel, EVENT_REQUEST_STRUCT.unpack(request)[-1])
+        return _events[channel]
+
+
+def wait_for_edge(channel, edge, timeout=-1):
+    """
+    Blocks until the given edge (timeout in ms, -1 = forever).
+    Returns the channel, or None on timeout.
+    """
+    line = _event_line(channel, edge)
+    line.drain()
+    deadline = None if timeout < 0 else time.monotonic() + timeout / 1000
+    while True:
+        remaining = None if deadline is None else max(0, deadline - time.monotonic())
+        event = line.read_event(remaining)
+        if event is None:
+            return None
+        if (edge == BOTH) or (event[0] == edge):
+            line.last_event = event
+            return channel
+
+
+def add_event_detect(channel, edge, callback=None, bouncetime=0):
+    """Calls callback(channel) from a background thread on each edge."""
+    line = _event_line(channel, edge)
+    line.bouncetime = bouncetime
+    if callback is not None:
+        line.callbacks.append(callback)
+    if line.thread is None:
+        line.drain()
+        line.thread = threading.Thread(target=line.dispatch_loop, args=(edge,), daemon=True)
+        line.thread.start()
+
+
+def add_event_callback(channel, callback):
+    _events[normalize(channel)].callbacks.append(callback)
+
+
+def remove_event_detect(channel):
+    channel = normalize(channel)
+    with _lock:
+        if channel in _events:
+            _events.pop(channel).close()
+    setup(channel, IN)
+
+
+def last_event_time(channel):
+    """
+    Kernel timestamp (seconds, time.monotonic() clock) of the edge being handled,
+    or None if the channel has no edge events yet.
+    """
+    line = _events.get(normalize(channel))
+    return None if line is None else line.last_event[1]
+
+
+def cleanup(channel=None):
+    """Releases one channel, or every line and chip."""
+    with _lock:
+        if channel is not None:
+            _release(normalize(channel))
+            return
+        for name in list(_events) + list(_lines):
+            _release(name)
+        for fd in _chips.values():
+            os.close(fd)
+        _chips.clear()
+
+# --- TEST CODE ---
+if __name__ == "__main__":
+    print("--- Testing GPIO character device backend ---")
+    leds = ["P2_18", "P2_20", "P2_22", "P2_24", "P2_28"]
+    setup_group(leds, OUT)
+    print("All LEDs on (one ioctl per bank)...")
+    output_many({pin: HIGH for pin in leds})
+    time.sleep(1)
+    output_many({pin: LOW for pin in leds})
+
+    print("Press the START button (P2_2)...")
+    setup("P2_2", IN)
+    if wait_for_edge("P2_2", FALLING, timeout=10000) is not None:
+        print(f">> Pressed at {last_event_time('P2_2'):.6f} "
+              f"(read {time.monotonic():.6f})")
+    else:
+        print("No press within 10 s.")
+    cleanup()
+    print("Test Complete.")
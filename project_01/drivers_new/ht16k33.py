@@ -30,6 +30,11 @@ OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 import os
 import time
 
+try:
+    import smbus          # One I2C block write per frame when available
+except ImportError:
+    smbus = None
+
 # ------------------------------------------------------------------------
 # Constants
 # ------------------------------------------------------------------------
@@ -51,13 +56,18 @@ LETTERS = {
     "u" : 0x1c, "U" : 0x3e, "y" : 0x6e, "Y" : 0x6e,
     " " : 0x00, "-" : 0x40, "0" : 0x3f, "1" : 0x06,
     "2" : 0x5b, "3" : 0x4f, "4" : 0x66, "5" : 0x6d,
-    "6" : 0x7d, "7" : 0x07, "8" : 0x7f, "9" : 0x6f, "?" : 0x53
+    "6" : 0x7d, "7" : 0x07, "8" : 0x7f, "9" : 0x6f, "?" : 0x53,
+    "k" : 0x75, "K" : 0x75, "m" : 0x37, "M" : 0x37, "v" : 0x1c,
+    "V" : 0x3e, "w" : 0x3e, "W" : 0x3e, "x" : 0x76, "X" : 0x76,
+    "z" : 0x5b, "Z" : 0x5b, "!" : 0x82, "_" : 0x08
 }
 
 CLEAR_DIGIT = 0x7F
 POINT_VALUE = 0x80
 DIGIT_ADDR = [0x00, 0x02, 0x06, 0x08]
 COLON_ADDR = 0x04
+COLON_VALUE = 0x02
+BUFFER_SIZE = 10         # Display RAM bytes 0x00 - 0x09 (digits + colon)
 HT16K33_BLINK_CMD = 0x80
 HT16K33_BLINK_DISPLAYON = 0x01
 HT16K33_BLINK_OFF = 0x00
@@ -79,18 +89,48 @@ class HT16K33():
     bus = None
     address = None
     command = None
+    blink = None
+    brightness = None
+    i2c = None
+    segments = None
+    colon_on = False
 
-    def __init__(self, bus, address=0x70, blink=HT16K33_BLINK_OFF, brightness=HT16K33_BRIGHTNESS_HIGHEST):
+    def __init__(self, bus, address=0x70, blink=HT16K33_BLINK_OFF, brightness=HT16K33_BRIGHTNESS_HIGHEST, i2c=None):
+        """ i2c: an SMBus-like handle shared with other devices on the bus (opened on first use if None) """
         self.bus = bus
         self.address = address
+        self.i2c = i2c
         self.command = "/usr/sbin/i2cset -y {0} {1}".format(bus, address)
+        self.segments = bytes(len(DIGIT_ADDR))
+        self.colon_on = False
         self.setup(blink, brightness)
         self.blank()
 
     def setup(self, blink, brightness):
-        os.system("{0} {1}".format(self.command, (HT16K33_SYSTEM_SETUP | HT16K33_OSCILLATOR)))
-        os.system("{0} {1}".format(self.command, (HT16K33_BLINK_CMD | blink | HT16K33_BLINK_DISPLAYON)))
-        os.system("{0} {1}".format(self.command, (HT16K33_BRIGHTNESS_CMD | brightness)))
+        self.blink = blink
+        self.brightness = brightness
+        self.write_command(HT16K33_SYSTEM_SETUP | HT16K33_OSCILLATOR)
+        self.write_command(HT16K33_BLINK_CMD | blink | HT16K33_BLINK_DISPLAYON)
+        self.write_command(HT16K33_BRIGHTNESS_CMD | brightness)
+
+    def set_blink(self, blink):
+        """ Hardware blink (HT16K33_BLINK_OFF / _2HZ / _1HZ / _HALFHZ), one command """
+        self.blink = blink
+        self.write_command(HT16K33_BLINK_CMD | blink | HT16K33_BLINK_DISPLAYON)
+
+    def set_brightness(self, brightness):
+        """ Dimming level 0 (darkest) - 15 (brightest) """
+        self.brightness = brightness
+        self.write_command(HT16K33_BRIGHTNESS_CMD | brightness)
+
+    def standby(self):
+        """ Display off and oscillator stopped (standby current); display RAM is kept """
+        self.write_command(HT16K33_BLINK_CMD)
+        self.write_command(HT16K33_SYSTEM_SETUP)
+
+    def wake(self):
+        """ Restart the oscillator and turn the display back on with the last settings """
+        self.setup(self.blink, self.brightness)
 
     def encode(self, data, double_point=False):
         ret_val = 0
@@ -104,42 +144,77 @@ class HT16K33():
             raise ValueError("Digit value must be between 0 and 15.")
         return ret_val
 
+    def encode_text(self, value):
+        """
+        Segment codes of a string ('.' lights the previous character's point,
+        unknown characters are blank)
+        """
+        segments = bytearray()
+        for char in value:
+            if char == "." and segments and not (segments[-1] & POINT_VALUE):
+                segments[-1] |= POINT_VALUE
+            else:
+                segments.append(LETTERS.get(char, 0x00))
+        return segments
+
+    def _handle(self):
+        """ The SMBus handle (the shared one if given, else opened on first use) """
+        if self.i2c is None:
+            self.i2c = smbus.SMBus(self.bus)
+        return self.i2c
+
+    def write_command(self, command):
+        """ One command byte (system setup, blink, brightness) """
+        if smbus is not None:
+            self._handle().write_byte(self.address, command)
+        else:
+            os.system("{0} {1}".format(self.command, command))
+
+    def write_buffer(self, segments, colon=False):
+        """
+        Writes four digits (segment codes) and the colon in one I2C block write.
+        Every display update goes through here; the frame is kept for the
+        single-digit / colon updates.
+        """
+        digits = bytes(segments[i] if i < len(segments) else 0x00 for i in range(len(DIGIT_ADDR)))
+        data = [0x00] * BUFFER_SIZE
+        for i, address in enumerate(DIGIT_ADDR):
+            data[address] = digits[i]
+        data[COLON_ADDR] = COLON_VALUE if colon else 0x00
+
+        if smbus is not None:
+            self._handle().write_i2c_block_data(self.address, 0x00, data)
+        else:
+            os.system("{0} 0x00 {1} i".format(self.command, " ".join(str(b) for b in data)))
+        self.segments = digits
+        self.colon_on = bool(colon)
+
     def set_digit(self, digit_number, data, double_point=False):
-        os.system("{0} {1} {2}".format(self.command, DIGIT_ADDR[digit_number], self.encode(data, double_point)))
+        self.set_digit_raw(digit_number, self.encode(data, double_point))
 
     def set_digit_raw(self, digit_number, data, double_point=False):
-        os.system("{0} {1} {2}".format(self.command, DIGIT_ADDR[digit_number], data))
+        segments = bytearray(self.segments)
+        segments[digit_number] = data
+        self.write_buffer(segments, self.colon_on)
 
     def set_colon(self, enable):
-        if enable:
-            os.system("{0} {1} {2}".format(self.command, COLON_ADDR, 0x02))
-        else:
-            os.system("{0} {1} {2}".format(self.command, COLON_ADDR, 0x00))
+        self.write_buffer(self.segments, enable)
 
     def blank(self):
-        self.set_colon(False)
-        for i in range(4):
-            self.set_digit_raw(i, 0x00)
+        self.write_buffer(bytes(len(DIGIT_ADDR)), False)
 
     def clear(self):
-        self.set_colon(False)
+        self.colon_on = False
         self.update(0)
 
     def update(self, value):
         if ((value < 0) or (value > 9999)):
             raise ValueError("Value is not between 0 and 9999")
-        self.set_digit(3, (value % 10))
-        self.set_digit(2, (value // 10) % 10)
-        self.set_digit(1, (value // 100) % 10)
-        self.set_digit(0, (value // 1000) % 10)
+        digits = [(value // 1000) % 10, (value // 100) % 10, (value // 10) % 10, value % 10]
+        self.write_buffer([self.encode(digit) for digit in digits], self.colon_on)
 
     def text(self, value):
         if ((len(value) < 1) or (len(value) > 4)):
             raise ValueError("Must have between 1 and 4 characters")
-        self.blank()
-        for i, char in enumerate(value):
-            try:
-                char_value = LETTERS[char]
-                self.set_digit_raw(i, char_value)
-            except:
-                pass
+        # Unknown characters stay blank
+        self.write_buffer([LETTERS.get(char, 0x00) for char in value], False)
@@ -37,7 +37,7 @@ Date:  12/02/2025
 Description: A GPIO-based driver that controls LEDs
 """
 
-import Adafruit_BBIO.GPIO as GPIO
+from gpio_backend import GPIO
 import time
 
 class LED:
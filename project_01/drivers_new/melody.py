@@ -0,0 +1,159 @@
+"""
+--------------------------------------------------------------------------
+Trach-Hero Game
+--------------------------------------------------------------------------
+License:   
+Copyright 2025 - Meghan Paral
+
+Redistribution and use in source and binary forms, with or without 
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this 
+list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice, 
+this list of conditions and the following disclaimer in the documentation 
+and/or other materials provided with the distribution.
+
+3. Neither the name of the copyright holder nor the names of its contributors 
+may be used to endorse or promote products derived from this software without 
+specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" 
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE 
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE 
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE 
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL 
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR 
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER 
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, 
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE 
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+--------------------------------------------------------------------------
+
+File: melody.py
+Author: Meghan Paral
+Date:  10/19/2026
+Description: Compiles melodies (RTTTL or a compact "freq:ms" note string) once into a packed
+             array of (period_ns, duty_ns, duration_us, frequency_hz, duty_percent) steps
+             that Buzzer.play() just walks, whichever PWM backend it drives.
+             Compiled melodies are cached by their text.
+
+             RTTTL:    "name:d=8,o=6,b=120:c,e,g,4c7,p,g"
+             Compact:  "1500:100,2000:200"   (frequency Hz : milliseconds, 0 Hz = rest)
+"""
+
+from array import array
+from functools import lru_cache
+
+# --- MELODY SETTINGS ---
+DUTY_PERCENT = 50         # 50% duty = loudest square wave for a piezo
+CACHE_SIZE = 64           # Distinct melodies kept compiled
+STEP_SIZE = 5             # Values per step in the compiled array
+
+# --- BUZZER TUNES (here so the game rules can time them without the PWM driver) ---
+HEARTBEAT_MELODY = "1000:100,0:100,1000:100"   # Lub, pause, dub
+ALARM_MELODY = "3000:200"                      # High-pitched chirp
+
+NOTE_INDEX = {"c": 0, "d": 2, "e": 4, "f": 5, "g": 7, "a": 9, "b": 11, "h": 11}
+RTTTL_DEFAULTS = {"d": 4, "o": 6, "b": 63}
+
+
+def note_frequency(index, octave):
+    """Equal-tempered frequency (Hz) of a semitone index (c = 0) in an octave (a4 = 440 Hz)."""
+    return 440.0 * 2 ** ((index - 9) / 12 + (octave - 4))
+
+
+def _step(steps, frequency, duration_ms):
+    if not (0 <= frequency < float("inf") and 0 <= duration_ms < float("inf")):
+        raise ValueError(f"Bad note: {frequency} Hz, {duration_ms} ms")
+    us = int(duration_ms * 1000)
+    if frequency > 0:
+        period = int(round(1e9 / frequency))
+        steps.extend((period, period * DUTY_PERCENT // 100, us, frequency, DUTY_PERCENT))
+    else:
+        steps.extend((0, 0, us, 0, 0))
+
+
+def _parse_rtttl_note(note, duration, octave, whole_ms):
+    """'8c#.6' -> (frequency Hz, duration ms)."""
+    i = 0
+    while i < len(note) and note[i].isdigit():
+        i += 1
+    if i:
+        duration = int(note[:i])
+
+    letter = note[i]
+    i += 1
+    semitone = None if letter == "p" else NOTE_INDEX[letter]
+    if i < len(note) and note[i] == "#":
+        semitone += 1
+        i += 1
+
+    dotted = False
+    rest = note[i:]
+    if "." in rest:
+        dotted = True
+        rest = rest.replace(".", "")
+    if rest:
+        octave = int(rest)
+
+    ms = whole_ms / duration * (1.5 if dotted else 1)
+    if semitone is None:
+        return 0, ms
+    return note_frequency(semitone, octave), ms
+
+
+def compile_rtttl(text):
+    _, settings, notes = text.split(":")
+    values = dict(RTTTL_DEFAULTS)
+    for item in settings.split(","):
+        if item.strip():
+            key, value = item.split("=")
+            values[key.strip().lower()] = int(value)
+    whole_ms = 4 * 60000 / values["b"]
+
+    steps = array("d")
+    for note in notes.lower().replace(" ", "").split(","):
+        if note:
+            frequency, ms = _parse_rtttl_note(note, values["d"], values["o"], whole_ms)
+            _step(steps, frequency, ms)
+    return steps
+
+
+def compile_compact(text):
+    steps = array("d")
+    for item in text.replace(" ", ",").split(","):
+        if item:
+            frequency, ms = item.split(":")
+            _step(steps, float(frequency), float(ms))
+    return steps
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def compile_melody(text):
+    """
+    Returns the packed step array of a melody (cached; do not modify it).
+    Raises ValueError for malformed melodies.
+    """
+    parts = text.split(":")
+    try:
+        if len(parts) == 3 and "=" in parts[1]:
+            return compile_rtttl(text)
+        return compile_compact(text)
+    except (KeyError, IndexError, ValueError, TypeError, ZeroDivisionError):
+        raise ValueError(f"Bad melody: {text!r}")
+
+
+def duration(steps):
+    """Total length of a compiled melody in seconds."""
+    return sum(steps[2::STEP_SIZE]) / 1e6
+
+# --- TEST CODE ---
+if __name__ == "__main__":
+    for text in ("1500:100,2000:200", "scale:d=8,o=5,b=120:c,d,e,f,g,a,b,4c6,p,8c#.6"):
+        steps = compile_melody(text)
+        print(f"{text!r}: {len(steps) // STEP_SIZE} steps, {duration(steps):.3f} s")
+        for i in range(0, len(steps), STEP_SIZE):
+            period, duty, us, hz, percent = steps[i:i + STEP_SIZE]
+            print(f"   {hz:8.1f} Hz  period {period:8.0f} ns  duty {duty:8.0f} ns  {us / 1000:6.1f} ms")
@@ -0,0 +1,220 @@
+"""
+--------------------------------------------------------------------------
+Trach-Hero Game
+--------------------------------------------------------------------------
+License:   
+Copyright 2025 - Meghan Paral
+
+Redistribution and use in source and binary forms, with or without 
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this 
+list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice, 
+this list of conditions and the following disclaimer in the documentation 
+and/or other materials provided with the distribution.
+
+3. Neither the name of the copyright holder nor the names of its contributors 
+may be used to endorse or promote products derived from this software without 
+specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" 
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE 
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE 
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE 
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL 
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR 
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER 
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, 
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE 
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+--------------------------------------------------------------------------
+
+File: pwm_sysfs.py
+Author: Meghan Paral
+Date:  10/19/2026
+Description: PWM backend on the kernel sysfs PWM interface (/dev/bone/pwm/<chip>/<a|b>).
+             Drop-in for the Adafruit_BBIO.PWM calls the drivers use (start, set_frequency,
+             set_duty_cycle, stop, cleanup). The period / duty_cycle files stay open, the last
+             written values are cached per channel so repeated calls cost nothing, and period
+             and duty are written in an order that keeps duty <= period at every step.
+             Select it with TRACH_PWM_BACKEND=sysfs (see pwm_backend.py).
+"""
+
+import os
+
+# --- PIN MAP (PocketBeagle header pin -> PWM output) ---
+PWM_ROOT = "/dev/bone/pwm"
+PIN_MAP = {
+    "P1_33": (0, "b"),    # EHRPWM0B
+    "P1_36": (0, "a"),    # EHRPWM0A (servo)
+    "P2_01": (1, "a"),    # EHRPWM1A (heartbeat buzzer)
+    "P2_03": (2, "b"),    # EHRPWM2B (alarm buzzer)
+}
+
+POLARITY = {0: b"normal", 1: b"inversed"}
+
+
+class Channel:
+    """Open period / duty_cycle / enable files of one PWM output and their last values."""
+
+    def __init__(self, path):
+        self.path = path
+        self.fds = {}
+        for name in ("period", "duty_cycle", "enable"):
+            self.fds[name] = os.open(os.path.join(path, name), os.O_RDWR)
+        self.period = self._read("period")
+        self.duty = self._read("duty_cycle")
+        self.enabled = self._read("enable")
+        self.writes = 0
+        self.skipped = 0
+
+    def _read(self, name):
+        return int(os.pread(self.fds[name], 32, 0).strip() or 0)
+
+    def _write(self, name, value):
+        os.pwrite(self.fds[name], b"%d" % value, 0)  # Whole ns, also from float arrays
+        self.writes += 1
+
+    def set_polarity(self, polarity):
+        """Polarity can only change while the output is disabled."""
+        path = os.path.join(self.path, "polarity")
+        if not os.path.exists(path):
+            return
+        with open(path, "r+b", buffering=0) as f:
+            if f.read().strip() == POLARITY[polarity]:
+                return
+            if self.enabled:
+                self.set_enable(0)
+            f.seek(0)
+            f.write(POLARITY[polarity])
+
+    def set(self, period=None, duty=None):
+        """
+        Writes only what changed. The kernel rejects duty > period, so a shorter
+        period goes after the duty that fits it, a longer one goes first.
+        """
+        period = self.period if period is None else period
+        duty = self.duty if duty is None else min(duty, period)
+
+        if period == self.period and duty == self.duty:
+            self.skipped += 1
+            return
+
+        if period != self.period and period >= self.duty:
+            self._write("period", period)
+            self.period = period
+        if duty != self.duty:
+            self._write("duty_cycle", duty)
+            self.duty = duty
+        if period != self.period:
+            self._write("period", period)
+            self.period = period
+
+    def set_enable(self, enabled):
+        if enabled != self.enabled:
+            self._write("enable", enabled)
+            self.enabled = enabled
+
+    def close(self):
+        for fd in self.fds.values():
+            os.close(fd)
+
+
+_channels = {}
+
+
+def normalize(channel):
+    """'P2_1' -> 'P2_01' (Adafruit accepts both spellings)."""
+    header, number = channel.split("_")
+    return f"{header}_{int(number):02d}"
+
+
+def _period_ns(frequency):
+    return int(round(1e9 / frequency))
+
+
+def _duty_ns(period, duty_percent):
+    return int(round(period * duty_percent / 100.0))
+
+
+def _channel(channel):
+    try:
+        return _channels[normalize(channel)]
+    except KeyError:
+        raise RuntimeError(f"PWM {channel} is not started")
+
+# ------------------------------------------------------------------------
+# Adafruit_BBIO.PWM compatible API
+# ------------------------------------------------------------------------
+def start(channel, duty_cycle, frequency=2000, polarity=0):
+    """Opens the output (once) and sets duty (%), frequency (Hz) and polarity."""
+    channel = normalize(channel)
+    if channel not in _channels:
+        try:
+            chip, output = PIN_MAP[channel]
+        except KeyError:
+            raise ValueError(f"Unknown PWM channel {channel}")
+        _channels[channel] = Channel(os.path.join(PWM_ROOT, str(chip), output))
+
+    pwm = _channels[channel]
+    pwm.set_polarity(polarity)
+    period = _period_ns(frequency)
+    pwm.set(period, _duty_ns(period, duty_cycle))
+    pwm.set_enable(1)
+
+
+def set_frequency(channel, frequency):
+    """Keeps the duty cycle percentage, like Adafruit_BBIO."""
+    pwm = _channel(channel)
+    period = _period_ns(frequency)
+    if pwm.period:
+        pwm.set(period, int(round(pwm.duty * period / pwm.period)))
+    else:
+        pwm.set(period, 0)
+
+
+def set_duty_cycle(channel, duty_cycle):
+    pwm = _channel(channel)
+    pwm.set(duty=_duty_ns(pwm.period, duty_cycle))
+
+
+def set_pwm(channel, period_ns, duty_ns):
+    """Sets period and duty in nanoseconds directly (no percentage rounding)."""
+    _channel(channel).set(period_ns, duty_ns)
+
+
+def stop(channel):
+    channel = normalize(channel)
+    if channel in _channels:
+        pwm = _channels.pop(channel)
+        pwm.set_enable(0)
+        pwm.close()
+
+
+def cleanup():
+    for channel in list(_channels):
+        stop(channel)
+
+
+def stats():
+    """Returns {channel: (writes, skipped no-op updates)}."""
+    return {name: (pwm.writes, pwm.skipped) for name, pwm in _channels.items()}
+
+# --- TEST CODE ---
+if __name__ == "__main__":
+    import time
+    print("--- Testing sysfs PWM backend (P2_1) ---")
+    start("P2_1", 0, 2000)
+    for _ in range(3):
+        for frequency in (1000, 1000, 1500):
+            set_frequency("P2_1", frequency)
+            set_duty_cycle("P2_1", 50)
+            time.sleep(0.1)
+            set_duty_cycle("P2_1", 0)
+            time.sleep(0.1)
+    writes, skipped = stats()["P2_01"]
+    print(f"{writes} sysfs writes, {skipped} redundant updates skipped")
+    cleanup()
+    print("Test Complete.")
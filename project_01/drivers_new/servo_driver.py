@@ -37,7 +37,7 @@ Date:  12/02/2025
 Description: A PWM-based driver for SG90 servos that maps positions to duty cycles
 """
 
-import Adafruit_BBIO.PWM as PWM
+from pwm_backend import PWM
 
 SG90_FREQ = 50      # 50Hz
 SG90_POL = 0        # Rising Edge polarity
@@ -47,6 +47,7 @@ SG90_MAX_DUTY = 10  # 10% duty cycle (Fully anti-clockwise/left)
 class Servo():
     pin = None
     position = None
+    duty = None
 
     def __init__(self, pin=None, default_position=0):
         """ Initialize variables and set up the Servo """
@@ -59,8 +60,14 @@ class Servo():
 
     def _setup(self, default_position):
         """Setup the hardware components."""
-        PWM.start(self.pin, self._duty_cycle_from_position(default_position),
-                  SG90_FREQ, SG90_POL)
+        self.duty = self._duty_cycle_from_position(default_position)
+        PWM.start(self.pin, self.duty, SG90_FREQ, SG90_POL)
+
+    def _set_duty(self, duty):
+        """ Write the duty cycle only when it changes. """
+        if duty != self.duty:
+            PWM.set_duty_cycle(self.pin, duty)
+            self.duty = duty
 
     def _duty_cycle_from_position(self, position):
         """ Compute the duty cycle from the position. """
@@ -77,14 +84,21 @@ class Servo():
         100 = Fully anti-clockwise (left)
         """
         self.position = position
-        PWM.set_duty_cycle(self.pin, self._duty_cycle_from_position(position))
+        self._set_duty(self._duty_cycle_from_position(position))
 
     def stop(self):
         """
         Stops the signal to the servo to prevent buzzing/heating.
         (Added for Game functionality)
         """
-        PWM.set_duty_cycle(self.pin, 5)
+        self._set_duty(SG90_MIN_DUTY)
+
+    def release(self):
+        """
+        Stops the pulses entirely (0% duty): the servo goes limp and draws
+        no holding current. turn() brings it back.
+        """
+        self._set_duty(0)
 
     def cleanup(self):
         """Cleanup the hardware components."""
@@ -39,31 +39,179 @@ Description: A driver for the VL6180X time-of-flight sensor that measures distan
 
 import time
 import os
+import smbus
+from gpio_backend import GPIO
 import vl6180x
+from tof_filter import BlockDetector, ENTER_MM, EXIT_MM
+
+# --- MULTI-SENSOR DEFAULTS ---
+FIRST_ADDRESS = 0x30      # First address handed out to extra sensors
+BOOT_TIME = 0.002         # Seconds a sensor needs after leaving shutdown
+BUS_BUDGET = 1000         # Approx. status polls per second while waiting for results
+RANGE_TIMEOUT = 0.1       # Give up on a measurement after this many seconds
 
 class DistanceSensor:
-    def __init__(self):
+    def __init__(self, enter_mm=ENTER_MM, exit_mm=EXIT_MM, sensor=None, bus_id=2):
         """
-        Initializes the VL6180X ToF sensor on I2C Bus 2.
+        Initializes the VL6180X ToF sensor on I2C Bus 2 (or 'bus_id').
         Uses local 'vl6180x.py' driver (No Adafruit libraries).
+        enter_mm/exit_mm are the hysteresis thresholds of the block detector.
+        Pass an already set-up vl6180x.VL6180X as 'sensor' to wrap it instead.
         """
+        self.detector = BlockDetector(enter_mm, exit_mm)
+        self.started = None         # When the measurement poll() waits for was started
+
+        if sensor is not None:
+            self.sensor = sensor
+            return
+
         os.system("config-pin P1_26 i2c")
         os.system("config-pin P1_28 i2c")
 
         try:
-            self.sensor = vl6180x.VL6180X(bus_id=2, address=0x29)
+            self.sensor = vl6180x.VL6180X(bus_id=bus_id, address=vl6180x.DEFAULT_ADDRESS)
         except Exception as e:
             print(f"\n[ToF Error] {e}")
             print("Check: 1. 2.2k Pull-up resistors. 2. Wiring.")
             raise
 
     def get_distance(self):
-        """Returns distance in millimeters."""
+        """Returns distance in millimeters (None if the measurement failed)."""
         return self.sensor.poll_range()
 
     def is_blocked(self, threshold_mm=40):
         """Returns True if object is closer than threshold."""
-        return self.get_distance() < threshold_mm
+        distance = self.get_distance()
+        return distance is not None and distance < threshold_mm
+
+    def sample(self):
+        """
+        Reads one sample into the filtered block detector.
+        Returns the debounced blocked state (see detector.held_for()).
+        A failed measurement is skipped (the state stays as it was).
+        """
+        return self.feed(self.get_distance())
+
+    def poll(self):
+        """
+        Non-blocking sample for a fixed-rate loop: if the running measurement is
+        ready it is fed into the detector and the next one is started. Never waits
+        for the sensor (one status read while a measurement is still running).
+        Returns the debounced blocked state.
+        """
+        now = time.monotonic()
+        if self.started is not None:
+            if self.sensor.range_ready():
+                distance = self.sensor.read_range()
+            elif now - self.started < RANGE_TIMEOUT:
+                return self.detector.blocked
+            else:
+                self.sensor.clear_interrupt()  # Given up: a failed measurement
+                distance = None
+            self.feed(distance)
+        self.sensor.start_range()
+        self.started = now
+        return self.detector.blocked
+
+    def feed(self, distance):
+        """Feeds one distance (None = failed measurement) into the detector."""
+        if distance is None:
+            return self.detector.blocked
+        return self.detector.update(distance)
+
+
+class DistanceSensorArray:
+    def __init__(self, shutdown_pins, bus_id=2, first_address=FIRST_ADDRESS,
+                 enter_mm=ENTER_MM, exit_mm=EXIT_MM, group_size=None,
+                 bus_budget=BUS_BUDGET):
+        """
+        Brings up several VL6180X sensors on one I2C bus.
+        Every sensor powers up at 0x29, so all are held in shutdown (GPIO0/CE low)
+        and released one at a time, each being moved to its own address before
+        the next one wakes up.
+
+        group_size: how many sensors range at the same time (None = all of them).
+                    Use a smaller group if sensors can see each other's emitters.
+        bus_budget: approximate status polls per second while waiting for results.
+        """
+        os.system("config-pin P1_26 i2c")
+        os.system("config-pin P1_28 i2c")
+
+        self.shutdown_pins = list(shutdown_pins)
+        self.group_size = group_size or len(self.shutdown_pins)
+        self.bus_budget = bus_budget
+        self.bus = smbus.SMBus(bus_id)   # One handle shared by all sensors
+        self.sensors = []
+
+        # Put every sensor into shutdown
+        for pin in self.shutdown_pins:
+            GPIO.setup(pin, GPIO.OUT)
+            GPIO.output(pin, GPIO.LOW)
+        time.sleep(BOOT_TIME)
+
+        # Wake them one at a time and give each a unique address
+        for i, pin in enumerate(self.shutdown_pins):
+            GPIO.output(pin, GPIO.HIGH)
+            time.sleep(BOOT_TIME)
+            try:
+                device = vl6180x.VL6180X(address=vl6180x.DEFAULT_ADDRESS, bus=self.bus)
+                device.set_address(first_address + i)
+            except Exception as e:
+                print(f"\n[ToF Error] Sensor {i} (shutdown pin {pin}): {e}")
+                raise
+            self.sensors.append(DistanceSensor(enter_mm, exit_mm, sensor=device))
+
+        self.samples = 0
+        self.sample_time = 0.0
+
+    def get_distances(self):
+        """
+        Ranges every sensor once and returns the distances (mm) in sensor order,
+        None for a sensor that timed out or reported a device error (no target: vl6180x.MAX_RANGE_MM).
+        Measurements in a group run concurrently, so the time per sweep stays
+        close to one measurement regardless of how many sensors share the group.
+        """
+        start = time.monotonic()
+        distances = [None] * len(self.sensors)
+
+        for first in range(0, len(self.sensors), self.group_size):
+            group = list(range(first, min(first + self.group_size, len(self.sensors))))
+            for i in group:
+                self.sensors[i].sensor.start_range()
+
+            pending = group
+            deadline = time.monotonic() + RANGE_TIMEOUT
+            while pending:
+                waiting = []
+                for i in pending:
+                    device = self.sensors[i].sensor
+                    if device.range_ready():
+                        distances[i] = device.read_range()
+                    elif time.monotonic() > deadline:
+                        device.clear_interrupt() # Given up: distances[i] stays None
+                    else:
+                        waiting.append(i)
+                pending = waiting
+                if pending:
+                    # Rough throttle: one status poll per pending sensor per
+                    # 1/bus_budget s; ignores the time the transfers themselves
+                    # take and the reads above, so it only bounds the poll rate
+                    time.sleep(len(pending) / self.bus_budget)
+
+        self.samples += len(self.sensors)
+        self.sample_time += time.monotonic() - start
+        return distances
+
+    def sample(self):
+        """Ranges every sensor and feeds each block detector. Returns the blocked states."""
+        distances = self.get_distances()
+        return [s.feed(d) for s, d in zip(self.sensors, distances)]
+
+    def sample_rate(self):
+        """Returns the aggregate samples per second achieved so far."""
+        if self.sample_time == 0:
+            return 0.0
+        return self.samples / self.sample_time
 
 # --- TEST CODE ---
 if __name__ == "__main__":
@@ -74,9 +222,12 @@ if __name__ == "__main__":
         print("Sensor Initialized. Reading data...")
         
         while True:
-            dist = tof.get_distance()
-            status = "BLOCKED" if dist < 40 else "CLEAR"
-            print(f"Dist: {dist} mm | Status: {status}")
+            blocked = tof.sample()
+            status = "BLOCKED" if blocked else "CLEAR"
+            filtered = tof.detector.filtered
+            shown = "  ---" if filtered is None else f"{filtered:5.1f}"
+            print(f"Filtered: {shown} mm | Status: {status} "
+                  f"| Held: {tof.detector.dwell():.1f}s")
             time.sleep(0.1)
 
     except KeyboardInterrupt:
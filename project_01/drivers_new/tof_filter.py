@@ -0,0 +1,144 @@
+"""
+--------------------------------------------------------------------------
+Trach-Hero Game
+--------------------------------------------------------------------------
+License:   
+Copyright 2025 - Meghan Paral
+
+Redistribution and use in source and binary forms, with or without 
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this 
+list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice, 
+this list of conditions and the following disclaimer in the documentation 
+and/or other materials provided with the distribution.
+
+3. Neither the name of the copyright holder nor the names of its contributors 
+may be used to endorse or promote products derived from this software without 
+specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" 
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE 
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE 
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE 
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL 
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR 
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER 
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, 
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE 
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+--------------------------------------------------------------------------
+
+File: tof_filter.py
+Author: Meghan Paral
+Date:  10/19/2026
+Description: A streaming detector for the ToF sample stream that filters noisy readings (median + EMA),
+             applies enter/exit hysteresis and tracks how long the sensor has been held blocked
+"""
+
+import threading
+import time
+from array import array
+
+# --- DETECTOR DEFAULTS ---
+WINDOW_SIZE = 5           # Samples in the median window (odd number)
+EMA_ALPHA = 0.5           # Weight of the newest median in the moving average
+ENTER_MM = 40             # Filtered distance below this = "blocked"
+EXIT_MM = 46              # Filtered distance above this = "clear" again
+
+class BlockDetector:
+    def __init__(self, enter_mm=ENTER_MM, exit_mm=EXIT_MM,
+                 window=WINDOW_SIZE, alpha=EMA_ALPHA):
+        """
+        Filters range samples and reports a debounced blocked/clear state.
+        Samples live in a fixed-size ring buffer, so each update does a
+        constant amount of work no matter how long the stream runs.
+        update() and reset() may be called from different threads.
+        """
+        if exit_mm < enter_mm:
+            raise ValueError("exit_mm must be >= enter_mm")
+        if window < 1:
+            raise ValueError("window must be at least 1")
+
+        self.enter_mm = enter_mm
+        self.exit_mm = exit_mm
+        self.alpha = alpha
+        self.window = array('H', [0] * window)
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Forgets all samples and returns to the 'clear' state."""
+        with self.lock:
+            self.index = 0
+            self.count = 0
+            self.filtered = None
+            self.blocked = False
+            self.blocked_since = None
+
+    def update(self, distance_mm, now=None):
+        """
+        Feeds one raw sample (mm) into the detector.
+        Returns the new blocked state.
+        """
+        if now is None:
+            now = time.monotonic()
+
+        with self.lock:
+            # Ring buffer write (clamped to the array's 16-bit range)
+            self.window[self.index] = max(0, min(int(distance_mm), 0xFFFF))
+            self.index = (self.index + 1) % len(self.window)
+            if self.count < len(self.window):
+                self.count += 1
+
+            # Median of the filled part of the window (window size is fixed)
+            ordered = sorted(self.window[:self.count])
+            median = ordered[self.count // 2]
+
+            # Exponential moving average on top of the median
+            if self.filtered is None:
+                self.filtered = float(median)
+            else:
+                self.filtered += self.alpha * (median - self.filtered)
+
+            # Hysteresis: different thresholds for entering and leaving "blocked"
+            if not self.blocked and self.filtered < self.enter_mm:
+                self.blocked = True
+                self.blocked_since = now
+            elif self.blocked and self.filtered > self.exit_mm:
+                self.blocked = False
+                self.blocked_since = None
+
+            return self.blocked
+
+    def dwell(self, now=None):
+        """Returns how long (seconds) the detector has been blocked, 0 if clear."""
+        since = self.blocked_since  # One read: reset() may clear it meanwhile
+        if since is None:
+            return 0.0
+        if now is None:
+            now = time.monotonic()
+        return now - since
+
+    def held_for(self, seconds, now=None):
+        """Returns True if the sensor has been held blocked for at least 'seconds'."""
+        return self.blocked and self.dwell(now) >= seconds
+
+# --- TEST CODE ---
+if __name__ == "__main__":
+    print("--- Testing BlockDetector (synthetic samples) ---")
+    detector = BlockDetector(enter_mm=40, exit_mm=46)
+
+    # Hand held at ~30mm with one bad reading in the middle
+    samples = [120, 110, 35, 30, 31, 200, 29, 30, 32, 30, 31, 30]
+    t = 0.0
+    for s in samples:
+        state = detector.update(s, now=t)
+        print(f"t={t:.2f}s raw={s:3d} filtered={detector.filtered:6.1f} "
+              f"blocked={state} dwell={detector.dwell(t):.2f}s")
+        t += 0.05
+
+    print("Held for 0.3s?", detector.held_for(0.3, now=t))
+    print("Test Complete.")
@@ -49,11 +49,23 @@ REG_RESULT_RANGE_STATUS        = 0x04d
 REG_RESULT_INTERRUPT_STATUS_GPIO = 0x04f
 REG_RESULT_RANGE_VAL           = 0x062
 REG_SYSTEM_INTERRUPT_CLEAR     = 0x015
+REG_I2C_SLAVE_DEVICE_ADDRESS   = 0x212
+
+DEFAULT_ADDRESS = 0x29
+
+# Range error codes (RESULT__RANGE_STATUS bits 7:4) that mean "nothing in range":
+# early / max convergence, no target, low SNR, raw and final range overflow.
+# They read as MAX_RANGE_MM; the other codes (VCSEL, PLL, underflow) are device errors.
+NO_TARGET_ERRORS = (6, 7, 8, 11, 13, 15)
+MAX_RANGE_MM = 255
 
 class VL6180X:
-    def __init__(self, bus_id=2, address=0x29):
+    def __init__(self, bus_id=2, address=DEFAULT_ADDRESS, bus=None):
+        """
+        Pass 'bus' to share one already-open SMBus handle between several sensors.
+        """
         self.address = address
-        self.bus = smbus.SMBus(bus_id)
+        self.bus = bus if bus is not None else smbus.SMBus(bus_id)
         
         try:
             model_id = self.read_reg(REG_IDENTIFICATION_MODEL_ID)
@@ -81,21 +93,52 @@ class VL6180X:
         
         return self.bus.read_byte(self.address)
 
-    def poll_range(self):
-        """Performs a single-shot range measurement."""
+    def set_address(self, new_address):
+        """
+        Moves the sensor to a new 7-bit I2C address.
+        The new address only lasts until the sensor is reset / powered down.
+        """
+        self.write_reg(REG_I2C_SLAVE_DEVICE_ADDRESS, new_address & 0x7F)
+        self.address = new_address & 0x7F
+
+    def start_range(self):
+        """Starts a single-shot range measurement (non-blocking)."""
         self.write_reg(REG_SYSRANGE_START, 0x01)
+
+    def range_ready(self):
+        """Returns True once the started measurement has completed."""
+        return bool(self.read_reg(REG_RESULT_INTERRUPT_STATUS_GPIO) & 0x04)
+
+    def read_range(self):
+        """
+        Reads the finished measurement (mm) and clears the interrupt.
+        No target in range (or beyond it) reads as MAX_RANGE_MM; returns None
+        if the sensor reports a device error.
+        """
+        error = self.read_reg(REG_RESULT_RANGE_STATUS) >> 4
+        range_mm = self.read_reg(REG_RESULT_RANGE_VAL)
+        self.clear_interrupt()
+        if error in NO_TARGET_ERRORS:
+            return MAX_RANGE_MM
+        if error:
+            return None
+        return range_mm
+
+    def clear_interrupt(self):
+        """Clears the result interrupt (also after a measurement is given up)."""
+        self.write_reg(REG_SYSTEM_INTERRUPT_CLEAR, 0x07)
+
+    def poll_range(self):
+        """Performs a single-shot range measurement. Returns None on timeout / error."""
+        self.start_range()
         
         for _ in range(100):
-            status = self.read_reg(REG_RESULT_INTERRUPT_STATUS_GPIO)
-            if (status & 0x04):
-                break
+            if self.range_ready():
+                return self.read_range()
             time.sleep(0.001)
         
-        range_mm = self.read_reg(REG_RESULT_RANGE_VAL)
-        
-        self.write_reg(REG_SYSTEM_INTERRUPT_CLEAR, 0x07)
-        
-        return range_mm
+        self.clear_interrupt()
+        return None
 
     def load_settings(self):
         """Loads mandatory tuning settings from datasheet."""
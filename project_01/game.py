@@ -41,6 +41,7 @@ import time
 import random
 import sys
 import os
+import argparse
 
 # --- PATH SETUP ---
 # Add the 'drivers' folder to the system path so we can import our files
@@ -52,54 +53,168 @@ from button_driver import Button
 from servo_driver import Servo
 from buzzer_driver import Buzzer
 from tof_driver import DistanceSensor
-from display_driver import Display
+from leaderboard import Leaderboard
+from reaction_stats import ReactionStats
+from input_sampler import InputSampler
+import realtime
+from idle_manager import IdleManager
+from output_pipeline import OutputPipeline
+from display_manager import DisplayManager, PRIORITY_SCORE, PRIORITY_TIMER, PRIORITY_DECORATION
+from countdown import Countdown
+from scenario_engine import ScenarioEngine
+from scenarios import SCENARIOS
+import game_rules
+from game_rules import DEFAULT_RULES, SOUND_SUCCESS, SOUND_FAIL
 
 # --- GAME CONFIGURATION ---
-GAME_DURATION = 30        # Total game time in seconds
-BASE_TIMEOUT = 10.0       # Starting time limit for scenarios (Easier)
-MIN_TIMEOUT = 2.0         # Minimum time limit (fastest speed)
+# Difficulty (game duration, time limits, twitch chance) lives in game_rules.py
 TOF_THRESHOLD = 39        # Distance in mm for "suction" detection
+TOF_RELEASE = 45          # Distance in mm the probe must back off to end suction
+HISCORE_SWAP = 3.0        # Seconds between "RDY" and the high score while idle
+CELEBRATION_TIME = 1.8    # Seconds the final score blinks after a win
+TOF_EVERY = 2             # Check the ToF sensor every Nth input tick (one status read)
+
+# Flush priority of the station's displays on the shared I2C bus (others: decoration)
+DISPLAY_PRIORITY = {"score": PRIORITY_SCORE, "timer": PRIORITY_TIMER}
+
+# --- STATION CONFIGURATION ---
+# Pin map of a single training station. Pins must NOT have leading zeros
+# for the Python library. Other stations override any of these keys.
+DEFAULT_CONFIG = {
+    "name": "station-1",
+    "led_red": "P2_18",
+    "led_yellow": "P2_20",
+    "led_green": "P2_22",
+    "led_white": "P2_24",
+    "led_blue": "P2_28",
+    "servo": "P1_36",
+    "buzzer_hb": "P2_1",
+    "buzzer_alarm": "P2_3",
+    "btn_start": "P2_2",
+    "btn_ems": "P2_4",
+    "sensor_hall": "P2_6",
+    "i2c_bus": 2,
+    "display_address": 0x70,   # Score display
+    "displays": {},            # Extra displays on the same bus: name -> address (0x71 - 0x77)
+    "db_path": "scores.db",    # Session store (None = don't keep scores)
+    "player": "guest",
+    "sample_rate": 100,        # Input sampler ticks per second
+    "realtime": False,         # SCHED_FIFO + mlockall + GC only between rounds
+    "idle_timeout": 120.0,     # Seconds before the low-power idle state (0 = never)
+    "idle_dim": False,         # Idle display: dimmed (True) or oscillator off (False)
+    "render_rate": 50,         # Output pipeline ticks per second
+    "countdown": True,         # Live time left: scenario on the score display, or round
+                               # and scenario on a "timer" display if there is one
+}
 
 class TrachGame:
-    def __init__(self):
+    def __init__(self, config=None):
         print("Initializing Hardware...")
+        self.config = dict(DEFAULT_CONFIG, **(config or {}))
+        cfg = self.config
+
+        # Optional hook called with a dict for every game event (see report())
+        self.reporter = None
+        self.state = "init"
+        self.running = True           # main_loop() runs until stop()
+        self.start_requested = False  # Round requested without the start button
+        self.aborted = False          # Current round aborted (abort_round())
         
         # --- OUTPUTS ---
-        # LEDs (Active High) - Pins must NOT have leading zeros for Python library
-        self.led_red  = LED("P2_18")
-        self.led_yellow = LED("P2_20")
-        self.led_green  = LED("P2_22")
-        self.led_white    = LED("P2_24")
-        self.led_blue   = LED("P2_28")
+        # Every output goes through the pipeline: the game sets the desired
+        # state, each render tick writes only what changed (see output_pipeline.py)
+        self.outputs = OutputPipeline(cfg["render_rate"])
+
+        # LEDs (Active High)
+        self.led_red  = self.outputs.led(LED(cfg["led_red"]))
+        self.led_yellow = self.outputs.led(LED(cfg["led_yellow"]))
+        self.led_green  = self.outputs.led(LED(cfg["led_green"]))
+        self.led_white    = self.outputs.led(LED(cfg["led_white"]))
+        self.led_blue   = self.outputs.led(LED(cfg["led_blue"]))
         
         # Servo (Professor's Driver uses 0-100% logic)
         # Start at 0% (Fully Clockwise / Closed)
-        self.servo = Servo("P1_36", default_position=0)
+        self.servo = self.outputs.servo(Servo(cfg["servo"], default_position=0))
         # Stop signal immediately to prevent buzzing
         self.servo.stop() 
         
         # Buzzers (PWM)
-        self.buzzer_hb = Buzzer("P2_1")
-        self.buzzer_alarm = Buzzer("P2_3")
+        self.buzzer_hb = self.outputs.buzzer(Buzzer(cfg["buzzer_hb"]))
+        self.buzzer_alarm = self.outputs.buzzer(Buzzer(cfg["buzzer_alarm"]))
         
-        # Display (I2C)
-        self.display = Display()
+        # Displays (I2C): one bus handle, frames flushed by priority within the bus budget
+        self.displays = DisplayManager(self.outputs, cfg["i2c_bus"])
+        self.display = self.displays.add("score", cfg["display_address"], PRIORITY_SCORE)
+        for name, address in cfg["displays"].items():
+            self.displays.add(name, address, DISPLAY_PRIORITY.get(name, PRIORITY_DECORATION))
+        self.countdown = None
+        if cfg["countdown"]:
+            self.countdown = Countdown(self.displays.get("timer", self.display))
+            self.countdown.start()
+        self.round_end = None     # time.monotonic() the round clock runs out
+        self.outputs.start()
         
         # --- INPUTS ---
         # Buttons (Active Low)
-        self.btn_start = Button("P2_2")
-        self.btn_ems   = Button("P2_4")
-        self.sensor_hall = Button("P2_6") # Hall acts like a button
+        self.btn_start = Button(cfg["btn_start"])
+        self.btn_ems   = Button(cfg["btn_ems"])
+        self.sensor_hall = Button(cfg["sensor_hall"]) # Hall acts like a button
         
         # Time-of-Flight Sensor (I2C)
         try:
-            self.sensor_tof = DistanceSensor()
+            self.sensor_tof = DistanceSensor(TOF_THRESHOLD, TOF_RELEASE,
+                                             bus_id=cfg["i2c_bus"])
         except Exception as e:
             print(f"Warning: ToF Sensor init failed: {e}")
             self.sensor_tof = None # Graceful fallback if sensor fails
 
+        # Input Sampler: every input is read once per tick by one thread,
+        # scenarios and the main loop read its snapshots
+        self.sampler = InputSampler(cfg["sample_rate"])
+        self.sampler.add("start", self.btn_start.is_active)
+        self.sampler.add("ems", self.btn_ems.is_active)
+        self.sampler.add("hall", self.sensor_hall.is_active)
+        if self.sensor_tof is not None:
+            self.sampler.add("tof", self.sensor_tof.poll, every=TOF_EVERY)
+        # Tick lateness is always measured, so normal and real-time mode can be compared
+        self.sampler.monitor = realtime.JitterMonitor("Input sampler", 1.0 / cfg["sample_rate"])
+        self.snap = self.sampler.snapshot() # Reused by the waits in the hot loops
+        self.realtime = cfg["realtime"]
+        if self.realtime:
+            self.sampler.priority = realtime.SAMPLER_PRIORITY
+
+        # Session Store (SQLite, written from a background thread)
+        self.store = None
+        if cfg["db_path"]:
+            try:
+                self.store = Leaderboard(cfg["db_path"])
+            except Exception as e:
+                print(f"Warning: Score store unavailable: {e}")
+        self.player = cfg["player"]
+        self.session = None
+
+        # Live reaction-time statistics per scenario and difficulty level
+        self.stats = ReactionStats()
+
+        # Scenarios are declarative state machines (scenarios.py), compiled once
+        # and run by one event loop on the input sampler
+        self.engine = ScenarioEngine(self.sampler, self, SCENARIOS)
+
+        # Low-power idle state between rounds
+        self.idle = IdleManager(self, cfg["idle_timeout"], cfg["idle_dim"])
+
+        # Difficulty rule set (see game_rules.DEFAULT_RULES)
+        self.rules = dict(DEFAULT_RULES)
         self.score = 0
-        self.current_timeout = BASE_TIMEOUT
+        self.current_timeout = self.rules["base_timeout"]
+
+    def report(self, event, **data):
+        """Sends a game event to the reporter hook (if one is attached)."""
+        if self.reporter is not None:
+            data["event"] = event
+            data["station"] = self.config["name"]
+            data["time"] = time.time()
+            self.reporter(data)
 
     def setup_game(self):
         """Resets hardware to 'Ready' state."""
@@ -112,8 +227,68 @@ class TrachGame:
         
         self.buzzer_hb.off()
         self.buzzer_alarm.off()
-        self.display.clear()
-        self.display.show_text("RDY")
+        if not self.display.effect_running(): # A celebration shows "RDY" when it ends
+            self.display.clear()
+            self.display.show_text("RDY")
+        self.showing_hiscore = False
+        self.state = "ready"
+
+    def request_start(self):
+        """Starts a round as if the start button was pressed (wakes from idle). False if busy."""
+        if self.state not in ("ready", "idle"):
+            return False
+        self.start_requested = True
+        self.sampler.cancel_waits() # Wake main_loop
+        return True
+
+    def abort_round(self):
+        """Ends the current round without a result. False if no round is running."""
+        if self.state != "playing":
+            return False
+        self.aborted = True
+        self.sampler.cancel_waits() # Wake the running scenario
+        return True
+
+    def set_rules(self, **changes):
+        """
+        Changes difficulty rules (game_rules.DEFAULT_RULES keys); base_timeout applies from the next round.
+        Raises ValueError (rules unchanged) for unknown keys or values outside game_rules.RULE_RANGES.
+        """
+        unknown = set(changes) - set(DEFAULT_RULES)
+        if unknown:
+            raise ValueError(f"Unknown rule(s): {', '.join(sorted(unknown))}")
+        rules = dict(self.rules, **{k: float(v) for k, v in changes.items()})
+        game_rules.check_rules(rules)
+        self.rules = rules
+        return self.rules
+
+    def stop(self):
+        """Makes main_loop() return (from another thread); aborts a running round."""
+        self.running = False
+        self.aborted = True
+        self.sampler.cancel_waits()
+
+    def end_session(self, survived):
+        """Reports the result and hands the finished session to the store."""
+        self.report("end", score=self.score, survived=survived)
+        if self.store is not None:
+            self.session.update(ended=time.time(), score=self.score, survived=survived)
+            self.store.record(self.session) # Queued, never blocks
+        self.session = None
+
+    def toggle_hiscore(self):
+        """Alternates the idle display between "RDY" and the high score."""
+        if self.store is None or self.store.high_score() == 0:
+            return
+        self.showing_hiscore = not self.showing_hiscore
+        if self.showing_hiscore:
+            self.display.show_number(self.store.high_score())
+        else:
+            self.display.show_text("RDY")
+
+    def difficulty_level(self):
+        """0 at the base time limit, +1 for every step the time limit has shrunk."""
+        return game_rules.difficulty_level(self.current_timeout, self.rules)
 
     def all_leds_off(self):
         self.led_green.off()
@@ -124,226 +299,220 @@ class TrachGame:
 
     def play_sound_success(self):
         """Happy Chime"""
-        self.buzzer_alarm.tone(1500, 0.1)
-        self.buzzer_alarm.tone(2000, 0.2)
+        self.buzzer_alarm.play(SOUND_SUCCESS)
 
     def play_sound_fail(self):
         """Sad Womp Womp"""
-        self.buzzer_alarm.tone(400, 0.3)
-        self.buzzer_alarm.tone(300, 0.5)
+        self.buzzer_alarm.play(SOUND_FAIL)
 
     def twitch_patient(self):
         """Simulates patient struggling using Servo."""
         # Move to random position between 20% and 60%
         target = random.randint(20, 60)
         self.servo.turn(target)
-        time.sleep(0.15)
+        time.sleep(game_rules.TWITCH_HOLD)
         self.servo.turn(10) # Return to rest
-        time.sleep(0.15)
+        time.sleep(game_rules.TWITCH_HOLD)
         self.servo.stop() # Stop buzzing
 
-    # ---------------------------------------------------------
-    # SCENARIO A: Accidental Decannulation
-    # ---------------------------------------------------------
-    def scenario_decannulation(self):
-        """Task: Remove tube (Hall HIGH) -> Insert tube (Hall LOW)."""
-        print("[A] Decannulation! (Green LED)")
-        self.led_green.on()
-        
-        start_time = time.time()
-        tube_removed = False
-        
-        # Step 1: Detect Removal (Magnet moves AWAY)
-        # Hall Sensor is Active Low (0 = Magnet Present).
-        # We wait for it to go HIGH (1 = Magnet Gone).
-        while (time.time() - start_time) < self.current_timeout:
-            if not self.sensor_hall.is_active(): # is_active is False when magnet gone
-                tube_removed = True
-                print("  -> Trach OUT! Quick, re-insert!")
-                break
-            time.sleep(0.05)
-            
-        if not tube_removed:
-            return False # Failed step 1
-
-        # Step 2: Detect Insertion (Magnet comes BACK)
-        while (time.time() - start_time) < self.current_timeout:
-            if self.sensor_hall.is_active(): # is_active is True when magnet present
-                self.led_green.off()
-                print("  -> Trach IN! Safe.")
-                return True
-            time.sleep(0.05)
-            
-        self.led_green.off()
-        return False
-
-    # ---------------------------------------------------------
-    # SCENARIO B: Tube Obstruction
-    # ---------------------------------------------------------
-    def scenario_obstruction(self):
-        """Task: Suction (ToF < 40mm) for 1.5 seconds."""
-        print("[B] Obstruction! Suction! (Yellow LED)")
-        self.led_yellow.on()
-        
-        if self.sensor_tof is None:
-            return True # Auto-win if sensor broken
-
-        start_time = time.time()
-        suction_start_time = 0
-        is_suctioning = False
-        
-        while (time.time() - start_time) < self.current_timeout:
-            # Check distance
-            blocked = self.sensor_tof.is_blocked(TOF_THRESHOLD)
-
-            if blocked and not is_suctioning:
-                # Started suctioning
-                is_suctioning = True
-                suction_start_time = time.time()
-                print("  -> Suctioning Started...")
-            
-            elif blocked and is_suctioning:
-                # Currently suctioning, check duration
-                duration = time.time() - suction_start_time
-                # Print progress every 0.5 seconds roughly
-                if int(duration * 10) % 5 == 0: 
-                    print(f"  -> Suctioning... {duration:.1f}s")
-
-                if duration > 1.5:
-                    self.led_yellow.off()
-                    print("  -> Airway Cleared!")
-                    return True
-            
-            elif not blocked and is_suctioning:
-                # Pulled out too early, reset timer
-                is_suctioning = False
-                print("  -> Suction interrupted! Try again.")
-            
-            time.sleep(0.05)
-
-        self.led_yellow.off()
-        return False
+    def reset_tof(self):
+        """Restarts the filtered suction detector (scenario B enter action)."""
+        self.sensor_tof.detector.reset()
 
     # ---------------------------------------------------------
-    # SCENARIO C: Call EMS
+    # COUNTDOWN (renderer thread, these calls only set the deadline)
     # ---------------------------------------------------------
-    def scenario_ems(self):
-        """Task: Press EMS Button."""
-        print("[C] Call EMS! (White LED)")
-        self.led_white.on()
-        
-        start_time = time.time()
-        while (time.time() - start_time) < self.current_timeout:
-            if self.btn_ems.is_active():
-                self.led_white.off()
-                print("  -> EMS Called!")
-                return True
-            time.sleep(0.05)
-            
-        self.led_white.off()
-        return False
+    def show_countdown(self, deadline):
+        if self.countdown is not None:
+            self.countdown.count_to(deadline)
+
+    def resume_countdown(self):
+        """After a scenario: a timer display goes back to the round clock."""
+        if self.countdown is None:
+            return
+        if self.countdown.display is self.display:
+            self.countdown.clear() # Score display shows the score again
+        else:
+            self.countdown.count_to(self.round_end)
+
+    def stop_countdown(self):
+        """End of round: stops the countdown and blanks a separate timer display."""
+        if self.countdown is None:
+            return
+        self.countdown.clear()
+        if self.countdown.display is not self.display:
+            self.countdown.display.clear()
 
     # ---------------------------------------------------------
     # MAIN GAME LOOP
     # ---------------------------------------------------------
     def play_game(self):
         print("--- GAME START ---")
+        self.aborted = False
+        self.sampler.clear_cancel()
+        self.state = "playing"
+        self.report("start")
         self.score = 0
-        self.current_timeout = BASE_TIMEOUT
+        self.current_timeout = self.rules["base_timeout"]
+        self.display.cancel_effect()
         self.display.show_number(self.score)
+        self.session = {"station": self.config["name"], "player": self.player,
+                        "started": time.time(), "scenarios": []}
         
-        game_start = time.time()
-        last_heartbeat = 0
-        heartbeat_interval = 1.0
-        
-        # Initial Agitation
-        self.servo.turn(30)
-        time.sleep(0.5)
-        self.servo.stop()
+        self.round_end = time.monotonic() + self.rules["game_duration"]
+        if "timer" in self.displays:
+            self.show_countdown(self.round_end)
 
-        while (time.time() - game_start) < GAME_DURATION:
-            
-            # --- 1. Anxiety Engine (Heartbeat) ---
-            if (time.time() - last_heartbeat) > heartbeat_interval:
-                self.buzzer_hb.heartbeat()
-                last_heartbeat = time.time()
-                # Speed up heartbeat as time runs out
-                elapsed = time.time() - game_start
-                heartbeat_interval = max(0.4, 1.0 - (elapsed / GAME_DURATION))
-
-            # --- 2. Random Twitch ---
-            if random.random() < 0.15: # 15% chance per loop
-                self.twitch_patient()
-
-            # --- 3. Run Random Scenario ---
-            scenario = random.choice(['A', 'B', 'C'])
-            success = False
-
-            if scenario == 'A':
-                success = self.scenario_decannulation()
-            elif scenario == 'B':
-                success = self.scenario_obstruction()
-            elif scenario == 'C':
-                success = self.scenario_ems()
-            
-            # --- 4. Handle Result ---
-            if success:
-                print(">> PASSED!")
-                self.play_sound_success()
-                self.score += 1
-                self.display.show_number(self.score)
-                # Increase difficulty (faster timeout)
-                self.current_timeout = max(MIN_TIMEOUT, self.current_timeout - 0.5)
-            else:
-                print(">> FAILED! GAME OVER.")
-                self.play_sound_fail()
-                self.led_blue.on() # Cyanosis
-                # Patient Coughs (Servo twitch)
-                self.servo.turn(50)
-                time.sleep(0.2)
-                self.servo.turn(20)
-                time.sleep(0.2)
-                self.servo.stop()
-                
-                time.sleep(2) # Pause on failure
-                return # End game
+        # Heartbeat, twitches, scenarios and scoring (shared with simulate.py)
+        _, survived = game_rules.play_round(self.rules, random, self)
 
-            time.sleep(0.5) # Breath between scenarios
+        if survived is None:
+            print(">> ROUND ABORTED.")
+            self.stop_countdown()
+            self.all_leds_off()
+            self.report("abort", score=self.score)
+            self.session = None # Aborted rounds are not scored
+            return
+        if not survived:
+            self.end_session(survived=False)
+            return # End game
 
         # --- Game Win (Time Expired) ---
         print("TIME UP! YOU SURVIVED.")
-        self.display.show_text("DONE")
+        self.stop_countdown()
+        self.end_session(survived=True)
         
-        # Score Celebration
-        for _ in range(3):
-            self.display.clear()
-            time.sleep(0.3)
-            self.display.show_number(self.score)
-            time.sleep(0.3)
+        # Score Celebration: the display chip blinks the score, the game moves on
+        self.display.show_number(self.score)
+        self.display.blink(2, CELEBRATION_TIME, then=lambda: self.display.show_text("RDY"))
+
+    # ---------------------------------------------------------
+    # ROUND ACTIONS (called by game_rules.play_round)
+    # ---------------------------------------------------------
+    def agitate(self):
+        """Initial agitation."""
+        self.servo.turn(30)
+        time.sleep(game_rules.AGITATION_TIME)
+        self.servo.stop()
+
+    def heartbeat(self):
+        self.buzzer_hb.heartbeat()
+
+    def run_scenarios(self, names, timeout):
+        """Runs the scenario(s); None if the round was aborted."""
+        self.current_timeout = timeout
+        # LEDs are lit before the clock starts (flush)
+        results = self.engine.run(names, timeout, ready=self.outputs.flush,
+                                  started=self.show_countdown)
+        self.resume_countdown()
+        return None if self.aborted else results
+
+    def scored(self, results, score, timeout):
+        """Records the reaction times, the session entries and the report events."""
+        level = self.difficulty_level()
+        for scenario, success, reaction in results:
+            if reaction is not None:
+                self.stats.add(scenario, level, reaction)
+            elif not success:
+                self.stats.add_failure(scenario, level)
+            if success:
+                self.score += 1
+            self.session["scenarios"].append({
+                "scenario": scenario, "success": success,
+                "reaction": reaction if reaction is not None else
+                            (0.0 if success else timeout),
+                "timeout": timeout})
+            self.report("scenario", scenario=scenario, success=success,
+                        score=self.score, timeout=timeout,
+                        level=level, reaction=reaction)
+
+    def passed(self, score):
+        print(">> PASSED!")
+        self.play_sound_success()
+        self.display.show_number(score)
+
+    def failed(self, score):
+        print(">> FAILED! GAME OVER.")
+        self.stop_countdown()
+        self.display.scroll("GAME OVER", then=lambda: self.display.show_text("RDY"))
+        self.play_sound_fail()
+        self.led_blue.on() # Cyanosis
+        # Patient Coughs (Servo twitch)
+        self.servo.turn(50)
+        time.sleep(0.2)
+        self.servo.turn(20)
+        time.sleep(0.2)
+        self.servo.stop()
+        time.sleep(2) # Pause on failure
 
     def main_loop(self):
         try:
+            if self.realtime:
+                realtime.enable()
             self.setup_game()
-            print("System Ready. Press START Button (P2_2).")
+            self.sampler.start()
+            print(f"System Ready. Press START Button ({self.config['btn_start']}).")
+            last_swap = time.monotonic()
+            last_activity = last_swap
             
-            while True:
-                if self.btn_start.is_active():
+            while self.running:
+                if self.idle.due(last_activity):
+                    self.idle.run()
+                    last_activity = last_swap = time.monotonic()
+                    continue
+                snap = self.sampler.wait_for("start", 1, last_swap + HISCORE_SWAP, self.snap)
+                if not self.running:
+                    break
+                if snap is not None or self.start_requested:
+                    self.start_requested = False
+                    if self.realtime:
+                        realtime.pause_gc() # No collector pauses during a round
                     self.play_game()
+                    if self.realtime:
+                        realtime.resume_gc()
+                    print(self.sampler.monitor.report())
                     self.setup_game() # Reset for next round
-                time.sleep(0.1)
+                    last_activity = time.monotonic()
+                elif self.sampler.cancelled:
+                    self.sampler.clear_cancel() # Woken by a command, not the timer
+                    continue
+                else:
+                    self.toggle_hiscore()
+                last_swap = time.monotonic()
                 
         except KeyboardInterrupt:
             print("\nShutting down...")
-            self.all_leds_off()
-            self.display.clear()
-            # Only cleanup at the VERY end
-            self.servo.cleanup()
-            self.buzzer_hb.cleanup()
-            self.buzzer_alarm.cleanup()
+        finally:
+            self.shutdown()
+
+    def shutdown(self):
+        """Turns everything off and releases the hardware."""
+        self.sampler.stop()
+        print(self.sampler.monitor.report())
+        print(self.idle.report())
+        self.stats.print_summary()
+        self.all_leds_off()
+        if self.countdown is not None:
+            self.countdown.stop()
+        self.displays.clear()
+        self.outputs.stop() # Writes the final state
+        print(self.outputs.report())
+        print(self.displays.report())
+        # Only cleanup at the VERY end
+        self.servo.cleanup()
+        self.buzzer_hb.cleanup()
+        self.buzzer_alarm.cleanup()
+        if self.store is not None:
+            self.store.close() # Write out queued sessions
 
 if __name__ == "__main__":
     # Run configuration script first to be safe
     os.system("./configure_pins.sh")
     
-    game = TrachGame()
+    parser = argparse.ArgumentParser(description="Trach-Hero training game")
+    parser.add_argument("--realtime", action="store_true",
+                        help="SCHED_FIFO priorities, locked memory, GC only between rounds")
+    args = parser.parse_args()
+
+    game = TrachGame({"realtime": args.realtime})
     game.main_loop()
\ No newline at end of file
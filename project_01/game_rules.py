@@ -0,0 +1,193 @@
+"""
+--------------------------------------------------------------------------
+Trach-Hero Game
+--------------------------------------------------------------------------
+License:   
+Copyright 2025 - Meghan Paral
+
+Redistribution and use in source and binary forms, with or without 
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this 
+list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice, 
+this list of conditions and the following disclaimer in the documentation 
+and/or other materials provided with the distribution.
+
+3. Neither the name of the copyright holder nor the names of its contributors 
+may be used to endorse or promote products derived from this software without 
+specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" 
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE 
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE 
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE 
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL 
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR 
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER 
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, 
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE 
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+--------------------------------------------------------------------------
+
+File: game_rules.py
+Author: Meghan Paral
+Date:  10/19/2026
+Description: Hardware-free Trach-Hero game rules: difficulty parameters, timing of the
+             blocking round actions and the pure rule functions. Shared by game.py and
+             the Monte Carlo simulator (simulate.py).
+"""
+
+import os
+import sys
+import time
+
+# melody.py is hardware-free; the tunes' lengths time the round actions below
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "drivers_new"))
+import melody
+
+# --- DIFFICULTY PARAMETERS ---
+GAME_DURATION = 30        # Total game time in seconds
+BASE_TIMEOUT = 10.0       # Starting time limit for scenarios (Easier)
+MIN_TIMEOUT = 2.0         # Minimum time limit (fastest speed)
+TIMEOUT_STEP = 0.5        # Time limit shrinks by this much per success
+TWITCH_CHANCE = 0.15      # Chance of a patient twitch before each scenario
+SUCTION_TIME = 1.5        # Seconds suction must be held to clear the airway
+DOUBLE_CHANCE = 0.0       # Chance that two emergencies start at the same time
+SCENARIOS = ("A", "B", "C")
+
+# --- SOUNDS (RTTTL or "freq:ms" note strings, see drivers_new/melody.py) ---
+SOUND_SUCCESS = "1500:100,2000:200"   # Happy chime
+SOUND_FAIL = "400:300,300:500"        # Sad womp womp
+
+# --- DURATION OF BLOCKING ROUND ACTIONS (seconds; the game sleeps / plays these) ---
+AGITATION_TIME = 0.5      # Initial servo agitation
+TWITCH_HOLD = 0.15        # Servo twitch, then the same again to return
+BREATH_TIME = 0.5         # Pause between scenarios
+TWITCH_TIME = 2 * TWITCH_HOLD
+HEARTBEAT_TIME = melody.duration(melody.compile_melody(melody.HEARTBEAT_MELODY))
+SUCCESS_TIME = melody.duration(melody.compile_melody(SOUND_SUCCESS))
+
+# A rule set; the game and the simulator take a dict like this
+DEFAULT_RULES = {
+    "game_duration": GAME_DURATION,
+    "base_timeout": BASE_TIMEOUT,
+    "min_timeout": MIN_TIMEOUT,
+    "timeout_step": TIMEOUT_STEP,
+    "twitch_chance": TWITCH_CHANCE,
+    "double_chance": DOUBLE_CHANCE,
+}
+
+# Allowed values of each rule: (low, high]; the chances may also be exactly 0
+RULE_RANGES = {
+    "game_duration": (0.0, 3600.0),
+    "base_timeout": (0.0, 600.0),
+    "min_timeout": (0.0, 600.0),
+    "timeout_step": (0.0, 600.0),
+    "twitch_chance": (0.0, 1.0),
+    "double_chance": (0.0, 1.0),
+}
+CHANCE_RULES = ("twitch_chance", "double_chance")
+
+
+def check_rules(rules):
+    """Raises ValueError unless every rule is in its range (no nan / inf) and min_timeout <= base_timeout."""
+    for key, value in rules.items():
+        low, high = RULE_RANGES[key]
+        inside = (low <= value <= high) if key in CHANCE_RULES else (low < value <= high)
+        if not inside:
+            raise ValueError(f"{key} must be in {'[' if key in CHANCE_RULES else '('}{low:g}, {high:g}], "
+                             f"got {value}")
+    if rules["min_timeout"] > rules["base_timeout"]:
+        raise ValueError(f"min_timeout ({rules['min_timeout']}) is above "
+                         f"base_timeout ({rules['base_timeout']})")
+
+
+def next_timeout(timeout, rules=DEFAULT_RULES):
+    """Time limit after a success (faster, down to min_timeout)."""
+    return max(rules["min_timeout"], timeout - rules["timeout_step"])
+
+
+def difficulty_level(timeout, rules=DEFAULT_RULES):
+    """0 at base_timeout, +1 for every timeout_step the time limit has shrunk."""
+    return round((rules["base_timeout"] - timeout) / rules["timeout_step"])
+
+
+def heartbeat_interval(elapsed, rules=DEFAULT_RULES):
+    """Heartbeat speeds up as time runs out."""
+    return max(0.4, 1.0 - (elapsed / rules["game_duration"]))
+
+
+def should_twitch(rng, rules=DEFAULT_RULES):
+    return rng.random() < rules["twitch_chance"]
+
+
+def choose_scenario(rng):
+    return rng.choice(SCENARIOS)
+
+
+def score_results(results):
+    """
+    Scores one round step from [(scenario, success, reaction)]: returns (points, passed).
+    Every scenario that succeeded scores, even next to a failed one; the game goes on
+    only if all of them succeeded.
+    """
+    points = sum(1 for _, success, _ in results if success)
+    return points, points == len(results)
+
+
+def choose_scenarios(rng, rules=DEFAULT_RULES):
+    """One scenario, or two different ones at once (double_chance); they share the time limit."""
+    if rng.random() < rules.get("double_chance", 0.0):
+        return rng.sample(SCENARIOS, 2)
+    return [choose_scenario(rng)]
+
+
+class SystemClock:
+    """Real time (the game); the simulator passes a virtual clock with the same methods."""
+    now = staticmethod(time.monotonic)
+    sleep = staticmethod(time.sleep)
+
+
+def play_round(rules, rng, actions, clock=SystemClock):
+    """
+    The round flow, run by the game (TrachGame.play_game) and by the simulator.
+    actions is the game, or the simulator's stand-in on a virtual clock:
+        agitate(), heartbeat(), twitch_patient()  blocking round actions
+        run_scenarios(names, timeout)             -> [(name, success, reaction)], None if aborted
+        scored(results, score, timeout)           after every step (score includes it)
+        passed(score) / failed(score)             the step's outcome
+    Returns (score, survived); survived is None if the round was aborted.
+    """
+    start = clock.now()
+    score = 0
+    timeout = rules["base_timeout"]
+    last_heartbeat = None
+    interval = 1.0
+
+    actions.agitate()
+    while clock.now() - start < rules["game_duration"]:
+        # Anxiety engine: the heartbeat speeds up as time runs out
+        if last_heartbeat is None or clock.now() - last_heartbeat > interval:
+            actions.heartbeat()
+            last_heartbeat = clock.now()
+            interval = heartbeat_interval(last_heartbeat - start, rules)
+
+        if should_twitch(rng, rules):
+            actions.twitch_patient()
+
+        results = actions.run_scenarios(choose_scenarios(rng, rules), timeout)
+        if results is None:
+            return score, None
+        points, passed = score_results(results)
+        score += points
+        actions.scored(results, score, timeout)
+        if not passed:
+            actions.failed(score)
+            return score, False
+        actions.passed(score)
+        timeout = next_timeout(timeout, rules)
+        clock.sleep(BREATH_TIME)
+
+    return score, True
@@ -0,0 +1,136 @@
+"""
+--------------------------------------------------------------------------
+Trach-Hero Game
+--------------------------------------------------------------------------
+License:   
+Copyright 2025 - Meghan Paral
+
+Redistribution and use in source and binary forms, with or without 
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this 
+list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice, 
+this list of conditions and the following disclaimer in the documentation 
+and/or other materials provided with the distribution.
+
+3. Neither the name of the copyright holder nor the names of its contributors 
+may be used to endorse or promote products derived from this software without 
+specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" 
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE 
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE 
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE 
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL 
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR 
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER 
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, 
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE 
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+--------------------------------------------------------------------------
+
+File: idle_manager.py
+Author: Meghan Paral
+Date:  10/19/2026
+Description: Low-power idle state between rounds. After a period without play the
+             display is dimmed or put in standby, the LEDs, buzzers and servo pulses are
+             switched off, the input sampler is paused, and the game blocks on a start
+             button edge instead of polling. Wake-up latency (press -> "ready") is
+             measured against a target and reported.
+"""
+
+import time
+
+from reaction_stats import RunningStats
+
+# --- IDLE CONFIGURATION ---
+IDLE_TIMEOUT = 120.0      # Seconds without play before going idle (0 = never)
+WAKE_TARGET = 0.25        # Press -> "ready" latency target in seconds
+COMMAND_CHECK = 0.5       # Seconds between checks for START / stop while idle
+RELEASE_WAIT = 5.0        # Max seconds to wait for the wake press to be released
+
+
+class IdleManager:
+    def __init__(self, game, timeout=IDLE_TIMEOUT, dim=False, target=WAKE_TARGET):
+        """
+        game: the TrachGame to put to sleep.
+        dim: dim the display instead of stopping its oscillator.
+        """
+        self.game = game
+        self.timeout = timeout
+        self.dim = dim
+        self.target = target
+        self.latency = RunningStats()     # Wake-up latencies (seconds)
+        self.missed = 0                   # Wake-ups slower than the target
+
+    def due(self, last_activity):
+        return self.timeout > 0 and (time.monotonic() - last_activity) > self.timeout
+
+    def sleep(self):
+        """Turns the outputs off and pauses input sampling."""
+        g = self.game
+        g.state = "idle"
+        g.sampler.stop()
+        g.all_leds_off()
+        g.buzzer_hb.off()
+        g.buzzer_alarm.off()
+        g.servo.release()
+        g.displays.sleep(self.dim)
+        print("Idle (press START to wake).")
+
+    def wait_for_wake(self):
+        """
+        Blocks on the start button edge. Returns the wake timestamp (time.monotonic()
+        clock, see Button.wait_for_press; the kernel edge timestamp on the cdev GPIO backend).
+        """
+        g = self.game
+        while True:
+            stamp = g.btn_start.wait_for_press(COMMAND_CHECK)
+            if stamp is not None:
+                return stamp
+            if g.start_requested or not g.running:
+                return time.monotonic()
+
+    def wake(self, stamp):
+        """Back to "ready"; records how long it took since stamp."""
+        g = self.game
+        # Only what "ready" needs; the servo is repositioned when the round starts
+        g.displays.wake()
+        g.display.show_text("RDY")
+        g.showing_hiscore = False
+        if not g.start_requested:
+            # A START command keeps the waits cancelled so main_loop starts the round at once
+            g.sampler.clear_cancel()
+        g.sampler.start()
+        g.state = "ready"
+        latency = time.monotonic() - stamp
+        self.latency.add(latency)
+        if latency > self.target:
+            self.missed += 1
+        print(f"Awake in {latency * 1000:.0f} ms (target {self.target * 1000:.0f} ms)")
+        return latency
+
+    def run(self):
+        """One idle period: sleep, wait for the start button (or a command), wake."""
+        self.sleep()
+        latency = self.wake(self.wait_for_wake())
+        # The wake press must not also start a round
+        g = self.game
+        g.sampler.wait_for("start", 0, time.monotonic() + RELEASE_WAIT, g.snap)
+        return latency
+
+    def summary(self):
+        return {"wakeups": self.latency.count,
+                "mean_ms": self.latency.mean * 1000,
+                "max_ms": self.latency.max * 1000 if self.latency.count else None,
+                "target_ms": self.target * 1000, "missed": self.missed}
+
+    def report(self):
+        s = self.summary()
+        if s["wakeups"] == 0:
+            return "Idle: no wake-ups"
+        return (f"Idle: {s['wakeups']} wake-ups, mean {s['mean_ms']:.0f} ms, "
+                f"worst {s['max_ms']:.0f} ms, {s['missed']} over the "
+                f"{s['target_ms']:.0f} ms target")
@@ -0,0 +1,212 @@
+"""
+--------------------------------------------------------------------------
+Trach-Hero Game
+--------------------------------------------------------------------------
+License:   
+Copyright 2025 - Meghan Paral
+
+Redistribution and use in source and binary forms, with or without 
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this 
+list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice, 
+this list of conditions and the following disclaimer in the documentation 
+and/or other materials provided with the distribution.
+
+3. Neither the name of the copyright holder nor the names of its contributors 
+may be used to endorse or promote products derived from this software without 
+specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" 
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE 
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE 
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE 
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL 
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR 
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER 
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, 
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE 
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+--------------------------------------------------------------------------
+
+File: input_sampler.py
+Author: Meghan Paral
+Date:  10/19/2026
+Description: One background thread reads every game input at a fixed rate into a shared,
+             array-backed snapshot (sequence number + timestamp). Game logic reads the latest
+             snapshot or waits for a change, so each input is read once per tick no matter
+             how many consumers look at it.
+"""
+
+import threading
+import time
+from array import array
+
+import realtime
+
+# --- SAMPLER CONFIGURATION ---
+SAMPLE_RATE = 100         # Ticks per second
+
+
+class Snapshot:
+    """Input values of one tick (read-only copy)."""
+    __slots__ = ("seq", "timestamp", "values", "index")
+
+    def __init__(self, seq, timestamp, values, index):
+        self.seq = seq                # Tick number
+        self.timestamp = timestamp    # time.monotonic() of the tick
+        self.values = values          # array('l') in source order
+        self.index = index            # name -> position
+
+    def __getitem__(self, name):
+        return self.values[self.index[name]]
+
+
+class InputSampler:
+    def __init__(self, rate=SAMPLE_RATE):
+        self.period = 1.0 / rate
+        self.names = []
+        self.readers = []
+        self.every = []               # Read source only every N ticks (slow sensors)
+        self.index = {}
+        self.values = array("l")
+
+        self.seq = 0
+        self.change_seq = 0           # Last tick where any value changed
+        self.timestamp = 0.0
+        self.overruns = 0             # Ticks that started late
+        self.priority = None          # SCHED_FIFO priority of the thread (real-time mode)
+        self.monitor = None           # Optional realtime.JitterMonitor of the tick loop
+        self.cancelled = False        # Set by cancel_waits(): waits return at once
+        self.cond = threading.Condition()
+        self.thread = None
+        self.running = False
+
+    def add(self, name, read, every=1):
+        """Adds an input; read() returns a bool or int. Call before start()."""
+        self.index[name] = len(self.names)
+        self.names.append(name)
+        self.readers.append(read)
+        self.every.append(every)
+        self.values.append(int(read()))
+
+    def start(self):
+        if self.thread is None:
+            self.running = True
+            self.thread = threading.Thread(target=self._run, daemon=True)
+            self.thread.start()
+
+    def stop(self):
+        self.running = False
+        if self.thread is not None:
+            self.thread.join(1.0)
+            self.thread = None
+
+    def _run(self):
+        if self.priority is not None:
+            realtime.set_fifo(self.priority)
+        deadline = time.monotonic()
+        tick = 0
+        values = array("l", self.values)
+        while self.running:
+            tick += 1
+            for i, read in enumerate(self.readers):
+                if tick % self.every[i] == 0:
+                    try:
+                        values[i] = int(read())
+                    except Exception as e:
+                        print(f"Warning: input {self.names[i]} read failed: {e}")
+
+            with self.cond:
+                self.seq += 1
+                self.timestamp = time.monotonic()
+                if values != self.values:
+                    self.values[:] = values
+                    self.change_seq = self.seq
+                self.cond.notify_all()
+
+            deadline += self.period
+            delay = deadline - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+                if self.monitor is not None:
+                    self.monitor.record(time.monotonic() - deadline)
+            else:
+                self.overruns += 1
+                if self.monitor is not None:
+                    self.monitor.record(-delay)
+                deadline = time.monotonic() # Don't try to catch up
+
+    def _snapshot(self, into):
+        """Copies the current tick (into a preallocated Snapshot if given)."""
+        if into is None:
+            return Snapshot(self.seq, self.timestamp, array("l", self.values), self.index)
+        into.seq = self.seq
+        into.timestamp = self.timestamp
+        into.values[:] = self.values
+        return into
+
+    def snapshot(self, into=None):
+        """The latest tick."""
+        with self.cond:
+            return self._snapshot(into)
+
+    def value(self, name):
+        return self.values[self.index[name]]
+
+    def cancel_waits(self):
+        """Wakes every waiter (aborts, commands); waits stay cancelled until clear_cancel()."""
+        with self.cond:
+            self.cancelled = True
+            self.cond.notify_all()
+
+    def clear_cancel(self):
+        with self.cond:
+            self.cancelled = False
+
+    def wait_for_tick(self, seq, timeout=None, into=None):
+        """Waits for a tick newer than seq. Returns the latest snapshot (stale on timeout)."""
+        with self.cond:
+            self.cond.wait_for(lambda: self.seq > seq or self.cancelled, timeout)
+            return self._snapshot(into)
+
+    def wait_for_change(self, seq, timeout=None, into=None):
+        """
+        Waits until some input changes after tick seq.
+        Returns the new snapshot, or None on timeout / cancel.
+        """
+        with self.cond:
+            self.cond.wait_for(lambda: self.change_seq > seq or self.cancelled, timeout)
+            if self.cancelled or self.change_seq <= seq:
+                return None
+            return self._snapshot(into)
+
+    def wait_for(self, name, value, deadline, into=None):
+        """
+        Waits until input name equals value, or until deadline (time.monotonic()).
+        Returns the snapshot it happened in, or None on timeout / cancel.
+        """
+        snap = self.snapshot(into)
+        while snap[name] != value:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or self.cancelled:
+                return None
+            snap = self.wait_for_change(snap.seq, remaining, snap)
+            if snap is None:
+                return None
+        return snap
+
+# --- TEST CODE ---
+if __name__ == "__main__":
+    import random
+    sampler = InputSampler()
+    sampler.add("coin", lambda: random.random() < 0.02)
+    sampler.add("slow", lambda: int(time.monotonic()) % 2, every=10)
+    sampler.start()
+    snap = sampler.wait_for("coin", 1, time.monotonic() + 5)
+    print(f"coin up at tick {snap.seq} ({snap.timestamp:.3f})" if snap else "timeout")
+    time.sleep(1)
+    print(f"{sampler.seq} ticks, {sampler.overruns} overruns")
+    sampler.stop()
@@ -0,0 +1,240 @@
+"""
+--------------------------------------------------------------------------
+Trach-Hero Game
+--------------------------------------------------------------------------
+License:   
+Copyright 2025 - Meghan Paral
+
+Redistribution and use in source and binary forms, with or without 
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this 
+list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice, 
+this list of conditions and the following disclaimer in the documentation 
+and/or other materials provided with the distribution.
+
+3. Neither the name of the copyright holder nor the names of its contributors 
+may be used to endorse or promote products derived from this software without 
+specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" 
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE 
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE 
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE 
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL 
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR 
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER 
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, 
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE 
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+--------------------------------------------------------------------------
+
+File: leaderboard.py
+Author: Meghan Paral
+Date:  10/19/2026
+Description: Persistent leaderboard / session store for Trach-Hero. Every game session, its
+             scenarios and their reaction times go into an SQLite database (WAL mode).
+             Writes are queued and committed in batches by a background thread so the
+             game loop never waits on the disk.
+"""
+
+import datetime
+import queue
+import sqlite3
+import threading
+import time
+
+# --- STORE CONFIGURATION ---
+BATCH_SIZE = 64           # Max sessions committed in one transaction
+FLUSH_INTERVAL = 0.5      # Seconds the writer waits to fill a batch
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id       INTEGER PRIMARY KEY,
+    station  TEXT NOT NULL,
+    player   TEXT NOT NULL,
+    day      TEXT NOT NULL,
+    started  REAL NOT NULL,
+    ended    REAL NOT NULL,
+    score    INTEGER NOT NULL,
+    survived INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS scenarios (
+    session_id INTEGER NOT NULL REFERENCES sessions(id),
+    seq        INTEGER NOT NULL,
+    scenario   TEXT NOT NULL,
+    success    INTEGER NOT NULL,
+    reaction   REAL NOT NULL,
+    timeout    REAL NOT NULL,
+    PRIMARY KEY (session_id, seq)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_sessions_score  ON sessions(score DESC, ended);
+CREATE INDEX IF NOT EXISTS idx_sessions_player ON sessions(player, score DESC);
+CREATE INDEX IF NOT EXISTS idx_sessions_day    ON sessions(day, score DESC);
+"""
+
+SESSION_COLUMNS = "id, station, player, day, started, ended, score, survived"
+
+
+class Leaderboard:
+    def __init__(self, path):
+        """
+        Opens (or creates) the store at 'path' and starts the writer thread.
+        """
+        self.path = path
+        self.queue = queue.Queue()
+        self.local = threading.local()
+
+        conn = self._connect()
+        conn.executescript(SCHEMA)
+        row = conn.execute("SELECT MAX(score) FROM sessions").fetchone()
+        self.best = row[0] or 0    # Cached so the game can show it without a query
+
+        self.writer = threading.Thread(target=self._write_loop, daemon=True)
+        self.writer.start()
+
+    def _connect(self):
+        """Returns this thread's connection (sqlite3 connections are per-thread)."""
+        conn = getattr(self.local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self.local.conn = conn
+        return conn
+
+    # ------------------------------------------------------------------
+    # Writing (game thread only enqueues)
+    # ------------------------------------------------------------------
+    def record(self, session):
+        """
+        Queues one finished session. 'session' is a dict with station, player,
+        started, ended, score, survived and a list of scenario dicts
+        (scenario, success, reaction, timeout). Never blocks.
+        """
+        self.best = max(self.best, session["score"])
+        self.queue.put(session)
+
+    def high_score(self):
+        """Best score ever recorded (cached, no database access)."""
+        return self.best
+
+    def flush(self):
+        """Blocks until everything queued so far is on disk."""
+        self.queue.join()
+
+    def close(self):
+        """Writes out the remaining sessions and stops the writer thread."""
+        self.queue.put(None)
+        self.writer.join()
+
+    def _write_loop(self):
+        conn = self._connect()
+        running = True
+        while running:
+            batch = [self.queue.get()]
+            deadline = time.monotonic() + FLUSH_INTERVAL
+            while len(batch) < BATCH_SIZE and batch[-1] is not None:
+                try:
+                    batch.append(self.queue.get(timeout=max(0, deadline - time.monotonic())))
+                except queue.Empty:
+                    break
+
+            if batch[-1] is None:
+                running = False
+            sessions = [s for s in batch if s is not None]
+            try:
+                with conn:
+                    for session in sessions:
+                        self._insert(conn, session)
+            except sqlite3.Error as e:
+                print(f"[Leaderboard] Failed to store {len(sessions)} session(s): {e}")
+            for _ in batch:
+                self.queue.task_done()
+        conn.close()
+
+    def _insert(self, conn, session):
+        day = datetime.date.fromtimestamp(session["started"]).isoformat()
+        cursor = conn.execute(
+            "INSERT INTO sessions (station, player, day, started, ended, score, survived) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (session["station"], session["player"], day, session["started"],
+             session["ended"], session["score"], int(session["survived"])))
+        conn.executemany(
+            "INSERT INTO scenarios (session_id, seq, scenario, success, reaction, timeout) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [(cursor.lastrowid, i, s["scenario"], int(s["success"]), s["reaction"], s["timeout"])
+             for i, s in enumerate(session["scenarios"])])
+
+    # ------------------------------------------------------------------
+    # Queries (any thread; each uses an index)
+    # ------------------------------------------------------------------
+    def _sessions(self, where, args, n):
+        conn = self._connect()
+        rows = conn.execute(
+            f"SELECT {SESSION_COLUMNS} FROM sessions {where} ORDER BY score DESC LIMIT ?",
+            (*args, n)).fetchall()
+        keys = SESSION_COLUMNS.split(", ")
+        return [dict(zip(keys, row)) for row in rows]
+
+    def top(self, n=10):
+        """Best 'n' sessions overall."""
+        return self._sessions("", (), n)
+
+    def player_top(self, player, n=10):
+        """Best 'n' sessions of one player."""
+        return self._sessions("WHERE player = ?", (player,), n)
+
+    def day_top(self, day=None, n=10):
+        """Best 'n' sessions of a day ('YYYY-MM-DD', default today)."""
+        if day is None:
+            day = datetime.date.today().isoformat()
+        return self._sessions("WHERE day = ?", (day,), n)
+
+    def scenarios(self, session_id):
+        """Scenario results (with reaction times) of one session."""
+        conn = self._connect()
+        rows = conn.execute(
+            "SELECT seq, scenario, success, reaction, timeout FROM scenarios "
+            "WHERE session_id = ? ORDER BY seq", (session_id,)).fetchall()
+        return [dict(zip(("seq", "scenario", "success", "reaction", "timeout"), row))
+                for row in rows]
+
+# --- TEST CODE ---
+if __name__ == "__main__":
+    import os
+    import random
+    import tempfile
+
+    print("--- Testing Leaderboard ---")
+    path = os.path.join(tempfile.mkdtemp(), "test_scores.db")
+    board = Leaderboard(path)
+
+    N = 200000
+    print(f"Queueing {N} synthetic sessions...")
+    start = time.time()
+    now = time.time()
+    for i in range(N):
+        started = now - random.uniform(0, 30 * 86400)
+        board.record({
+            "station": "station-1", "player": f"player{random.randint(1, 500)}",
+            "started": started, "ended": started + 30, "score": random.randint(0, 40),
+            "survived": random.random() < 0.2,
+            "scenarios": [{"scenario": "A", "success": True, "reaction": 1.2, "timeout": 10.0}],
+        })
+    print(f"  Queued in {time.time() - start:.2f}s (game thread cost)")
+    board.flush()
+    print(f"  On disk after {time.time() - start:.2f}s")
+
+    for name, query in [("top 10", lambda: board.top(10)),
+                        ("player top", lambda: board.player_top("player42", 10)),
+                        ("day top", lambda: board.day_top(None, 10))]:
+        start = time.perf_counter()
+        rows = query()
+        print(f"  {name:<10} {len(rows):3d} rows in {(time.perf_counter() - start) * 1000:.2f} ms")
+
+    print(f"High score (cached): {board.high_score()}")
+    board.close()
+    print("Test Complete.")
@@ -0,0 +1,384 @@
+"""
+--------------------------------------------------------------------------
+Trach-Hero Game
+--------------------------------------------------------------------------
+License:   
+Copyright 2025 - Meghan Paral
+
+Redistribution and use in source and binary forms, with or without 
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this 
+list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice, 
+this list of conditions and the following disclaimer in the documentation 
+and/or other materials provided with the distribution.
+
+3. Neither the name of the copyright holder nor the names of its contributors 
+may be used to endorse or promote products derived from this software without 
+specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" 
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE 
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE 
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE 
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL 
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR 
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER 
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, 
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE 
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+--------------------------------------------------------------------------
+
+File: output_pipeline.py
+Author: Meghan Paral
+Date:  10/19/2026
+Description: Coalescing output pipeline. Game logic writes the desired state of the LEDs,
+             displays, servo and buzzers through drop-in proxies; a render tick collapses
+             everything requested since the last tick into the minimal set of hardware
+             writes (one per GPIO bank for the LEDs, one per display on each I2C bus, one
+             per PWM output) and counts the writes it avoided. Display frames go through
+             a per-bus scheduler with a frame budget (see display_manager.py).
+"""
+
+import threading
+import time
+
+import gpio_backend
+from gpio_backend import GPIO
+from display_manager import BusScheduler, FRAME_BUDGET, PRIORITY_SCORE
+
+# --- PIPELINE CONFIGURATION ---
+RENDER_RATE = 50          # Render ticks per second (max latency of an output change)
+
+
+class OutputProxy:
+    """
+    Base for the drop-in proxies: unknown attributes go to the real driver, its
+    methods (effects, settings) under the device lock so they never overlap a
+    render write. Effect then-callbacks must only use the queued methods.
+    """
+
+    def __init__(self, pipeline, device):
+        self.pipeline = pipeline
+        self.device = device
+        self.lock = threading.Lock()        # desired / applied state (held briefly)
+        self.device_lock = threading.Lock() # Driver calls; never taken inside self.lock
+        self.desired = None
+        self.applied = None
+        self.requests = 0
+
+    def __getattr__(self, name):
+        attr = getattr(self.device, name)
+        if not callable(attr):
+            return attr
+
+        def locked(*args, **kwargs):
+            with self.device_lock:
+                return attr(*args, **kwargs)
+        return locked
+
+    def pending(self):
+        return self.desired != self.applied
+
+    def _want(self, state):
+        with self.lock:
+            self.desired = state
+            self.requests += 1
+        self.pipeline.mark_dirty()
+
+    def apply(self):
+        """Writes the desired state if it changed. Returns the number of hardware writes."""
+        if not self.device_lock.acquire(blocking=False):
+            # A timed direct call (melody) owns the device; retry next tick
+            self.pipeline.mark_dirty()
+            return 0
+        try:
+            with self.lock:
+                if self.desired == self.applied:
+                    return 0
+                state = self.desired
+            # The state lock is not held here: the driver may wait for one of its own
+            # threads (an ending marquee) whose callback requests the next state
+            done = self._write(state)
+            with self.lock:
+                if self.desired == state:
+                    self.desired = done
+                self.applied = done
+            return 1
+        finally:
+            self.device_lock.release()
+
+    def _write(self, state):
+        """Writes state to the driver; returns the state the output is in afterwards."""
+        getattr(self.device, state[0])(*state[1:])
+        return state
+
+    def _direct(self, method, *args):
+        """Runs a blocking / timed driver call now; it ends with the output off."""
+        with self.device_lock:
+            with self.lock:
+                self.requests += 1
+            self.pipeline.writes += 1
+            result = getattr(self.device, method)(*args)
+            with self.lock:
+                self.desired = self.applied = ("off",)
+            return result
+
+
+class PipelinedServo(OutputProxy):
+    def __init__(self, pipeline, servo):
+        super().__init__(pipeline, servo)
+        self.desired = self.applied = ("turn", servo.position)
+
+    def turn(self, position):
+        self._want(("turn", position))
+
+    def stop(self):
+        self._want(("stop",))
+
+    def release(self):
+        self._want(("release",))
+
+    def get_position(self):
+        state = self.desired
+        return state[1] if state[0] == "turn" else self.device.position
+
+
+class PipelinedBuzzer(OutputProxy):
+    def __init__(self, pipeline, buzzer):
+        super().__init__(pipeline, buzzer)
+        self.desired = self.applied = ("off",)
+
+    def tone(self, frequency, duration=None):
+        if duration:
+            self._direct("tone", frequency, duration)
+        else:
+            self._want(("tone", frequency))
+
+    def off(self):
+        self._want(("off",))
+
+    def play(self, tune):
+        self._direct("play", tune)
+
+    def heartbeat(self):
+        self._direct("heartbeat")
+
+    def alarm(self):
+        self._direct("alarm")
+
+
+class PipelinedDisplay(OutputProxy):
+    """Content writes are coalesced; effects (blink, fade, sleep...) pass straight through."""
+
+    def __init__(self, pipeline, display, bus):
+        super().__init__(pipeline, display)
+        self.bus = bus
+        self.desired = self.applied = ("clear",)
+        self.colon_desired = self.colon_applied = False
+
+    def show_number(self, number):
+        self._want(("show_number", number))
+
+    def show_text(self, text, colon=False):
+        self._want(("show_text", str(text), bool(colon)))
+
+    def clear(self):
+        self._want(("clear",))
+
+    def scroll(self, text, *args, **kwargs):
+        self._want(("scroll", str(text), args, tuple(kwargs.items())))
+
+    def pending(self):
+        return self.desired != self.applied or self.colon_desired != self.colon_applied
+
+    def colon(self, state):
+        with self.lock:
+            self.colon_desired = bool(state)
+            self.requests += 1
+        self.pipeline.mark_dirty()
+
+    def apply(self):
+        writes = super().apply()
+        with self.device_lock:
+            with self.lock:
+                colon = self.colon_desired
+                if colon == self.colon_applied:
+                    return writes
+            self.device.colon(colon)
+            with self.lock:
+                self.colon_applied = colon
+        return writes + 1
+
+    def _write(self, state):
+        if state[0] == "scroll":
+            self.device.scroll(state[1], *state[2], **dict(state[3]))
+            # A marquee ends on its own; never skip the next content write
+            done = ("scrolled", state[1])
+        else:
+            getattr(self.device, state[0])(*state[1:])
+            done = state
+        with self.lock:
+            if state[0] == "show_text":
+                # The colon is part of the text frame
+                self.colon_applied = self.colon_desired = state[2]
+            elif state[0] != "show_number":
+                self.colon_applied = False # Clear / marquee frames turn the colon off
+        return done
+
+
+class PipelinedLED:
+    def __init__(self, pipeline, led):
+        self.pipeline = pipeline
+        self.device = led
+        self.pin = led.pin
+
+    def __getattr__(self, name):
+        return getattr(self.device, name)
+
+    def on(self):
+        self.pipeline.set_led(self.pin, 1)
+
+    def off(self):
+        self.pipeline.set_led(self.pin, 0)
+
+    def toggle(self):
+        self.pipeline.set_led(self.pin, 1 - self.pipeline.led_state(self.pin))
+
+    def is_on(self):
+        return bool(self.pipeline.led_state(self.pin))
+
+
+class OutputPipeline:
+    def __init__(self, rate=RENDER_RATE):
+        self.period = 1.0 / rate
+        self.lock = threading.Lock()        # LED state
+        self.render_lock = threading.Lock()
+        self.dirty = threading.Event()
+        self.banks = {}                     # GPIO bank -> [pins]
+        self.led_desired = {}               # pin -> 0/1
+        self.led_applied = {}
+        self.led_requests = 0
+        self.schedulers = {}                # I2C bus -> BusScheduler of its displays
+        self.pwm = []                       # PipelinedServo / PipelinedBuzzer
+        self.writes = 0                     # Hardware writes performed
+        self.ticks = 0
+        self.thread = None
+        self.running = False
+
+    # --- Registration ---
+    def led(self, led):
+        """Wraps an LED; LEDs of one GPIO bank are written together (cdev backend)."""
+        bank = gpio_backend.bank_of(led.pin)
+        self.banks.setdefault(bank, []).append(led.pin)
+        self.led_desired[led.pin] = self.led_applied[led.pin] = 0
+        if hasattr(GPIO, "setup_group"):
+            # One line handle per bank, so a bank is one ioctl (cdev backend)
+            GPIO.setup_group(self.banks[bank], GPIO.OUT)
+        return PipelinedLED(self, led)
+
+    def servo(self, servo):
+        proxy = PipelinedServo(self, servo)
+        self.pwm.append(proxy)
+        return proxy
+
+    def buzzer(self, buzzer):
+        proxy = PipelinedBuzzer(self, buzzer)
+        self.pwm.append(proxy)
+        return proxy
+
+    def bus_scheduler(self, bus, budget=FRAME_BUDGET):
+        """The frame scheduler of an I2C bus (created with budget on first use)."""
+        if bus not in self.schedulers:
+            self.schedulers[bus] = BusScheduler(bus, budget)
+        return self.schedulers[bus]
+
+    def display(self, display, bus, priority=PRIORITY_SCORE):
+        """Wraps a display; displays of one bus share its frame budget by priority."""
+        proxy = PipelinedDisplay(self, display, bus)
+        self.bus_scheduler(bus).add(proxy, priority)
+        return proxy
+
+    # --- Desired state ---
+    def set_led(self, pin, value):
+        with self.lock:
+            self.led_desired[pin] = value
+            self.led_requests += 1
+        self.mark_dirty()
+
+    def led_state(self, pin):
+        return self.led_desired[pin]
+
+    def mark_dirty(self):
+        self.dirty.set()
+
+    # --- Rendering ---
+    def render(self, force=False):
+        """
+        Applies all pending changes: GPIO banks, then each I2C bus, then PWM.
+        Display frames over the bus budget wait for a later tick unless force is set.
+        """
+        with self.render_lock:
+            self.ticks += 1
+            with self.lock:
+                for pins in self.banks.values():
+                    changes = {pin: self.led_desired[pin] for pin in pins
+                               if self.led_desired[pin] != self.led_applied[pin]}
+                    if changes:
+                        gpio_backend.output_many(changes)
+                        self.led_applied.update(changes)
+                        self.writes += 1
+            now = time.monotonic()
+            for scheduler in self.schedulers.values():
+                writes, waiting = scheduler.flush(now, force)
+                self.writes += writes
+                if waiting:
+                    self.mark_dirty()
+            for proxy in self.pwm:
+                self.writes += proxy.apply()
+
+    def flush(self):
+        """Renders now (e.g. right before a reaction timer starts)."""
+        self.dirty.clear()
+        self.render(force=True)
+
+    def _run(self):
+        last = 0.0
+        while self.running:
+            self.dirty.wait()
+            if not self.running:
+                break
+            # Coalescing window: gather the rest of this tick's changes
+            delay = last + self.period - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            self.dirty.clear()
+            self.render()
+            last = time.monotonic()
+
+    def start(self):
+        if self.thread is None:
+            self.running = True
+            self.thread = threading.Thread(target=self._run, daemon=True)
+            self.thread.start()
+
+    def stop(self):
+        """Renders what is pending and stops the render thread."""
+        self.running = False
+        self.dirty.set()
+        if self.thread is not None:
+            self.thread.join(1.0)
+            self.thread = None
+        self.render(force=True)
+
+    # --- Statistics ---
+    def requests(self):
+        proxies = self.pwm + [p for s in self.schedulers.values() for p in s.proxies()]
+        return self.led_requests + sum(p.requests for p in proxies)
+
+    def report(self):
+        requests = self.requests()
+        return (f"Outputs: {requests} requests, {self.writes} hardware writes in "
+                f"{self.ticks} ticks, {requests - self.writes} writes avoided")
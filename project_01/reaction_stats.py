@@ -0,0 +1,244 @@
+"""
+--------------------------------------------------------------------------
+Trach-Hero Game
+--------------------------------------------------------------------------
+License:   
+Copyright 2025 - Meghan Paral
+
+Redistribution and use in source and binary forms, with or without 
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this 
+list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice, 
+this list of conditions and the following disclaimer in the documentation 
+and/or other materials provided with the distribution.
+
+3. Neither the name of the copyright holder nor the names of its contributors 
+may be used to endorse or promote products derived from this software without 
+specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" 
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE 
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE 
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE 
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL 
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR 
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER 
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, 
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE 
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+--------------------------------------------------------------------------
+
+File: reaction_stats.py
+Author: Meghan Paral
+Date:  10/19/2026
+Description: Constant-memory reaction-time statistics per scenario and difficulty level.
+             Count / mean / variance use Welford's method; p50/p95/p99 come from a
+             log-bucket quantile sketch. Both can be merged, so stats from several
+             stations can be combined.
+"""
+
+import math
+import threading
+
+# --- SKETCH CONFIGURATION ---
+RELATIVE_ACCURACY = 0.01  # Quantiles are within 1% of the true value
+MAX_BUCKETS = 512         # Hard memory cap per sketch
+MIN_VALUE = 1e-3          # Values below this (seconds) share the lowest bucket
+
+
+class RunningStats:
+    """Count, mean, variance, min and max of a stream (Welford)."""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def variance(self):
+        """Sample variance (0 with fewer than two values)."""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    def stddev(self):
+        return math.sqrt(self.variance())
+
+    def merge(self, other):
+        """Adds another RunningStats into this one (Chan et al. parallel update)."""
+        if other.count == 0:
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.mean += delta * other.count / total
+        self.count = total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+
+class QuantileSketch:
+    """
+    Log-bucket quantile sketch: bucket i holds values in (gamma^(i-1), gamma^i],
+    so any quantile is returned with RELATIVE_ACCURACY relative error.
+    Merging adds bucket counts.
+    """
+
+    def __init__(self, accuracy=RELATIVE_ACCURACY, max_buckets=MAX_BUCKETS):
+        self.gamma = (1 + accuracy) / (1 - accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.max_buckets = max_buckets
+        self.buckets = {}
+        self.count = 0
+
+    def add(self, value):
+        index = math.ceil(math.log(max(value, MIN_VALUE)) / self.log_gamma)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        if len(self.buckets) > self.max_buckets:
+            self._collapse()
+
+    def _collapse(self):
+        """Folds the two lowest buckets together to stay within max_buckets."""
+        lowest, second = sorted(self.buckets)[:2]
+        self.buckets[second] += self.buckets.pop(lowest)
+
+    def quantile(self, q):
+        """Returns the value at quantile q (0..1), or None if empty."""
+        if self.count == 0:
+            return None
+        rank = q * (self.count - 1)
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen > rank:
+                # Midpoint of the bucket (in relative terms)
+                return 2 * self.gamma ** index / (self.gamma + 1)
+        return 2 * self.gamma ** max(self.buckets) / (self.gamma + 1)
+
+    def merge(self, other):
+        if other.gamma != self.gamma:
+            raise ValueError("Cannot merge sketches with different accuracy")
+        for index, n in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + n
+        self.count += other.count
+        while len(self.buckets) > self.max_buckets:
+            self._collapse()
+
+
+class ReactionStats:
+    """Reaction-time aggregators keyed by (scenario, difficulty level). Thread-safe."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.groups = {}     # (scenario, level) -> (RunningStats, QuantileSketch)
+        self.failures = {}   # (scenario, level) -> count
+
+    def add(self, scenario, level, seconds):
+        """Records one successful response."""
+        with self.lock:
+            stats, sketch = self._group((scenario, level))
+            stats.add(seconds)
+            sketch.add(seconds)
+
+    def add_failure(self, scenario, level):
+        """Records one timed-out scenario (no reaction time)."""
+        with self.lock:
+            key = (scenario, level)
+            self.failures[key] = self.failures.get(key, 0) + 1
+
+    def _group(self, key):
+        if key not in self.groups:
+            self.groups[key] = (RunningStats(), QuantileSketch())
+        return self.groups[key]
+
+    def merge(self, other):
+        """Adds another ReactionStats (e.g. from another station) into this one."""
+        with other.lock:
+            groups = list(other.groups.items())
+            failures = list(other.failures.items())
+        with self.lock:
+            for key, (stats, sketch) in groups:
+                mine_stats, mine_sketch = self._group(key)
+                mine_stats.merge(stats)
+                mine_sketch.merge(sketch)
+            for key, n in failures:
+                self.failures[key] = self.failures.get(key, 0) + n
+
+    def __getstate__(self):
+        # Locks cannot be pickled (stats travel between processes)
+        with self.lock:
+            return {"groups": self.groups, "failures": self.failures}
+
+    def __setstate__(self, state):
+        self.lock = threading.Lock()
+        self.groups = state["groups"]
+        self.failures = state["failures"]
+
+    def summary(self, scenario=None):
+        """
+        Returns a list of dicts (one per scenario/level) with count, failures,
+        mean, stddev, min, max, p50, p95 and p99 (seconds).
+        """
+        with self.lock:
+            keys = sorted(set(self.groups) | set(self.failures))
+            rows = []
+            for key in keys:
+                if scenario is not None and key[0] != scenario:
+                    continue
+                stats, sketch = self.groups.get(key, (RunningStats(), QuantileSketch()))
+                rows.append({
+                    "scenario": key[0], "level": key[1], "count": stats.count,
+                    "failures": self.failures.get(key, 0),
+                    "mean": stats.mean, "stddev": stats.stddev(),
+                    "min": stats.min if stats.count else None,
+                    "max": stats.max if stats.count else None,
+                    "p50": sketch.quantile(0.50), "p95": sketch.quantile(0.95),
+                    "p99": sketch.quantile(0.99),
+                })
+            return rows
+
+    def print_summary(self):
+        print(f"{'SCN':<4}{'LVL':>4}{'N':>7}{'FAIL':>6}{'MEAN':>8}{'SD':>7}"
+              f"{'P50':>7}{'P95':>7}{'P99':>7}")
+        for r in self.summary():
+            if r["count"] == 0:
+                print(f"{r['scenario']:<4}{r['level']:>4}{0:>7}{r['failures']:>6}")
+                continue
+            print(f"{r['scenario']:<4}{r['level']:>4}{r['count']:>7}{r['failures']:>6}"
+                  f"{r['mean']:>8.2f}{r['stddev']:>7.2f}{r['p50']:>7.2f}"
+                  f"{r['p95']:>7.2f}{r['p99']:>7.2f}")
+
+# --- TEST CODE ---
+if __name__ == "__main__":
+    import random
+    import statistics
+
+    print("--- Testing ReactionStats ---")
+    station_1 = ReactionStats()
+    station_2 = ReactionStats()
+    samples = []
+    for i in range(50000):
+        t = random.lognormvariate(0.3, 0.5)
+        samples.append(t)
+        (station_1 if i % 2 else station_2).add("A", 0, t)
+    station_2.add_failure("A", 0)
+
+    station_1.merge(station_2)
+    station_1.print_summary()
+
+    samples.sort()
+    print(f"Exact: mean={statistics.mean(samples):.2f} sd={statistics.stdev(samples):.2f} "
+          f"p50={samples[len(samples) // 2]:.2f} p95={samples[int(len(samples) * 0.95)]:.2f} "
+          f"p99={samples[int(len(samples) * 0.99)]:.2f}")
+    print("Test Complete.")
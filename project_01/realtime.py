@@ -0,0 +1,134 @@
+"""
+--------------------------------------------------------------------------
+Trach-Hero Game
+--------------------------------------------------------------------------
+License:   
+Copyright 2025 - Meghan Paral
+
+Redistribution and use in source and binary forms, with or without 
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this 
+list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice, 
+this list of conditions and the following disclaimer in the documentation 
+and/or other materials provided with the distribution.
+
+3. Neither the name of the copyright holder nor the names of its contributors 
+may be used to endorse or promote products derived from this software without 
+specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" 
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE 
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE 
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE 
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL 
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR 
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER 
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, 
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE 
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+--------------------------------------------------------------------------
+
+File: realtime.py
+Author: Meghan Paral
+Date:  10/19/2026
+Description: Opt-in real-time mode for the game process: SCHED_FIFO priorities for the
+             timing-critical threads, mlockall() so no page faults hit the hot loops,
+             garbage collection only between rounds, and a jitter monitor that reports
+             loop-period overruns and worst-case wake-up latency.
+"""
+
+import ctypes
+import ctypes.util
+import gc
+import os
+import threading
+
+from reaction_stats import RunningStats, QuantileSketch
+
+# --- REAL-TIME CONFIGURATION ---
+SAMPLER_PRIORITY = 50     # SCHED_FIFO priority of the input sampler thread
+GAME_PRIORITY = 40        # SCHED_FIFO priority of the game (main) thread
+MCL_CURRENT = 1           # mlockall() flags (sys/mman.h)
+MCL_FUTURE = 2
+
+
+def set_fifo(priority):
+    """Puts the calling thread under SCHED_FIFO. Returns False if not permitted."""
+    try:
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+        return True
+    except (PermissionError, OSError, AttributeError) as e:
+        print(f"Warning: SCHED_FIFO {priority} unavailable: {e}")
+        return False
+
+
+def lock_memory():
+    """Locks current and future pages in RAM. Returns False if not permitted."""
+    libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+    if libc.mlockall(MCL_CURRENT | MCL_FUTURE) != 0:
+        print(f"Warning: mlockall failed: {os.strerror(ctypes.get_errno())}")
+        return False
+    return True
+
+
+def pause_gc():
+    """Collects now, moves survivors out of the collector's way and stops automatic GC."""
+    gc.collect()
+    gc.freeze()
+    gc.disable()
+
+
+def resume_gc():
+    """Runs the deferred collection (between rounds) and re-enables GC."""
+    gc.unfreeze()
+    gc.collect()
+    gc.enable()
+
+
+def enable(priority=GAME_PRIORITY):
+    """Real-time mode for the calling (main) thread and the process memory."""
+    locked = lock_memory()
+    fifo = set_fifo(priority)
+    return locked and fifo
+
+
+class JitterMonitor:
+    """
+    Wake-up lateness of a periodic loop (microseconds): mean, p99, worst case,
+    and the number of periods that overran.
+    """
+
+    def __init__(self, name, period):
+        self.name = name
+        self.period = period
+        self.stats = RunningStats()
+        self.sketch = QuantileSketch()
+        self.overruns = 0
+        self.lock = threading.Lock()
+
+    def record(self, lateness):
+        """lateness: seconds between the deadline and the actual wake-up."""
+        us = max(lateness, 0.0) * 1e6
+        with self.lock:
+            self.stats.add(us)
+            self.sketch.add(us)
+            if lateness > self.period:
+                self.overruns += 1
+
+    def reset(self):
+        with self.lock:
+            self.stats = RunningStats()
+            self.sketch = QuantileSketch()
+            self.overruns = 0
+
+    def report(self):
+        with self.lock:
+            if self.stats.count == 0:
+                return f"{self.name}: no samples"
+            return (f"{self.name}: {self.stats.count} periods, "
+                    f"mean {self.stats.mean:.0f} us, p99 {self.sketch.quantile(0.99):.0f} us, "
+                    f"worst {self.stats.max:.0f} us, {self.overruns} overruns "
+                    f"(> {self.period * 1e6:.0f} us)")
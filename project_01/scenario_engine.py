@@ -0,0 +1,225 @@
+"""
+--------------------------------------------------------------------------
+Trach-Hero Game
+--------------------------------------------------------------------------
+License:   
+Copyright 2025 - Meghan Paral
+
+Redistribution and use in source and binary forms, with or without 
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this 
+list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice, 
+this list of conditions and the following disclaimer in the documentation 
+and/or other materials provided with the distribution.
+
+3. Neither the name of the copyright holder nor the names of its contributors 
+may be used to endorse or promote products derived from this software without 
+specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" 
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE 
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE 
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE 
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL 
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR 
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER 
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, 
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE 
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+--------------------------------------------------------------------------
+
+File: scenario_engine.py
+Author: Meghan Paral
+Date:  10/19/2026
+Description: Table-driven scenario engine. A scenario is declared as a small state machine
+             (states, input conditions, timed transitions, output actions); it is compiled
+             once into per-state transition tables and advanced by one event loop that
+             wakes on input changes from the input sampler or on the next timer. Several
+             scenarios can run at the same time in that loop, no thread per scenario.
+
+Scenario spec (see scenarios.py):
+    {"title": "...", "start": "state", "requires": ["input"],
+     "enter": [actions], "exit": [actions],
+     "states": {"state": {"inputs": [(input, value, next, [actions]), ...],
+                          "after": (seconds, next, [actions])}}}
+next is a state name, SUCCESS or FAIL. Actions: ("say", text), ("on", attr),
+("off", attr) and ("call", method, *args) on the game object.
+"""
+
+import time
+from functools import partial
+
+# --- TERMINAL STATES ---
+SUCCESS = "success"
+FAIL = "fail"
+
+MAX_CHAIN = 8             # Transitions one scenario may take on a single input change
+
+
+def say(text):
+    print(f"  -> {text}")
+
+
+def compile_action(action, target):
+    """Turns an action tuple into a callable bound to target (the game)."""
+    kind = action[0]
+    if kind == "say":
+        return partial(say, action[1])
+    if kind in ("on", "off"):
+        return getattr(getattr(target, action[1]), kind)
+    if kind == "call":
+        return partial(getattr(target, action[1]), *action[2:])
+    raise ValueError(f"Unknown scenario action: {kind}")
+
+
+class CompiledScenario:
+    """Transition tables of one scenario, states numbered in declaration order."""
+
+    def __init__(self, name, spec, index, target):
+        self.name = name
+        self.title = spec["title"]
+        self.states = list(spec["states"])
+        number = {state: i for i, state in enumerate(self.states)}
+        number[SUCCESS] = SUCCESS
+        number[FAIL] = FAIL
+
+        def actions(specs):
+            return tuple(compile_action(action, target) for action in specs)
+
+        # Scenarios whose inputs are missing (e.g. ToF sensor failed) cannot run
+        self.runnable = all(source in index for source in spec.get("requires", ()))
+        self.start = number[spec["start"]]
+        self.enter = actions(spec.get("enter", ()))
+        self.exit = actions(spec.get("exit", ()))
+
+        # inputs[state] = ((input position, value, next, actions), ...)
+        # timers[state] = (seconds, next, actions) or None
+        self.inputs = []
+        self.timers = []
+        for state in self.states:
+            table = spec["states"][state]
+            self.inputs.append(tuple((index[source], value, number[next_state], actions(then))
+                                     for source, value, next_state, then in table.get("inputs", ())
+                                     if source in index))
+            after = table.get("after")
+            self.timers.append(None if after is None else
+                               (after[0], number[after[1]], actions(after[2])))
+
+
+class Instance:
+    """One running scenario."""
+    __slots__ = ("scenario", "state", "entered", "start", "deadline", "success", "reaction")
+
+    def __init__(self, scenario):
+        self.scenario = scenario
+        self.state = scenario.start
+        self.entered = self.start = self.deadline = 0.0
+        self.success = None           # None while running (or aborted)
+        self.reaction = None          # Seconds from start to success
+
+    def wake_time(self):
+        """Next time this instance must be looked at without an input change."""
+        timer = self.scenario.timers[self.state]
+        if timer is None:
+            return self.deadline
+        return min(self.deadline, self.entered + timer[0])
+
+
+def run_actions(actions):
+    for action in actions:
+        action()
+
+
+class ScenarioEngine:
+    def __init__(self, sampler, target, specs):
+        """Compiles every spec once; inputs are looked up in the sampler, actions on target."""
+        self.sampler = sampler
+        self.scenarios = {name: CompiledScenario(name, spec, sampler.index, target)
+                          for name, spec in specs.items()}
+        self.snap = sampler.snapshot()  # Reused by every wait of the event loop
+        self.transitions = 0
+
+    def run(self, names, timeout, ready=None, started=None):
+        """
+        Runs the named scenarios at the same time, each with timeout seconds.
+        ready() is called after the enter actions, before the clock starts;
+        started(deadline) right after it started (time.monotonic() deadline).
+        Returns [(name, success, reaction)]; success is None if the waits were cancelled.
+        """
+        running = []
+        for name in names:
+            scenario = self.scenarios[name]
+            print(f"[{name}] {scenario.title}")
+            run_actions(scenario.enter)
+            running.append(Instance(scenario))
+        if ready is not None:
+            ready()
+
+        start = time.monotonic()
+        for inst in running:
+            inst.start = inst.entered = start
+            inst.deadline = start + timeout
+            if not inst.scenario.runnable:
+                self._finish(inst, True, None) # Auto-win (no reaction time)
+        if started is not None:
+            started(start + timeout)
+
+        sampler = self.sampler
+        snap = sampler.snapshot(self.snap)
+        active = [inst for inst in running if inst.success is None]
+        while active and not sampler.cancelled:
+            now = time.monotonic()
+            for inst in active:
+                self._advance(inst, snap, now)
+            active = [inst for inst in active if inst.success is None]
+            if not active:
+                break
+            remaining = min(inst.wake_time() for inst in active) - time.monotonic()
+            if remaining > 0 and sampler.wait_for_change(snap.seq, remaining, snap) is None:
+                snap = sampler.snapshot(snap) # Timer or cancel: re-read the latest tick
+
+        for inst in active:              # Cancelled: outputs off, no result
+            run_actions(inst.scenario.exit)
+        return [(inst.scenario.name, inst.success, inst.reaction) for inst in running]
+
+    def _advance(self, inst, snap, now):
+        """Takes every transition the snapshot and the clock allow (table lookups only)."""
+        scenario = inst.scenario
+        values = snap.values
+        for _ in range(MAX_CHAIN):
+            state = inst.state
+            for position, value, next_state, actions in scenario.inputs[state]:
+                if values[position] == value:
+                    self._go(inst, next_state, actions, max(snap.timestamp, inst.entered))
+                    break
+            else:
+                timer = scenario.timers[state]
+                if timer is None or now < inst.entered + timer[0]:
+                    break
+                self._go(inst, timer[1], timer[2], inst.entered + timer[0])
+            if inst.success is not None:
+                return
+        if now >= inst.deadline:
+            self._finish(inst, False, None)
+
+    def _go(self, inst, next_state, actions, when):
+        self.transitions += 1
+        run_actions(actions)
+        if next_state == SUCCESS:
+            if when <= inst.deadline:
+                self._finish(inst, True, when - inst.start)
+            else:
+                self._finish(inst, False, None)
+        elif next_state == FAIL:
+            self._finish(inst, False, None)
+        else:
+            inst.state = next_state
+            inst.entered = when
+
+    def _finish(self, inst, success, reaction):
+        inst.success = success
+        inst.reaction = reaction
+        run_actions(inst.scenario.exit)
@@ -0,0 +1,92 @@
+"""
+--------------------------------------------------------------------------
+Trach-Hero Game
+--------------------------------------------------------------------------
+License:   
+Copyright 2025 - Meghan Paral
+
+Redistribution and use in source and binary forms, with or without 
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this 
+list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice, 
+this list of conditions and the following disclaimer in the documentation 
+and/or other materials provided with the distribution.
+
+3. Neither the name of the copyright holder nor the names of its contributors 
+may be used to endorse or promote products derived from this software without 
+specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" 
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE 
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE 
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE 
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL 
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR 
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER 
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, 
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE 
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+--------------------------------------------------------------------------
+
+File: scenarios.py
+Author: Meghan Paral
+Date:  10/19/2026
+Description: The Trach-Hero emergencies as declarative state machines, run by
+             scenario_engine.py. Adding a scenario means adding a table here (and its
+             letter to game_rules.SCENARIOS), no new code or thread.
+"""
+
+from game_rules import SUCTION_TIME
+from scenario_engine import SUCCESS
+
+SCENARIOS = {
+    # ---------------------------------------------------------
+    # SCENARIO A: Accidental Decannulation
+    # Remove tube (magnet gone, "hall" 0) -> insert tube ("hall" 1)
+    # ---------------------------------------------------------
+    "A": {
+        "title": "Decannulation! (Green LED)",
+        "start": "in_place",
+        "enter": [("on", "led_green")],
+        "exit": [("off", "led_green")],
+        "states": {
+            "in_place": {"inputs": [("hall", 0, "removed", [("say", "Trach OUT! Quick, re-insert!")])]},
+            "removed": {"inputs": [("hall", 1, SUCCESS, [("say", "Trach IN! Safe.")])]},
+        },
+    },
+    # ---------------------------------------------------------
+    # SCENARIO B: Tube Obstruction
+    # Suction (filtered ToF "tof" 1) held for SUCTION_TIME seconds.
+    # Auto-win without a reaction time if the ToF sensor is missing.
+    # ---------------------------------------------------------
+    "B": {
+        "title": "Obstruction! Suction! (Yellow LED)",
+        "requires": ["tof"],
+        "start": "blocked",
+        "enter": [("on", "led_yellow"), ("call", "reset_tof")],
+        "exit": [("off", "led_yellow")],
+        "states": {
+            "blocked": {"inputs": [("tof", 1, "suctioning", [("say", "Suctioning Started...")])]},
+            "suctioning": {
+                "inputs": [("tof", 0, "blocked", [("say", "Suction interrupted! Try again.")])],
+                "after": (SUCTION_TIME, SUCCESS, [("say", "Airway Cleared!")]),
+            },
+        },
+    },
+    # ---------------------------------------------------------
+    # SCENARIO C: Call EMS
+    # Press the EMS button
+    # ---------------------------------------------------------
+    "C": {
+        "title": "Call EMS! (White LED)",
+        "start": "waiting",
+        "enter": [("on", "led_white")],
+        "exit": [("off", "led_white")],
+        "states": {
+            "waiting": {"inputs": [("ems", 1, SUCCESS, [("say", "EMS Called!")])]},
+        },
+    },
+}
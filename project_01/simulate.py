@@ -0,0 +1,302 @@
+"""
+--------------------------------------------------------------------------
+Trach-Hero Game
+--------------------------------------------------------------------------
+License:   
+Copyright 2025 - Meghan Paral
+
+Redistribution and use in source and binary forms, with or without 
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this 
+list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice, 
+this list of conditions and the following disclaimer in the documentation 
+and/or other materials provided with the distribution.
+
+3. Neither the name of the copyright holder nor the names of its contributors 
+may be used to endorse or promote products derived from this software without 
+specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" 
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE 
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE 
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE 
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL 
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR 
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER 
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, 
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE 
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+--------------------------------------------------------------------------
+
+File: simulate.py
+Author: Meghan Paral
+Date:  10/19/2026
+Description: Monte Carlo difficulty tuning for Trach-Hero. Plays the game's own round flow
+             (game_rules.play_round) on a virtual clock, with synthetic players whose
+             reaction times follow per-scenario log-normal distributions. Rounds are spread
+             over a process pool; the output is the score distribution, survival rate and
+             failures per scenario for every parameter set and player model.
+
+Usage:
+    python3 simulate.py --rounds 200000 --base-timeout 8 10 12 --step 0.25 0.5
+"""
+
+import argparse
+import csv
+import itertools
+import math
+import os
+import random
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+import game_rules
+from game_rules import DEFAULT_RULES, SCENARIOS, SUCTION_TIME
+
+# --- SIMULATION CONFIGURATION ---
+ROUNDS = 100000           # Simulated rounds per parameter set and player
+BATCH_ROUNDS = 5000       # Rounds per worker task
+
+# Synthetic players. Per scenario: (median seconds, log-normal sigma) of the time from the
+# LED to the completed action (B excludes the SUCTION_TIME hold). "lapse" is the chance of
+# missing a scenario entirely, "interrupt" the chance of letting go of the suction early.
+PLAYER_MODELS = {
+    "novice":  {"A": (4.0, 0.45), "B": (2.0, 0.5), "C": (1.2, 0.4), "lapse": 0.03, "interrupt": 0.25},
+    "trained": {"A": (2.5, 0.35), "B": (1.2, 0.4), "C": (0.8, 0.3), "lapse": 0.01, "interrupt": 0.10},
+    "expert":  {"A": (1.8, 0.30), "B": (0.8, 0.3), "C": (0.5, 0.25), "lapse": 0.005, "interrupt": 0.03},
+}
+
+
+class VirtualClock:
+    """Simulated time: sleeping just advances the clock."""
+
+    def __init__(self):
+        self.time = 0.0
+
+    def now(self):
+        return self.time
+
+    def sleep(self, seconds):
+        self.time += seconds
+
+
+def reaction_time(player, scenario, rng):
+    """Seconds the player needs for a scenario (inf = never reacts)."""
+    if rng.random() < player["lapse"]:
+        return math.inf
+    median, sigma = player[scenario]
+    seconds = rng.lognormvariate(math.log(median), sigma)
+    if scenario == "B":
+        # Every interruption restarts the hold after a partial attempt
+        while rng.random() < player["interrupt"]:
+            seconds += rng.uniform(0, SUCTION_TIME) + rng.lognormvariate(math.log(median / 2), sigma)
+        seconds += SUCTION_TIME
+    return seconds
+
+
+def run_scenarios(names, timeout, player, rng):
+    """
+    Virtual ScenarioEngine.run: the scenarios run at the same time with their own time limit,
+    the player works through them one after the other (skipping any they lapse on).
+    Returns ([(name, success, reaction)], seconds until all of them were over).
+    """
+    results = []
+    busy = 0.0
+    for name in names:
+        seconds = reaction_time(player, name, rng)
+        if busy + seconds < timeout:
+            busy += seconds
+            results.append((name, True, busy))
+        else:
+            if seconds < math.inf:
+                busy = timeout          # Still at it when the time runs out
+            results.append((name, False, None))
+    over = timeout if not all(success for _, success, _ in results) else busy
+    return results, over
+
+
+class VirtualRound:
+    """
+    Stands in for TrachGame in game_rules.play_round: every round action takes
+    its time on the virtual clock and a synthetic player handles the scenarios.
+    """
+
+    def __init__(self, clock, player, rng):
+        self.clock = clock
+        self.player = player
+        self.rng = rng
+        self.failures = []
+
+    def agitate(self):
+        self.clock.sleep(game_rules.AGITATION_TIME)
+
+    def heartbeat(self):
+        self.clock.sleep(game_rules.HEARTBEAT_TIME)
+
+    def twitch_patient(self):
+        self.clock.sleep(game_rules.TWITCH_TIME)
+
+    def run_scenarios(self, names, timeout):
+        results, seconds = run_scenarios(names, timeout, self.player, self.rng)
+        self.clock.sleep(seconds)
+        return results
+
+    def scored(self, results, score, timeout):
+        self.failures = [name for name, success, _ in results if not success]
+
+    def passed(self, score):
+        self.clock.sleep(game_rules.SUCCESS_TIME)
+
+    def failed(self, score):
+        pass
+
+
+def play_round(rules, player, rng):
+    """
+    One round of game_rules.play_round (the game's own flow) on a virtual clock.
+    Returns (score, survived, [failed scenarios]).
+    """
+    clock = VirtualClock()
+    actions = VirtualRound(clock, player, rng)
+    score, survived = game_rules.play_round(rules, rng, actions, clock)
+    return score, survived, actions.failures if not survived else []
+
+
+def run_batch(task):
+    """Worker: plays a batch of rounds. Returns (score counts, survived, failures)."""
+    rules, player_name, rounds, seed = task
+    rng = random.Random(seed)
+    player = PLAYER_MODELS[player_name]
+    scores = Counter()
+    failures = Counter()
+    survived = 0
+    for _ in range(rounds):
+        score, alive, failed = play_round(rules, player, rng)
+        scores[score] += 1
+        if alive:
+            survived += 1
+        failures.update(failed)
+    return scores, survived, failures
+
+
+def percentile(scores, q):
+    """q-quantile of a score histogram (Counter)."""
+    total = sum(scores.values())
+    seen = 0
+    for score in sorted(scores):
+        seen += scores[score]
+        if seen >= q * total:
+            return score
+    return 0
+
+
+def simulate(rule_sets, players, rounds=ROUNDS, workers=None, seed=1):
+    """Returns a list of result dicts, one per (rule set, player)."""
+    jobs = []
+    for rules, player in itertools.product(rule_sets, players):
+        batches = [min(BATCH_ROUNDS, rounds - start) for start in range(0, rounds, BATCH_ROUNDS)]
+        jobs.append((rules, player, batches))
+
+    tasks = []
+    for job, (rules, player, batches) in enumerate(jobs):
+        for i, count in enumerate(batches):
+            tasks.append((job, (rules, player, count, hash((seed, job, i)))))
+
+    totals = [[Counter(), 0, Counter()] for _ in jobs]
+    with ProcessPoolExecutor(workers) as pool:
+        results = pool.map(run_batch, [task for _, task in tasks], chunksize=4)
+        for (job, _), (scores, survived, failures) in zip(tasks, results):
+            totals[job][0].update(scores)
+            totals[job][1] += survived
+            totals[job][2].update(failures)
+
+    report = []
+    for (rules, player, _), (scores, survived, failures) in zip(jobs, totals):
+        total = sum(scores.values())
+        row = dict(rules)
+        row.update({
+            "player": player,
+            "rounds": total,
+            "mean_score": sum(s * n for s, n in scores.items()) / total,
+            "p10": percentile(scores, 0.10),
+            "p50": percentile(scores, 0.50),
+            "p90": percentile(scores, 0.90),
+            "survival": survived / total,
+        })
+        for scenario in SCENARIOS:
+            row[f"fail_{scenario}"] = failures[scenario] / total
+        report.append(row)
+    return report
+
+
+def print_report(report):
+    print(f"{'base':>5} {'min':>4} {'step':>5} {'dur':>4} {'twitch':>6} {'double':>6}  {'player':<8}"
+          f"{'mean':>6} {'p10':>4} {'p50':>4} {'p90':>4} {'surv%':>6}"
+          f"{'A%':>6} {'B%':>6} {'C%':>6}")
+    for row in report:
+        print(f"{row['base_timeout']:5.1f} {row['min_timeout']:4.1f} {row['timeout_step']:5.2f} "
+              f"{row['game_duration']:4.0f} {row['twitch_chance']:6.2f} {row['double_chance']:6.2f}  "
+              f"{row['player']:<8}"
+              f"{row['mean_score']:6.2f} {row['p10']:4d} {row['p50']:4d} {row['p90']:4d} "
+              f"{row['survival'] * 100:6.1f}"
+              f"{row['fail_A'] * 100:6.1f} {row['fail_B'] * 100:6.1f} {row['fail_C'] * 100:6.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Monte Carlo difficulty tuning for Trach-Hero")
+    parser.add_argument("--rounds", type=int, default=ROUNDS,
+                        help="rounds per parameter set and player")
+    parser.add_argument("--players", nargs="+", default=list(PLAYER_MODELS),
+                        choices=list(PLAYER_MODELS))
+    parser.add_argument("--base-timeout", nargs="+", type=float,
+                        default=[DEFAULT_RULES["base_timeout"]])
+    parser.add_argument("--min-timeout", nargs="+", type=float,
+                        default=[DEFAULT_RULES["min_timeout"]])
+    parser.add_argument("--step", nargs="+", type=float,
+                        default=[DEFAULT_RULES["timeout_step"]])
+    parser.add_argument("--duration", nargs="+", type=float,
+                        default=[DEFAULT_RULES["game_duration"]])
+    parser.add_argument("--twitch", nargs="+", type=float,
+                        default=[DEFAULT_RULES["twitch_chance"]])
+    parser.add_argument("--double", nargs="+", type=float,
+                        default=[DEFAULT_RULES["double_chance"]],
+                        help="chance of two simultaneous scenarios")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--csv", help="also write the results to this CSV file")
+    args = parser.parse_args()
+
+    rule_sets = [
+        {"base_timeout": b, "min_timeout": m, "timeout_step": s,
+         "game_duration": d, "twitch_chance": t, "double_chance": x}
+        for b, m, s, d, t, x in itertools.product(args.base_timeout, args.min_timeout,
+                                                  args.step, args.duration, args.twitch,
+                                                  args.double)]
+    for rules in rule_sets:
+        try:
+            game_rules.check_rules(rules)
+        except ValueError as e:
+            parser.error(str(e))
+
+    start = time.perf_counter()
+    report = simulate(rule_sets, args.players, args.rounds, args.workers, args.seed)
+    elapsed = time.perf_counter() - start
+
+    print_report(report)
+    total = args.rounds * len(report)
+    print(f"\n{total} rounds in {elapsed:.1f} s ({total / elapsed:.0f} rounds/s, "
+          f"{args.workers} workers)")
+
+    if args.csv:
+        with open(args.csv, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(report[0]))
+            writer.writeheader()
+            writer.writerows(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,297 @@
+"""
+--------------------------------------------------------------------------
+Trach-Hero Game
+--------------------------------------------------------------------------
+License:   
+Copyright 2025 - Meghan Paral
+
+Redistribution and use in source and binary forms, with or without 
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this 
+list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice, 
+this list of conditions and the following disclaimer in the documentation 
+and/or other materials provided with the distribution.
+
+3. Neither the name of the copyright holder nor the names of its contributors 
+may be used to endorse or promote products derived from this software without 
+specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" 
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE 
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE 
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE 
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL 
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR 
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER 
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, 
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE 
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+--------------------------------------------------------------------------
+
+File: station_manager.py
+Author: Meghan Paral
+Date:  10/19/2026
+Description: Runs several Trach-Hero training stations from one host. Every station is a
+             TrachGame in its own worker process (own GIL, own timing) and reports its
+             scores and health back to the manager over a pipe.
+
+Usage:
+    sudo python3 station_manager.py stations.json
+
+stations.json is a list of station configs; each one overrides keys of
+game.DEFAULT_CONFIG, e.g.
+    [{"name": "bay-1"},
+     {"name": "bay-2", "btn_start": "P1_2", "i2c_bus": 1, "display_address": 113}]
+"""
+
+import json
+import multiprocessing
+import os
+import signal
+import sys
+import threading
+import time
+from multiprocessing.connection import wait
+
+from reaction_stats import ReactionStats
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# --- MANAGER CONFIGURATION ---
+HEALTH_INTERVAL = 1.0     # Seconds between worker health messages
+STALE_AFTER = 5.0         # Station is "stale" if silent for this long
+STATUS_INTERVAL = 5.0     # Seconds between status table prints
+STOP_TIMEOUT = 5.0        # Seconds to wait for a worker to shut down
+STOP_GRACE = 2.0          # After Ctrl-C: seconds workers get before they are signalled again
+RESTART_DELAY = 1.0       # First restart delay after a crash (doubles per crash)
+RESTART_MAX = 60.0        # Longest restart delay
+STABLE_AFTER = 30.0       # A worker up this long resets the restart delay
+EXIT_INIT_FAILED = 3      # Worker exit code: station hardware failed to initialise
+
+# Config keys and the pin mode each one needs (see configure_pins.sh)
+PIN_MODES = {
+    "led_red": "gpio_pd", "led_yellow": "gpio_pd", "led_green": "gpio_pd",
+    "led_white": "gpio_pd", "led_blue": "gpio_pd",
+    "servo": "pwm", "buzzer_hb": "pwm", "buzzer_alarm": "pwm",
+    "btn_start": "gpio", "btn_ems": "gpio", "sensor_hall": "gpio",
+}
+
+
+def configure_station_pins(config):
+    """Runs config-pin for every pin of a station (config-pin wants 'P2_01' style names)."""
+    for key, mode in PIN_MODES.items():
+        if key not in config:
+            continue
+        header, number = config[key].split("_")
+        os.system(f"config-pin {header}_{int(number):02d} {mode}")
+
+
+def run_station(config, conn):
+    """Worker process entry point: builds one TrachGame and runs its main loop."""
+    os.chdir(HERE)
+    sys.path.insert(0, HERE)
+    send_lock = threading.Lock()
+
+    def send(message):
+        # The game thread and the health thread share the pipe
+        with send_lock:
+            try:
+                conn.send(message)
+            except (BrokenPipeError, EOFError, OSError):
+                pass
+
+    try:
+        configure_station_pins(config)
+        import game
+        station = game.TrachGame(config)
+        station.reporter = send
+    except Exception as e:
+        send({"event": "error", "station": config.get("name"), "error": str(e),
+              "time": time.time()})
+        conn.close()
+        sys.exit(EXIT_INIT_FAILED) # Not restarted: the hardware needs fixing first
+
+    def health():
+        while True:
+            send({"event": "health", "station": station.config["name"],
+                  "state": station.state, "score": station.score, "time": time.time()})
+            time.sleep(HEALTH_INTERVAL)
+
+    threading.Thread(target=health, daemon=True).start()
+    station.main_loop()
+    send({"event": "stopped", "station": station.config["name"], "time": time.time()})
+
+
+class StationManager:
+    def __init__(self, configs, restart=True):
+        """
+        configs: list of per-station config dicts (see game.DEFAULT_CONFIG).
+        restart: restart a station's worker if its process dies (with exponential
+                 backoff; never after a failed hardware initialisation).
+        """
+        names = [c.get("name") for c in configs]
+        if None in names or len(set(names)) != len(names):
+            raise ValueError("Every station needs a unique 'name'")
+
+        self.configs = {c["name"]: c for c in configs}
+        self.restart = restart
+        self.stopping = False
+        self.workers = {}     # name -> (process, connection)
+        self.restarts = {}    # name -> time.time() a crashed worker is restarted at
+        self.status = {name: {"state": "starting", "score": 0, "best": 0,
+                              "games": 0, "restarts": 0, "last_seen": None,
+                              "error": None, "started": None, "delay": RESTART_DELAY}
+                       for name in self.configs}
+        self.stats = {name: ReactionStats() for name in self.configs}
+
+    def start(self):
+        """Starts one worker process per station."""
+        for name in self.configs:
+            self._start_worker(name)
+
+    def _start_worker(self, name):
+        parent_conn, child_conn = multiprocessing.Pipe(duplex=False)
+        process = multiprocessing.Process(target=run_station, name=name,
+                                          args=(self.configs[name], child_conn),
+                                          daemon=True)
+        process.start()
+        child_conn.close()
+        self.workers[name] = (process, parent_conn)
+        self.status[name]["last_seen"] = self.status[name]["started"] = time.time()
+
+    def poll(self, timeout=0.5):
+        """Collects pending messages from the workers and checks their health."""
+        conns = {conn: name for name, (_, conn) in self.workers.items() if conn is not None}
+        for conn in wait(list(conns), timeout):
+            name = conns[conn]
+            try:
+                self._handle(name, conn.recv())
+            except EOFError:
+                # Worker went away; its process check below takes over
+                self.workers[name][1].close()
+                self.workers[name] = (self.workers[name][0], None)
+
+        for name, (process, conn) in list(self.workers.items()):
+            status = self.status[name]
+            if process.is_alive():
+                if time.time() - status["last_seen"] > STALE_AFTER:
+                    status["state"] = "stale"
+                continue
+            if conn is not None:
+                conn.close()
+            del self.workers[name]
+            if process.exitcode == EXIT_INIT_FAILED:
+                status["state"] = "init failed"
+                continue
+            status["state"] = f"dead ({process.exitcode})"
+            if self.restart and not self.stopping:
+                # Exponential backoff, reset once a worker has run for a while
+                if time.time() - status["started"] > STABLE_AFTER:
+                    status["delay"] = RESTART_DELAY
+                self.restarts[name] = time.time() + status["delay"]
+                status["delay"] = min(RESTART_MAX, status["delay"] * 2)
+
+        for name, when in list(self.restarts.items()):
+            if time.time() >= when and not self.stopping:
+                del self.restarts[name]
+                self.status[name]["restarts"] += 1
+                self._start_worker(name)
+
+    def _handle(self, name, message):
+        status = self.status[name]
+        status["last_seen"] = time.time()
+        event = message.get("event")
+
+        if event == "health":
+            status["state"] = message["state"]
+            status["score"] = message["score"]
+        elif event == "scenario":
+            if message["reaction"] is not None:
+                self.stats[name].add(message["scenario"], message["level"],
+                                     message["reaction"])
+            elif not message["success"]:
+                self.stats[name].add_failure(message["scenario"], message["level"])
+        elif event == "end":
+            status["games"] += 1
+            status["best"] = max(status["best"], message["score"])
+        elif event == "error":
+            status["state"] = "error"
+            status["error"] = message["error"]
+        elif event == "stopped":
+            status["state"] = "stopped"
+
+    def print_status(self):
+        print(f"{'STATION':<12} {'STATE':<12} {'SCORE':>5} {'BEST':>5} "
+              f"{'GAMES':>5} {'RESTARTS':>8}")
+        for name, s in self.status.items():
+            print(f"{name:<12} {s['state']:<12} {s['score']:>5} {s['best']:>5} "
+                  f"{s['games']:>5} {s['restarts']:>8}")
+            if s["error"]:
+                print(f"    last error: {s['error']}")
+
+    def merged_stats(self):
+        """Reaction-time statistics of all stations combined."""
+        merged = ReactionStats()
+        for stats in self.stats.values():
+            merged.merge(stats)
+        return merged
+
+    def stop(self, interrupted=False):
+        """
+        Asks every worker to shut down (same as Ctrl-C on a single game).
+        interrupted: the terminal's Ctrl-C already reached the workers (same process
+        group); they get STOP_GRACE seconds before the ones still running are signalled,
+        so a second KeyboardInterrupt does not cut their hardware cleanup short.
+        """
+        self.stopping = True
+        self.restarts.clear()
+        if interrupted:
+            deadline = time.time() + STOP_GRACE
+            for process, _ in self.workers.values():
+                process.join(max(0, deadline - time.time()))
+        for process, _ in self.workers.values():
+            if process.is_alive():
+                os.kill(process.pid, signal.SIGINT)
+        for name, (process, conn) in self.workers.items():
+            process.join(STOP_TIMEOUT)
+            if process.is_alive():
+                process.terminate()
+            # Pick up the final messages (e.g. "stopped")
+            try:
+                while conn is not None and conn.poll():
+                    self._handle(name, conn.recv())
+            except EOFError:
+                pass
+
+    def run(self):
+        """Starts all stations and supervises them until Ctrl-C."""
+        self.start()
+        last_print = 0
+        interrupted = False
+        try:
+            while True:
+                self.poll()
+                if time.time() - last_print > STATUS_INTERVAL:
+                    self.print_status()
+                    last_print = time.time()
+        except KeyboardInterrupt:
+            print("\nStopping stations...")
+            interrupted = True
+        finally:
+            self.stop(interrupted)
+            self.print_status()
+            print("\nReaction times (all stations):")
+            self.merged_stats().print_summary()
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("Usage: sudo python3 station_manager.py stations.json")
+        sys.exit(1)
+
+    with open(sys.argv[1]) as f:
+        station_configs = json.load(f)
+
+    StationManager(station_configs).run()
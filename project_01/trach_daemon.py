@@ -0,0 +1,254 @@
+"""
+--------------------------------------------------------------------------
+Trach-Hero Game
+--------------------------------------------------------------------------
+License:   
+Copyright 2025 - Meghan Paral
+
+Redistribution and use in source and binary forms, with or without 
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this 
+list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice, 
+this list of conditions and the following disclaimer in the documentation 
+and/or other materials provided with the distribution.
+
+3. Neither the name of the copyright holder nor the names of its contributors 
+may be used to endorse or promote products derived from this software without 
+specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" 
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE 
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE 
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE 
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL 
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR 
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER 
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, 
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE 
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+--------------------------------------------------------------------------
+
+File: trach_daemon.py
+Author: Meghan Paral
+Date:  10/19/2026
+Description: Long-running Trach-Hero daemon. Configures the pins and builds the TrachGame
+             once, keeps the hardware warm between rounds, and takes commands on a local
+             Unix socket. Commands are answered from the game's state without touching
+             the game thread, so replies take milliseconds.
+
+Usage:
+    sudo python3 trach_daemon.py [--socket PATH] [--config station.json] [--realtime]
+
+Protocol (one command per line, one JSON reply per line):
+    START [player]            start a round (as if the start button was pressed)
+    ABORT                     end the running round without a score
+    STATUS                    state, score, time limit, level, rounds played
+    DIFFICULTY [key=value..]  show / change the rules (see game_rules.RULE_RANGES)
+    METRICS                   reaction-time stats, input jitter, wake-up and command latency
+    SHUTDOWN                  stop the daemon
+    QUIT                      close this connection
+
+    e.g.  echo STATUS | socat - UNIX-CONNECT:/tmp/trach_hero.sock
+"""
+
+import argparse
+import json
+import os
+import signal
+import socketserver
+import sys
+import threading
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, HERE)
+sys.path.append(os.path.join(HERE, "drivers_new"))
+
+import game
+import melody
+from reaction_stats import RunningStats
+
+# --- DAEMON CONFIGURATION ---
+SOCKET_PATH = "/tmp/trach_hero.sock"
+SOCKET_MODE = 0o660       # Owner and group may send commands
+
+
+class ControlHandler(socketserver.StreamRequestHandler):
+    """One client connection (runs in its own thread)."""
+
+    def handle(self):
+        for raw in self.rfile:
+            line = raw.decode(errors="replace").strip()
+            if not line:
+                continue
+            reply = self.server.daemon.command(line)
+            self.wfile.write((json.dumps(reply) + "\n").encode())
+            if reply.get("bye"):
+                break
+
+
+class ControlServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class TrachDaemon:
+    def __init__(self, config=None, path=SOCKET_PATH):
+        self.path = path
+        self.started = time.time()
+
+        # Pre-warm: pins, hardware, compiled sounds and the high score cache
+        os.chdir(HERE)
+        os.system("./configure_pins.sh")
+        self.game = game.TrachGame(config)
+        self.game.reporter = self.on_event
+        for tune in (game.SOUND_SUCCESS, game.SOUND_FAIL):
+            melody.compile_melody(tune)
+        if self.game.store is not None:
+            self.game.store.high_score()
+
+        self.rounds = 0
+        self.aborts = 0
+        self.last_result = None
+        self.command_times = RunningStats()   # Milliseconds per command
+        self.lock = threading.Lock()
+        self.game_thread = None
+        self.server = None
+
+    def on_event(self, event):
+        """Game reporter hook (game thread)."""
+        with self.lock:
+            if event["event"] == "end":
+                self.rounds += 1
+                self.last_result = {"score": event["score"], "survived": event["survived"],
+                                    "time": event["time"]}
+            elif event["event"] == "abort":
+                self.aborts += 1
+
+    # ------------------------------------------------------------------
+    # Commands
+    # ------------------------------------------------------------------
+    def command(self, line):
+        start = time.perf_counter()
+        verb, *args = line.split()
+        handler = getattr(self, "cmd_" + verb.lower(), None)
+        if handler is None:
+            reply = {"ok": False, "error": f"unknown command {verb}"}
+        else:
+            try:
+                reply = handler(*args)
+            except (TypeError, ValueError) as e:
+                reply = {"ok": False, "error": str(e)}
+        with self.lock:
+            self.command_times.add((time.perf_counter() - start) * 1000)
+        return reply
+
+    def cmd_start(self, player=None):
+        if player is not None and self.game.state == "ready":
+            self.game.player = player
+        if not self.game.request_start():
+            return {"ok": False, "error": f"not ready ({self.game.state})"}
+        return {"ok": True}
+
+    def cmd_abort(self):
+        if not self.game.abort_round():
+            return {"ok": False, "error": "no round running"}
+        return {"ok": True}
+
+    def cmd_status(self):
+        g = self.game
+        with self.lock:
+            return {"ok": True, "state": g.state, "score": g.score,
+                    "timeout": g.current_timeout, "level": g.difficulty_level(),
+                    "player": g.player, "rounds": self.rounds, "aborts": self.aborts,
+                    "last_result": self.last_result,
+                    "uptime": time.time() - self.started}
+
+    def cmd_difficulty(self, *settings):
+        changes = {}
+        for setting in settings:
+            key, sep, value = setting.partition("=")
+            if not sep:
+                raise ValueError(f"expected key=value, got {setting}")
+            changes[key] = value
+        rules = self.game.set_rules(**changes) if changes else self.game.rules
+        return {"ok": True, "rules": rules}
+
+    def cmd_metrics(self):
+        g = self.game
+        with self.lock:
+            commands = {"count": self.command_times.count,
+                        "mean_ms": self.command_times.mean,
+                        "max_ms": self.command_times.max if self.command_times.count else None}
+        store = g.store
+        return {"ok": True,
+                "reaction": g.stats.summary(),
+                "sampler": {"ticks": g.sampler.seq, "overruns": g.sampler.overruns,
+                            "jitter": g.sampler.monitor.report()},
+                "commands": commands,
+                "idle": g.idle.summary(),
+                "outputs": {"requests": g.outputs.requests(), "writes": g.outputs.writes},
+                "displays": {bus: {"writes": s.writes, "deferred": s.deferred}
+                             for bus, s in g.outputs.schedulers.items()},
+                "high_score": store.high_score() if store is not None else None}
+
+    def cmd_shutdown(self):
+        threading.Thread(target=self.server.shutdown, daemon=True).start()
+        return {"ok": True, "bye": True}
+
+    def cmd_quit(self):
+        return {"ok": True, "bye": True}
+
+    # ------------------------------------------------------------------
+    # Main
+    # ------------------------------------------------------------------
+    def run(self):
+        """Runs the game thread and serves commands until SHUTDOWN / SIGTERM / Ctrl+C."""
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+        self.server = ControlServer(self.path, ControlHandler)
+        self.server.daemon = self
+        os.chmod(self.path, SOCKET_MODE)
+
+        self.game_thread = threading.Thread(target=self.game.main_loop, name="game")
+        self.game_thread.start()
+
+        def terminate(signum, frame):
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+        signal.signal(signal.SIGTERM, terminate)
+
+        print(f"Trach-Hero daemon listening on {self.path}")
+        try:
+            self.server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            print("\nShutting down...")
+            self.server.server_close()
+            self.game.stop()
+            self.game_thread.join()
+            try:
+                os.unlink(self.path)
+            except FileNotFoundError:
+                pass
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Trach-Hero daemon with a control socket")
+    parser.add_argument("--socket", default=SOCKET_PATH)
+    parser.add_argument("--config", help="JSON file with station config overrides")
+    parser.add_argument("--realtime", action="store_true",
+                        help="SCHED_FIFO priorities, locked memory, GC only between rounds")
+    args = parser.parse_args()
+
+    config = {}
+    if args.config:
+        with open(args.config) as f:
+            config = json.load(f)
+    config["realtime"] = args.realtime or config.get("realtime", False)
+
+    TrachDaemon(config, args.socket).run()
@@ -7,29 +7,130 @@
 # This script blinks the USR3 LED on the PocketBeagle at 5 Hz.
 # [cite: 1007, 1008]
 #
+# The kernel's LED "timer" trigger does the blinking when it is available
+# (no user space wakeups at all).  Otherwise the LED is toggled from Python
+# on absolute deadlines, so loop overhead does not make the blink drift.
+# Ctrl+C prints the measured frequency and timing jitter (software timing),
+# or the frequency the kernel timer was configured for.
+#
 
 import Adafruit_BBIO.GPIO as GPIO
+import glob
+import os
 import time
 
 # Define the LED and frequency
 USR3_LED = "USR3"
+USR3_SYSFS = "/sys/class/leds/*usr3"       # beaglebone:green:usr3
 FREQ_HZ  = 5.0
 DELAY_S  = 1.0 / (2 * FREQ_HZ) # Delay for on and off states (0.1s)
 
-GPIO.setup(USR3_LED, GPIO.OUT)
 
-print("Blinking USR3 LED at 5 Hz. Press Ctrl+C to stop.")
+def read_attr(led_dir, name):
+    with open(os.path.join(led_dir, name)) as f:
+        return f.read().strip()
+
+
+def write_attr(led_dir, name, value):
+    with open(os.path.join(led_dir, name), "w") as f:
+        f.write(str(value))
+
+
+def current_trigger(led_dir):
+    """Returns the selected trigger (the one shown in [brackets])."""
+    for name in read_attr(led_dir, "trigger").split():
+        if name.startswith("["):
+            return name.strip("[]")
+    return "none"
+
+
+def kernel_blink(led_dir, delay_s):
+    """
+    Lets the kernel blink the LED with the "timer" trigger.
+    Returns the trigger that was active before, to restore on exit.
+    """
+    previous = current_trigger(led_dir)
+    write_attr(led_dir, "trigger", "timer")
+    done = False
+    try:
+        delay_ms = max(1, round(delay_s * 1000))
+        write_attr(led_dir, "delay_on", delay_ms)
+        write_attr(led_dir, "delay_off", delay_ms)
+        done = True
+    finally:
+        if not done:
+            # Half set up: put the original trigger back before giving up
+            write_attr(led_dir, "trigger", previous)
+    return previous
+
+
+def software_blink(delay_s):
+    """
+    Toggles the LED on absolute deadlines (start + n * delay) until Ctrl+C.
+    Returns (toggles, seconds from first to last toggle, mean lateness, max lateness).
+    """
+    GPIO.setup(USR3_LED, GPIO.OUT)
+    toggles = 0
+    late_total = 0.0
+    late_max = 0.0
+    state = GPIO.LOW
+    start = time.monotonic()
+    last_toggle = start
+
+    try:
+        while True:
+            state = GPIO.HIGH if state == GPIO.LOW else GPIO.LOW
+            GPIO.output(USR3_LED, state)
+            last_toggle = time.monotonic()
+            toggles += 1
+
+            # Next deadline is computed from the start, never from "now"
+            deadline = start + toggles * delay_s
+            now = time.monotonic()
+            if deadline > now:
+                time.sleep(deadline - now)
+            late = time.monotonic() - deadline
+            late_total += late
+            late_max = max(late_max, late)
+    except KeyboardInterrupt:
+        pass
+
+    return (toggles, last_toggle - start, late_total / max(1, toggles), late_max)
+
 
-try:
-    while True:
-        # Turn LED on
-        GPIO.output(USR3_LED, GPIO.HIGH)
-        time.sleep(DELAY_S)
+if __name__ == "__main__":
+    led_dirs = glob.glob(USR3_SYSFS)
+    previous_trigger = None
 
-        # Turn LED off
-        GPIO.output(USR3_LED, GPIO.LOW)
-        time.sleep(DELAY_S)
+    if led_dirs:
+        try:
+            previous_trigger = kernel_blink(led_dirs[0], DELAY_S)
+        except OSError as e:
+            print(f"Kernel timer trigger unavailable ({e}).")
 
-except KeyboardInterrupt:
-    print("\nCleaning up and exiting.")
-    GPIO.cleanup()
\ No newline at end of file
+    if previous_trigger is not None:
+        led_dir = led_dirs[0]
+        on_ms = int(read_attr(led_dir, "delay_on"))
+        off_ms = int(read_attr(led_dir, "delay_off"))
+        print(f"Blinking USR3 LED at {FREQ_HZ:g} Hz with the kernel timer trigger. "
+              "Press Ctrl+C to stop.")
+        try:
+            while True:
+                time.sleep(3600)    # Nothing to do; the kernel blinks the LED
+        except KeyboardInterrupt:
+            pass
+        print("\nRestoring LED trigger and exiting.")
+        write_attr(led_dir, "trigger", previous_trigger)
+        # Not measured: what the kernel was asked for (delays are rounded to ms)
+        print(f"Configured frequency: {1000.0 / (on_ms + off_ms):.3f} Hz "
+              f"(delay_on={on_ms} ms, delay_off={off_ms} ms, kernel timer; not measured)")
+    else:
+        print(f"Blinking USR3 LED at {FREQ_HZ:g} Hz (software timing). Press Ctrl+C to stop.")
+        (toggles, elapsed, late_mean, late_max) = software_blink(DELAY_S)
+        print("\nCleaning up and exiting.")
+        GPIO.cleanup()
+        if toggles > 1:
+            # toggles - 1 half periods between the first and the last toggle
+            print(f"Measured frequency: {(toggles - 1) / 2 / elapsed:.3f} Hz over {elapsed:.1f} s")
+            print(f"Jitter (wakeup lateness): mean {late_mean * 1000:.3f} ms, "
+                  f"max {late_max * 1000:.3f} ms")
@@ -44,7 +44,16 @@ button is not pressed) and will be connected to power when the button is pressed
   To select the pull up configuration, press_low=True.  To select the pull down
 configuration, press_low=False.
 
+Gestures
+
+  enable_gestures() switches the button to edge events: press / release times
+come from the edge interrupts instead of the polling loop, and click,
+double-click and long-press callbacks fire as soon as the gesture is known
+(on the edge, or when the long-press / double-click timer expires) instead
+of on the next poll.  ButtonChord detects several buttons pressed together.
+
 """
+import threading
 import time
 import Adafruit_BBIO.GPIO as GPIO
 
@@ -54,6 +63,18 @@ import Adafruit_BBIO.GPIO as GPIO
 HIGH = GPIO.HIGH
 LOW  = GPIO.LOW
 
+DEBOUNCE_MS       = 20         # Edges closer than this are ignored
+LONG_PRESS_TIME   = 1.0        # Held at least this long --> long press
+DOUBLE_CLICK_TIME = 0.3        # Second press within this --> double click
+CHORD_WINDOW      = 0.1        # Chord buttons must go down within this
+SETTLE_TIME       = 0.05       # Level re-checked this long after the last edge
+
+# Gesture states
+STATE_IDLE        = 0          # Released, nothing pending
+STATE_DOWN        = 1          # First press held
+STATE_WAIT_SECOND = 2          # Released; waiting to see if a second press comes
+STATE_DOWN_SECOND = 3          # Second press of a double click held
+
 # ------------------------------------------------------------------------
 # Global variables
 # ------------------------------------------------------------------------
@@ -77,6 +98,22 @@ class Button():
     on_press_callback_value       = None
     on_release_callback           = None
     on_release_callback_value     = None
+    click_callback                = None
+    double_click_callback         = None
+    long_press_callback           = None
+    edge_listeners                = None
+    gestures_enabled              = False
+    long_press_time               = None
+    double_click_time             = None
+    gesture_state                 = None
+    gesture_lock                  = None
+    gesture_timer                 = None
+    press_time                    = None
+    edge_pressed                  = False
+    settle_timer                  = None
+    long_press_fired              = False
+    release_count                 = 0
+    release_event                 = None
     
     def __init__(self, pin=None, press_low=True, sleep_time=0.1):
         if (pin == None):
@@ -136,8 +173,166 @@ class Button():
     def get_last_press_duration(self):
         return self.press_duration
     
+    # Gesture Functions
+    def enable_gestures(self, long_press_time=LONG_PRESS_TIME,
+                        double_click_time=DOUBLE_CLICK_TIME):
+        """ Switch to edge events and start recognizing gestures.
+            Calling it again only changes the times.
+        """
+        self.long_press_time   = long_press_time
+        self.double_click_time = double_click_time
+        if self.gestures_enabled:
+            return
+        self.edge_pressed      = self.is_pressed()
+        self.gesture_state     = STATE_IDLE
+        self.gesture_lock      = threading.RLock()
+        self.release_event     = threading.Condition(self.gesture_lock)
+        if self.edge_listeners is None:
+            self.edge_listeners = []
+        self.gestures_enabled  = True
+        GPIO.add_event_detect(self.pin, GPIO.BOTH, callback=self._edge,
+                              bouncetime=DEBOUNCE_MS)
+    
+    def disable_gestures(self):
+        """ Go back to polling only. """
+        if not self.gestures_enabled:
+            return
+        GPIO.remove_event_detect(self.pin)
+        with self.gesture_lock:
+            self._cancel_timer()
+            if self.settle_timer is not None:
+                self.settle_timer.cancel()
+                self.settle_timer = None
+            self.gesture_state    = STATE_IDLE
+            self.gestures_enabled = False
+    
+    def add_edge_listener(self, function):
+        """ Call function(button, pressed, timestamp) on every edge. """
+        if self.edge_listeners is None:
+            self.edge_listeners = []
+        self.edge_listeners.append(function)
+    
+    def _edge(self, channel):
+        """ Edge interrupt (GPIO event thread).
+            Adafruit_BBIO passes neither the direction nor the time of the
+            edge.  Edges alternate, so each one is taken as the opposite of
+            the last; once the input has settled the level is checked again
+            to catch an edge the debounce dropped.
+        """
+        timestamp = time.monotonic()
+        self.handle_edge(None, timestamp)
+        with self.gesture_lock:
+            if self.settle_timer is not None:
+                self.settle_timer.cancel()
+            self.settle_timer = threading.Timer(SETTLE_TIME, self._settle)
+            self.settle_timer.daemon = True
+            self.settle_timer.start()
+    
+    def _settle(self):
+        """ No edge for SETTLE_TIME: the level must match the last edge. """
+        with self.gesture_lock:
+            self.settle_timer = None
+            pressed = self.is_pressed()
+            if (not self.gestures_enabled) or (pressed == self.edge_pressed):
+                return
+        self.handle_edge(pressed, time.monotonic())
+    
+    def handle_edge(self, pressed, timestamp):
+        """ Advance the gesture state machine with one edge
+            (pressed=None: the opposite of the last edge).
+            Callbacks run after the gesture lock is released.
+        """
+        fire = []
+        with self.gesture_lock:
+            if pressed is None:
+                pressed = not self.edge_pressed
+            self.edge_pressed = pressed
+            state = self.gesture_state
+            
+            if pressed and (state == STATE_IDLE):
+                self.press_time       = timestamp
+                self.long_press_fired = False
+                self.gesture_state    = STATE_DOWN
+                self._start_timer(self.long_press_time, STATE_DOWN)
+                fire.append(self._fire_on_press)
+            
+            elif pressed and (state == STATE_WAIT_SECOND):
+                self._cancel_timer()
+                self.press_time    = timestamp
+                self.gesture_state = STATE_DOWN_SECOND
+                fire.append(self._fire_on_press)
+                if self.double_click_callback is not None:
+                    fire.append(self.double_click_callback)
+            
+            elif (not pressed) and (state in (STATE_DOWN, STATE_DOWN_SECOND)):
+                self._cancel_timer()
+                self.press_duration = timestamp - self.press_time
+                if (state == STATE_DOWN) and (not self.long_press_fired):
+                    # Could still become a double click
+                    self.gesture_state = STATE_WAIT_SECOND
+                    self._start_timer(self.double_click_time, STATE_WAIT_SECOND)
+                else:
+                    self.gesture_state = STATE_IDLE
+                self.release_count += 1
+                self.release_event.notify_all()
+                fire.append(self._fire_on_release)
+            
+            # Other combinations are repeated edges of the same level
+        
+        for callback in fire:
+            callback()
+        for listener in self.edge_listeners:
+            listener(self, pressed, timestamp)
+    
+    def _start_timer(self, delay, state):
+        self.gesture_timer = threading.Timer(delay, self._timer_expired, args=(state,))
+        self.gesture_timer.daemon = True
+        self.gesture_timer.start()
+    
+    def _cancel_timer(self):
+        if self.gesture_timer is not None:
+            self.gesture_timer.cancel()
+            self.gesture_timer = None
+    
+    def _timer_expired(self, state):
+        """ Long-press or double-click window ran out. """
+        callback = None
+        with self.gesture_lock:
+            if self.gesture_state != state:
+                return                       # An edge got there first
+            self.gesture_timer = None
+            
+            if state == STATE_DOWN:
+                self.long_press_fired = True
+                callback = self.long_press_callback
+            
+            elif state == STATE_WAIT_SECOND:
+                self.gesture_state = STATE_IDLE
+                callback = self.click_callback
+        
+        if callback is not None:
+            callback()
+    
+    def _fire_on_press(self):
+        if self.on_press_callback is not None:
+            self.on_press_callback_value = self.on_press_callback()
+    
+    def _fire_on_release(self):
+        if self.on_release_callback is not None:
+            self.on_release_callback_value = self.on_release_callback()
+    
+    def wait_for_click(self, timeout=None):
+        """ With gestures enabled: block until the next release.
+            press_duration then holds the edge-timed press length.
+            Returns False on timeout.
+        """
+        with self.gesture_lock:
+            count = self.release_count
+            return self.release_event.wait_for(lambda: self.release_count != count,
+                                               timeout)
+    
     def cleanup(self):
-        pass
+        self.disable_gestures()
     
     # Callback Functions
     def set_pressed_callback(self, function):
@@ -163,6 +358,56 @@ class Button():
     
     def get_on_release_callback_value(self):
         return self.on_release_callback_value
+    
+    def set_click_callback(self, function):
+        self.click_callback = function
+    
+    def set_double_click_callback(self, function):
+        self.double_click_callback = function
+    
+    def set_long_press_callback(self, function):
+        self.long_press_callback = function
+# End class
+
+
+class ButtonChord():
+    """ Fires a callback when all buttons are pressed together. """
+    buttons  = None
+    window   = None
+    callback = None
+    down     = None
+    fired    = False
+    lock     = None
+    
+    def __init__(self, buttons, callback, window=CHORD_WINDOW):
+        """ buttons need enable_gestures() (they report their edges). """
+        self.buttons  = list(buttons)
+        self.callback = callback
+        self.window   = window
+        self.down     = {}
+        self.fired    = False
+        self.lock     = threading.Lock()
+        for button in self.buttons:
+            button.add_edge_listener(self._edge)
+    
+    def _edge(self, button, pressed, timestamp):
+        with self.lock:
+            if pressed:
+                self.down[button] = timestamp
+            else:
+                self.down.pop(button, None)
+                if not self.down:
+                    self.fired = False           # All released: re-arm
+                return
+            
+            if self.fired or (len(self.down) != len(self.buttons)):
+                return
+            times = self.down.values()
+            if max(times) - min(times) > self.window:
+                return
+            self.fired = True
+        
+        self.callback()
 # End class
 
 # ------------------------------------------------------------------------
@@ -178,4 +423,17 @@ if __name__ == '__main__':
     button.wait_for_press()
     print(f"    Button was pressed for {button.get_last_press_duration():.2f} seconds.")
 
+    print("\nGesture test (Ctrl-C to exit): click, double click or hold ...")
+    button.set_click_callback(lambda: print("    Click"))
+    button.set_double_click_callback(lambda: print("    Double click"))
+    button.set_long_press_callback(lambda: print("    Long press"))
+    button.enable_gestures()
+    try:
+        while True:
+            if button.wait_for_click(timeout=1.0):
+                print(f"    (pressed for {button.get_last_press_duration():.3f} seconds)")
+    except KeyboardInterrupt:
+        pass
+    button.cleanup()
+
     print("\nTest Complete")
\ No newline at end of file
@@ -0,0 +1,257 @@
+# -*- coding: utf-8 -*-
+"""
+--------------------------------------------------------------------------
+Simple Calculator Server
+--------------------------------------------------------------------------
+License:   
+Copyright 2025 - Meghan Paral
+
+Redistribution and use in source and binary forms, with or without 
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, 
+this list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice, 
+this list of conditions and the following disclaimer in the documentation 
+and/or other materials provided with the distribution.
+
+3. Neither the name of the copyright holder nor the names of its contributors 
+may be used to endorse or promote products derived from this software without 
+specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" 
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE 
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE 
+ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE 
+LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR 
+CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF 
+SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS 
+INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN 
+CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) 
+ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF 
+THE POSSIBILITY OF SUCH DAMAGE.
+--------------------------------------------------------------------------
+
+Calculator server for many concurrent clients on a local Unix domain socket.
+
+  python3 calc_server.py [--socket PATH] [--workers N]
+
+Protocol (one request per line, one response per line, in order):
+  - Any line simple_calc.py --batch accepts ("a op b" or an expression)
+    --> the same output line ("<result>", "Error: <message>", "Invalid Input")
+  - "STATS" --> statistics of this connection
+  - "QUIT"  --> close the connection
+  - A line over 64 KiB --> "Error: request longer than ..." and the connection closes
+
+  Clients may pipeline: send many requests without waiting for responses.
+Requests whose estimated cost (simple_calc.estimate_program on the compiled
+expression) is above a few milliseconds run in a process pool so one client
+cannot stall the others; everything else is answered inline.
+Per-connection throughput and latency are logged when a client disconnects.
+
+--------------------------------------------------------------------------
+"""
+import argparse
+import asyncio
+import concurrent.futures
+import os
+import time
+
+import simple_calc
+
+# ------------------------------------------------------------------------
+# Constants
+# ------------------------------------------------------------------------
+SOCKET_PATH    = "/tmp/simple_calc.sock"
+PIPELINE_DEPTH = 256         # Requests a client may have in flight
+LINE_LIMIT     = 64 * 1024   # Longest request line; longer ones end the connection
+INLINE_SECONDS = 0.002       # Requests estimated to take longer go to the pool
+INLINE_BITS    = 1 << 16     # ... and so do results bigger than this
+
+# ------------------------------------------------------------------------
+# Functions / Classes
+# ------------------------------------------------------------------------
+def init_worker(bits, seconds):
+    """ Process pool initializer: copy the server's limits. """
+    simple_calc.budget["bits"] = bits
+    simple_calc.budget["seconds"] = seconds
+# End def
+
+
+def evaluate_line(line):
+    """ Evaluate one request line exactly like batch mode. """
+    return simple_calc.evaluate_chunk([line])[0]
+# End def
+
+
+def is_heavy(line):
+    """ Could this request take long?  Judged from the size / time estimate
+        of the whole compiled expression; requests over the budget fail
+        right away, so they are answered inline.
+    """
+    try:
+        (template, constants) = simple_calc.tokenize(line)
+        program = simple_calc.compile_template(template)
+    except simple_calc.ExpressionError:
+        return False
+    (bits, seconds) = simple_calc.estimate_program(program, constants)
+    if (bits > simple_calc.budget["bits"]) or (seconds > simple_calc.budget["seconds"]):
+        return False
+    return (seconds > INLINE_SECONDS) or (bits > INLINE_BITS)
+# End def
+
+
+class ConnectionStats():
+    """ Throughput and latency of one client connection. """
+    requests      = None
+    heavy         = None
+    latency_total = None
+    latency_max   = None
+    start_time    = None
+
+    def __init__(self):
+        self.requests      = 0
+        self.heavy         = 0
+        self.latency_total = 0.0
+        self.latency_max   = 0.0
+        self.start_time    = time.monotonic()
+
+    def add(self, latency, heavy):
+        self.requests      += 1
+        self.heavy         += int(heavy)
+        self.latency_total += latency
+        self.latency_max    = max(self.latency_max, latency)
+
+    def __str__(self):
+        elapsed = max(time.monotonic() - self.start_time, 1e-9)
+        mean = (self.latency_total / self.requests) if self.requests else 0.0
+        return (f"requests={self.requests} heavy={self.heavy} "
+                f"throughput={self.requests / elapsed:.1f}/s "
+                f"latency_mean={mean * 1000:.3f}ms "
+                f"latency_max={self.latency_max * 1000:.3f}ms")
+# End class
+
+
+class CalcServer():
+    """ asyncio server: one reader and one writer task per connection. """
+    path        = None
+    pool        = None
+    connections = None
+
+    def __init__(self, path=SOCKET_PATH, workers=None):
+        self.path        = path
+        self.pool        = concurrent.futures.ProcessPoolExecutor(
+                               max_workers=workers, initializer=init_worker,
+                               initargs=(simple_calc.budget["bits"],
+                                         simple_calc.budget["seconds"]))
+        self.connections = 0
+
+    async def serve(self):
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        server = await asyncio.start_unix_server(self.handle, path=self.path,
+                                                 limit=LINE_LIMIT)
+        print(f"Calculator server listening on {self.path}")
+        async with server:
+            await server.serve_forever()
+
+    async def handle(self, reader, writer):
+        """ Read requests and queue their (future) results in order. """
+        self.connections += 1
+        name = f"client-{self.connections}"
+        stats = ConnectionStats()
+        pending = asyncio.Queue(maxsize=PIPELINE_DEPTH)
+        sender = asyncio.create_task(self.send_results(writer, pending, stats))
+        loop = asyncio.get_running_loop()
+
+        try:
+            while True:
+                try:
+                    data = await reader.readline()
+                except (asyncio.LimitOverrunError, ValueError):
+                    # Over the stream limit: answer in order, then hang up
+                    # (the rest of the line is still unread)
+                    future = loop.create_future()
+                    future.set_result(f"Error: request longer than {LINE_LIMIT} bytes")
+                    await pending.put((future, time.monotonic(), None))
+                    break
+                if not data:
+                    break
+                line = data.decode(errors="replace").strip()
+                received = time.monotonic()
+
+                if line.upper() == "QUIT":
+                    break
+                if line.upper() == "STATS":
+                    # Answered in order, after the requests before it
+                    await pending.put((None, received, None))
+                    continue
+
+                heavy = is_heavy(line)
+                if heavy:
+                    future = loop.run_in_executor(self.pool, evaluate_line, line)
+                else:
+                    future = loop.create_future()
+                    future.set_result(evaluate_line(line))
+                await pending.put((future, received, heavy))
+        finally:
+            await pending.put(None)
+            await sender
+            writer.close()
+            print(f"{name}: {stats}")
+
+    async def send_results(self, writer, pending, stats):
+        """ Write results in request order as they complete. """
+        connected = True
+        while True:
+            item = await pending.get()
+            if item is None:
+                break
+            (future, received, heavy) = item
+            if future is None:
+                result = str(stats)
+            else:
+                try:
+                    result = await future
+                except Exception as e:
+                    result = f"Error: {e}"
+            if heavy is not None:
+                stats.add(time.monotonic() - received, heavy)
+            if not connected:
+                continue        # Client left; just finish the queue
+            try:
+                writer.write(result.encode() + b"\n")
+                if pending.empty():
+                    await writer.drain()
+            except ConnectionError:
+                connected = False
+        if connected:
+            try:
+                await writer.drain()
+            except ConnectionError:
+                pass
+# End class
+
+# ------------------------------------------------------------------------
+# Main script
+# ------------------------------------------------------------------------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simple calculator server")
+    parser.add_argument("--socket", default=SOCKET_PATH,
+                        help="Unix socket path (default %(default)s)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="processes for heavy requests (default: CPU count)")
+    parser.add_argument("--max-bits", type=int, default=simple_calc.MAX_BITS,
+                        help="largest integer result allowed (default %(default)s)")
+    parser.add_argument("--max-seconds", type=float, default=simple_calc.MAX_SECONDS,
+                        help="longest estimated compute time (default %(default)s)")
+    args = parser.parse_args()
+
+    simple_calc.budget["bits"] = args.max_bits
+    simple_calc.budget["seconds"] = args.max_seconds
+
+    try:
+        asyncio.run(CalcServer(args.socket, args.workers).serve())
+    except KeyboardInterrupt:
+        print("\nServer stopped.")
@@ -53,14 +53,86 @@ Error conditions:
   - Invalid operator --> Program should exit
   - Invalid number   --> Program should exit
 
+Batch mode:
+  python3 simple_calc.py --batch FILE     (FILE = "-" for stdin)
+
+  Reads one calculation per line, "a op b" or any expression (see
+Expressions; "a,op,b" with --csv), and prints one result per line, in order.
+Every line is evaluated like an expression, so integers stay exact and
+"-2 ** 2" is -4 however the line is spaced.  Input is processed in chunks;
+when NumPy is installed, float rows "a op b" of a chunk that use the same
+operator (and integer shifts) are evaluated with one vectorized call.  Rows
+the vectorized kernel cannot reproduce exactly (division by zero, overflow,
+big shifts, ...) fall back to the "operators" table.  Bad lines print
+"Invalid Input" and errors print "Error: <message>"; processing continues.
+
+Expressions:
+  python3 simple_calc.py --expr
+
+  Whole expressions such as "2 + 3 * (4 - 1) ** 2 << 1", using the operators
+above with Python's precedence and unary minus.  Integer literals stay
+integers.  Expressions are compiled to a small postfix program; programs are
+cached by the expression's shape (numbers replaced by slots), so repeated or
+templated expressions skip parsing.  "(a ** b) % m" compiles to pow(a, b, m).
+
+Limits:
+  Big-integer results ("<<", and "**" / "*" on integers) are checked before
+they are computed.  If the estimated result is larger than --max-bits, or
+the estimated time is longer than --max-seconds, the calculation fails right
+away with an error instead of hanging.  The time limit is for the whole
+expression: the estimates of all its operations are added up first.  Huge integers are printed shortened:
+leading digits, digit count and the exact last digits.
+
 --------------------------------------------------------------------------
 """
+import argparse
+import csv
+import functools
+import itertools
+import math
 import operator
+import re
 import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 # ------------------------------------------------------------------------
 # Constants
 # ------------------------------------------------------------------------
+CHUNK_SIZE   = 65536         # Lines evaluated per batch chunk
+VECTOR_MIN   = 32            # Fewer same-operator rows than this: use Python
+SHIFT_OPS    = (">>", "<<")
+MAX_BITS     = 1 << 24       # Default limit on the size of integer results
+MAX_SECONDS  = 2.0           # Default limit on the estimated compute time
+RENDER_DIGITS = 60           # Integers longer than this are printed shortened
+TAIL_DIGITS  = 10            # Exact trailing digits shown for huge integers
+MANTISSA_DIGITS = 12         # Most decimals shown in a shortened integer's mantissa
+CALIBRATION_BITS = 1 << 16   # Operand size used to time a multiplication
+KARATSUBA_EXPONENT = math.log2(3)
+EXPRESSION_CACHE_SIZE = 1024 # Compiled expression templates kept
+EXACT_BITS   = 4096          # Estimates compute integers up to this size exactly
+
+# Expression tokens: a number or an operator / parenthesis
+TOKEN_PATTERN = re.compile(r"\s*(?:((?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)|"
+                           r"(\*\*|<<|>>|[-+*/%()]))")
+NUMBER_SLOT  = "#"
+
+# Binary operators other than "**" (handled separately, right-associative)
+BINARY_PRECEDENCE = {
+    "<<": 0, ">>": 0,
+    "+": 1, "-": 1,
+    "*": 2, "/": 2, "%": 2
+}
+
+# Opcodes of compiled expressions
+OP_PUSH   = 0
+OP_APPLY  = 1
+OP_NEG    = 2
+OP_POWMOD = 3
 
 # ------------------------------------------------------------------------
 # Global variables
@@ -76,6 +148,29 @@ operators = {
     "**": operator.pow
 }
 
+# NumPy kernels with the same meaning as "operators" (see evaluate_vector)
+vector_operators = {}
+if np is not None:
+    vector_operators = {
+        "+": np.add,
+        "-": np.subtract,
+        "*": np.multiply,
+        "/": np.true_divide,
+        ">>": np.right_shift,
+        "<<": np.left_shift,
+        "%": np.mod
+        # No "**": np.power can differ from the C library pow() in the last bit
+    }
+
+# Current limits (changed with --max-bits / --max-seconds)
+budget = {
+    "bits": MAX_BITS,
+    "seconds": MAX_SECONDS
+}
+
+# Seconds per multiplication of two CALIBRATION_BITS integers (measured once)
+multiply_time = None
+
 # ------------------------------------------------------------------------
 # Functions
 # ------------------------------------------------------------------------
@@ -97,14 +192,7 @@ def get_user_input():
         in2 = input_func("Enter second number: ")
 
         func = operators.get(op)
-
-        # Shift operators require integers
-        if op == ">>" or op == "<<":
-            number1 = int(in1)
-            number2 = int(in2)
-        else:
-            number1 = float(in1)
-            number2 = float(in2)
+        (number1, number2) = parse_numbers(op, in1, in2)
             
         return (number1, number2, func)
 
@@ -112,10 +200,580 @@ def get_user_input():
         return (None, None, None)
 # End def
 
-# ------------------------------------------------------------------------
-# Main script
-# ------------------------------------------------------------------------
-if __name__ == "__main__":
+
+def parse_numbers(op, in1, in2):
+    """ Convert the two number strings for operator op (interactive mode:
+        floats, so "2 + 3" prints 5.0 as it always has).
+        Raises ValueError if a number is invalid.
+    """
+    # Shift operators require integers
+    if op in SHIFT_OPS:
+        return (int(in1), int(in2))
+    else:
+        return (float(in1), float(in2))
+# End def
+
+
+def split_line(line, use_csv=False):
+    """ Split one batch line into (in1, op, in2) strings.
+        Returns None if the line does not have three fields.
+    """
+    if use_csv:
+        fields = next(csv.reader([line]), [])
+    else:
+        fields = line.split()
+
+    fields = [f.strip() for f in fields]
+    if len(fields) != 3:
+        return None
+    return tuple(fields)
+# End def
+
+
+class LimitError(ArithmeticError):
+    """ Calculation would exceed the size / time budget. """
+    pass
+# End class
+
+
+def estimate_bits(func, number1, number2):
+    """ Estimate the size (bits) of an integer result before computing it.
+        Returns None when the result is not a big integer (floats, errors).
+    """
+    if not (isinstance(number1, int) and isinstance(number2, int)):
+        return None
+
+    if func is operator.lshift:
+        if (number1 == 0) or (number2 < 0):
+            return None
+        return number1.bit_length() + number2
+
+    if func is operator.pow:
+        if (number2 < 0) or (abs(number1) <= 1):
+            return None
+        return int(math.log2(abs(number1)) * number2) + 1
+
+    if func is operator.mul:
+        return number1.bit_length() + number2.bit_length()
+
+    return None
+# End def
+
+
+def estimate_seconds(bits):
+    """ Estimate the time to build a bits-sized result by multiplication.
+        Uses a one-time measurement scaled with Karatsuba complexity.  The
+        last multiplication has operands of half the result size, and the
+        earlier squarings of a power add about half of that again.
+    """
+    global multiply_time
+    if multiply_time is None:
+        x = (1 << CALIBRATION_BITS) - 1
+        start = time.perf_counter()
+        for _ in range(10):
+            x * x
+        multiply_time = (time.perf_counter() - start) / 10
+
+    return 1.5 * multiply_time * (bits / 2 / CALIBRATION_BITS) ** KARATSUBA_EXPONENT
+# End def
+
+
+def check_budget(func, number1, number2):
+    """ Raise LimitError if func(number1, number2) is too big / too slow. """
+    bits = estimate_bits(func, number1, number2)
+    if bits is None:
+        return
+
+    if bits > budget["bits"]:
+        raise LimitError(f"result would have about {bits} bits "
+                         f"(limit {budget['bits']})")
+
+    if func is not operator.lshift:
+        seconds = estimate_seconds(bits)
+        if seconds > budget["seconds"]:
+            raise LimitError(f"result would take about {seconds:.1f} s "
+                             f"(limit {budget['seconds']} s)")
+# End def
+
+
+def apply(func, number1, number2):
+    """ Compute func(number1, number2) after checking the budget. """
+    check_budget(func, number1, number2)
+    return func(number1, number2)
+# End def
+
+
+def powmod(number1, number2, modulus):
+    """ (number1 ** number2) % modulus.
+        Integers with a non-negative exponent and a non-zero modulus use
+        modular exponentiation (pow with three arguments), which stays fast
+        however large the exponent is.  Anything else is evaluated normally
+        (a negative exponent gives a float, not a modular inverse).
+    """
+    if all(isinstance(n, int) for n in (number1, number2, modulus)) and \
+       (number2 >= 0) and (modulus != 0):
+        return pow(number1, number2, modulus)
+    return apply(operator.mod, apply(operator.pow, number1, number2), modulus)
+# End def
+
+
+def estimate_program(program, constants):
+    """ Estimate a compiled program without running its big operations.
+        Small intermediate values are computed exactly (they may be
+        exponents or shift counts); big ones are tracked by size only.
+        Returns (largest result in bits, total estimated seconds).
+    """
+    stack = []                        # (value or None, bits)
+    largest = 0
+    seconds = 0.0
+
+    def exact(value):
+        if isinstance(value, int):
+            return (value, value.bit_length())
+        return (value, 0)
+
+    for (opcode, argument) in program:
+        if opcode == OP_PUSH:
+            stack.append(exact(constants[argument]))
+            continue
+        if opcode == OP_NEG:
+            (value, bits) = stack.pop()
+            stack.append((None if value is None else -value, bits))
+            continue
+
+        if opcode == OP_POWMOD:
+            (modulus, bits_m) = stack.pop()
+            (exponent, bits_e) = stack.pop()
+            (base, bits_b) = stack.pop()
+            if (None not in (base, exponent, modulus)) and (max(bits_m, bits_e) <= EXACT_BITS):
+                try:
+                    stack.append(exact(powmod(base, exponent, modulus)))
+                except (ArithmeticError, ValueError, TypeError):
+                    stack.append((None, 0))
+                continue
+            # One multiplication modulo m per exponent bit
+            seconds += max(1, bits_e) * estimate_seconds(2 * bits_m)
+            stack.append((None, bits_m))
+            continue
+
+        (number2, bits2) = stack.pop()
+        (number1, bits1) = stack.pop()
+        bits = None
+        if (number1 is not None) and (number2 is not None):
+            bits = estimate_bits(argument, number1, number2)
+            if (bits is None) or (bits <= EXACT_BITS):
+                try:
+                    result = exact(argument(number1, number2))
+                except (ArithmeticError, ValueError, TypeError):
+                    result = (None, 0)
+                stack.append(result)
+                largest = max(largest, result[1])
+                continue
+
+        # Size of a result too big to compute here
+        if bits is None:
+            if argument is operator.lshift:
+                bits = math.inf if number2 is None else bits1 + max(0, number2)
+            elif argument is operator.rshift:
+                bits = bits1 if number2 is None else max(0, bits1 - number2)
+            elif argument is operator.pow:
+                bits = math.inf if number2 is None else bits1 * max(0, number2)
+            elif argument is operator.mul:
+                bits = bits1 + bits2
+            elif argument is operator.mod:
+                bits = min(bits1, bits2)
+            elif argument is operator.truediv:
+                bits = 0
+            else:
+                bits = max(bits1, bits2) + 1
+        if argument in (operator.pow, operator.mul):
+            seconds += estimate_seconds(bits)
+        largest = max(largest, bits)
+        stack.append((None, bits))
+
+    return (largest, seconds)
+# End def
+
+
+def check_program(program, constants):
+    """ Raise LimitError if the whole program is too big / too slow. """
+    (bits, seconds) = estimate_program(program, constants)
+    if bits > budget["bits"]:
+        size = "too many" if bits == math.inf else f"about {bits}"
+        raise LimitError(f"result would have {size} bits (limit {budget['bits']})")
+    if seconds > budget["seconds"]:
+        raise LimitError(f"expression would take about {seconds:.1f} s "
+                         f"(limit {budget['seconds']} s)")
+# End def
+
+
+def render(result):
+    """ Convert a result to text.  Huge integers are shortened to
+        "<leading digits>...e+<exponent> (<n> digits, ends ...<last digits>)"
+        so they are not fully converted to decimal.
+    """
+    if (not isinstance(result, int)) or (result.bit_length() <= RENDER_DIGITS * 3):
+        return str(result)
+
+    number = abs(result)
+    magnitude = math.log10(number)
+    # log10() is good to about magnitude * 2**-52; next to a power of ten the
+    # digit count is settled by an exact comparison
+    error = magnitude * 2.0 ** -50
+    digits = int(magnitude) + 1
+    fraction = magnitude - int(magnitude)
+    if (fraction < error) or (fraction > 1 - error):
+        digits = int(round(magnitude)) + 1
+        if number < 10 ** (digits - 1):
+            digits -= 1
+
+    if digits <= RENDER_DIGITS:
+        return str(result)
+
+    # Only the leading mantissa digits the estimate can vouch for are printed
+    places = max(0, min(MANTISSA_DIGITS, int(-math.log10(error * math.log(10))) - 1))
+    mantissa = 10 ** max(0.0, magnitude - (digits - 1))
+    text = f"{mantissa:.{places}f}"
+    if text.startswith("10"):
+        text = "9." + "9" * places if places else "9"
+
+    sign = "-" if result < 0 else ""
+    tail = str(number % (10 ** TAIL_DIGITS)).zfill(TAIL_DIGITS)
+    return (f"{sign}{text}e+{digits - 1} "
+            f"({digits} digits, ends ...{tail})")
+# End def
+
+
+def evaluate(op, number1, number2):
+    """ Evaluate one calculation through the "operators" table.
+        Returns the output string for the result (or the error).
+    """
+    try:
+        return render(apply(operators[op], number1, number2))
+    except (ArithmeticError, ValueError, MemoryError) as e:
+        return f"Error: {e}"
+# End def
+
+
+class ExpressionError(ValueError):
+    """ Expression could not be parsed. """
+    pass
+# End class
+
+
+def tokenize(text):
+    """ Split an expression into tokens.
+        Returns (template, constants): the token tuple with every number
+        replaced by NUMBER_SLOT, and the list of number values.
+    """
+    template = []
+    constants = []
+    position = 0
+    text = text.strip()
+
+    while position < len(text):
+        match = TOKEN_PATTERN.match(text, position)
+        if match is None:
+            raise ExpressionError(f"unexpected character {text[position]!r}")
+        position = match.end()
+        (number, op) = match.groups()
+        if number is not None:
+            if any(c in number for c in ".eE"):
+                constants.append(float(number))
+            else:
+                constants.append(int(number))
+            template.append(NUMBER_SLOT)
+        elif op is not None:
+            template.append(op)
+
+    return (tuple(template), constants)
+# End def
+
+
+class Parser():
+    """ Precedence-climbing parser for one token template.
+        Builds a tree of tuples: slot index (int), ("neg", x) or (op, x, y).
+    """
+    tokens   = None
+    position = None
+    slot     = None
+
+    def __init__(self, tokens):
+        self.tokens   = tokens
+        self.position = 0
+        self.slot     = 0
+
+    def peek(self):
+        if self.position < len(self.tokens):
+            return self.tokens[self.position]
+        return None
+
+    def take(self):
+        token = self.peek()
+        self.position += 1
+        return token
+
+    def parse(self):
+        tree = self.binary(0)
+        if self.peek() is not None:
+            raise ExpressionError(f"unexpected {self.peek()!r}")
+        return tree
+
+    def binary(self, min_precedence):
+        """ Left-associative binary operators with precedence >= min_precedence. """
+        left = self.unary()
+        while (self.peek() in BINARY_PRECEDENCE) and \
+              (BINARY_PRECEDENCE[self.peek()] >= min_precedence):
+            op = self.take()
+            right = self.binary(BINARY_PRECEDENCE[op] + 1)
+            left = (op, left, right)
+        return left
+
+    def unary(self):
+        """ Unary +/- bind looser than "**" (-2 ** 2 == -4), like Python. """
+        if self.peek() == "-":
+            self.take()
+            return ("neg", self.unary())
+        if self.peek() == "+":
+            self.take()
+            return self.unary()
+        return self.power()
+
+    def power(self):
+        """ "**" is right-associative and its exponent may be signed. """
+        base = self.atom()
+        if self.peek() == "**":
+            self.take()
+            return ("**", base, self.unary())
+        return base
+
+    def atom(self):
+        token = self.take()
+        if token == NUMBER_SLOT:
+            self.slot += 1
+            return self.slot - 1
+        if token == "(":
+            tree = self.binary(0)
+            if self.take() != ")":
+                raise ExpressionError("missing ')'")
+            return tree
+        if token is None:
+            raise ExpressionError("unexpected end of expression")
+        raise ExpressionError(f"unexpected {token!r}")
+# End class
+
+
+def emit(tree, program):
+    """ Append the postfix instructions for tree to program. """
+    if isinstance(tree, int):
+        program.append((OP_PUSH, tree))
+    elif tree[0] == "neg":
+        emit(tree[1], program)
+        program.append((OP_NEG, None))
+    elif (tree[0] == "%") and (not isinstance(tree[1], int)) and (tree[1][0] == "**"):
+        # (a ** b) % m  -->  pow(a, b, m)
+        emit(tree[1][1], program)
+        emit(tree[1][2], program)
+        emit(tree[2], program)
+        program.append((OP_POWMOD, None))
+    else:
+        emit(tree[1], program)
+        emit(tree[2], program)
+        program.append((OP_APPLY, operators[tree[0]]))
+# End def
+
+
+@functools.lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def compile_template(template):
+    """ Compile a token template to a postfix program (tuple of
+        (opcode, argument) pairs).  Cached: expressions that differ only in
+        their numbers share one program.
+    """
+    program = []
+    emit(Parser(template).parse(), program)
+    return tuple(program)
+# End def
+
+
+def run_program(program, constants):
+    """ Execute a compiled program on the expression's numbers.
+        The whole program is checked against the budget first.
+    """
+    check_program(program, constants)
+    stack = []
+    for (opcode, argument) in program:
+        if opcode == OP_PUSH:
+            stack.append(constants[argument])
+        elif opcode == OP_APPLY:
+            number2 = stack.pop()
+            stack.append(apply(argument, stack.pop(), number2))
+        elif opcode == OP_NEG:
+            stack.append(-stack.pop())
+        else:
+            modulus = stack.pop()
+            number2 = stack.pop()
+            stack.append(powmod(stack.pop(), number2, modulus))
+    return stack[0]
+# End def
+
+
+def calculate(text):
+    """ Evaluate an expression such as "2 + 3 * (4 - 1) ** 2".
+        Integer literals stay integers (Python semantics).
+        Raises ExpressionError, ArithmeticError, ...
+    """
+    (template, constants) = tokenize(text)
+    return run_program(compile_template(template), constants)
+# End def
+
+
+def evaluate_expression(text):
+    """ Evaluate an expression; returns the output string (or the error). """
+    try:
+        (template, constants) = tokenize(text)
+    except ExpressionError:
+        return "Invalid Input"
+    return evaluate_tokens(template, constants)
+# End def
+
+
+def evaluate_tokens(template, constants):
+    """ Evaluate a tokenized expression; returns the output string (or the error). """
+    try:
+        return render(run_program(compile_template(template), constants))
+    except ExpressionError:
+        return "Invalid Input"
+    except (ArithmeticError, ValueError, TypeError, MemoryError) as e:
+        return f"Error: {e}"
+# End def
+
+
+@functools.lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def vector_form(template):
+    """ (op, negate1, negate2) if template is "[-]a op [-]b" with an operator
+        NumPy can evaluate, else None.
+    """
+    tokens = list(template)
+    negate1 = (tokens[:1] == ["-"])
+    if negate1:
+        tokens.pop(0)
+    if (len(tokens) < 3) or (tokens[0] != NUMBER_SLOT) or (tokens[1] not in vector_operators):
+        return None
+    rest = tokens[2:]
+    negate2 = (rest[:1] == ["-"])
+    if negate2:
+        rest.pop(0)
+    if rest != [NUMBER_SLOT]:
+        return None
+    return (tokens[1], negate1, negate2)
+# End def
+
+
+def evaluate_vector(op, numbers1, numbers2):
+    """ Evaluate many calculations of one operator (in vector_operators)
+        with NumPy.  Returns the list of output strings.
+
+        Results that are not finite, and shifts that do not fit in 64 bits,
+        are recomputed through evaluate() so they match the scalar results
+        (ZeroDivisionError, OverflowError, complex powers, big integers).
+    """
+    if op in SHIFT_OPS:
+        try:
+            a = np.array(numbers1, dtype=np.int64)
+            b = np.array(numbers2, dtype=np.int64)
+        except OverflowError:
+            return [evaluate(op, x, y) for (x, y) in zip(numbers1, numbers2)]
+
+        # Shift counts NumPy handles like Python ints
+        exact = (b >= 0) & (b < 63)
+        if op == "<<":
+            # No bits may be shifted past bit 62
+            limit = np.left_shift(np.int64(1), np.where(exact, 62 - b, 0))
+            exact &= (a < limit) & (a > -limit)
+        results = vector_operators[op](a, np.where(exact, b, 0))
+    else:
+        a = np.array(numbers1, dtype=np.float64)
+        b = np.array(numbers2, dtype=np.float64)
+        with np.errstate(all="ignore"):
+            results = vector_operators[op](a, b)
+        exact = np.isfinite(results)
+
+    output = list(map(str, results.tolist()))
+    for i in np.flatnonzero(~exact).tolist():
+        output[i] = evaluate(op, numbers1[i], numbers2[i])
+    return output
+# End def
+
+
+def evaluate_chunk(lines, use_csv=False):
+    """ Evaluate a chunk of batch lines.
+        Returns the list of output strings, in input order.
+    """
+    output = ["Invalid Input"] * len(lines)
+    groups = {}                       # op -> (row indexes, numbers1, numbers2)
+
+    for (i, line) in enumerate(lines):
+        if use_csv:
+            fields = split_line(line, use_csv)
+            if fields is not None:
+                line = " ".join(fields)
+        try:
+            (template, constants) = tokenize(line)
+        except ExpressionError:
+            continue
+
+        # Every line means what it means as an expression; only rows NumPy
+        # reproduces exactly (floats, integer shifts) are grouped
+        form = vector_form(template)
+        if form is None:
+            output[i] = evaluate_tokens(template, constants)
+            continue
+        (op, negate1, negate2) = form
+        (number1, number2) = constants
+        wanted = int if op in SHIFT_OPS else float
+        if not (isinstance(number1, wanted) and isinstance(number2, wanted)):
+            output[i] = evaluate_tokens(template, constants)
+            continue
+        if negate1:
+            number1 = -number1
+        if negate2:
+            number2 = -number2
+        group = groups.setdefault(op, ([], [], []))
+        group[0].append(i)
+        group[1].append(number1)
+        group[2].append(number2)
+
+    for (op, (rows, numbers1, numbers2)) in groups.items():
+        if (op in vector_operators) and (len(rows) >= VECTOR_MIN):
+            results = evaluate_vector(op, numbers1, numbers2)
+        else:
+            results = [evaluate(op, x, y) for (x, y) in zip(numbers1, numbers2)]
+        for (i, result) in zip(rows, results):
+            output[i] = result
+
+    return output
+# End def
+
+
+def run_batch(in_stream, out_stream, use_csv=False, chunk_size=CHUNK_SIZE):
+    """ Stream calculations from in_stream to out_stream, one chunk at a time.
+        Returns the number of lines processed.
+    """
+    count = 0
+    while True:
+        lines = list(itertools.islice(in_stream, chunk_size))
+        if not lines:
+            break
+        results = evaluate_chunk(lines, use_csv)
+        out_stream.write("\n".join(results))
+        out_stream.write("\n")
+        count += len(lines)
+    return count
+# End def
+
+
+def interactive():
+    """ Original calculator loop: one calculation per prompt. """
     while True:
         (num1, num2, func) = get_user_input()
 
@@ -123,5 +781,56 @@ if __name__ == "__main__":
             print("Invalid Input. Exiting.")
             break
 
-        result = func(num1, num2)
-        print(f"Result: {result}")
\ No newline at end of file
+        try:
+            result = render(apply(func, num1, num2))
+        except (ArithmeticError, ValueError, MemoryError) as e:
+            result = f"Error: {e}"
+        print(f"Result: {result}")
+# End def
+
+def interactive_expressions():
+    """ Calculator loop that takes one whole expression per prompt. """
+    while True:
+        try:
+            text = input("Enter expression: ")
+        except EOFError:
+            break
+
+        result = evaluate_expression(text)
+        if result == "Invalid Input":
+            print("Invalid Input. Exiting.")
+            break
+        print(f"Result: {result}")
+# End def
+
+# ------------------------------------------------------------------------
+# Main script
+# ------------------------------------------------------------------------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simple calculator")
+    parser.add_argument("--batch", metavar="FILE",
+                        help="evaluate 'a op b' lines from FILE ('-' = stdin)")
+    parser.add_argument("--expr", action="store_true",
+                        help="interactive mode takes whole expressions")
+    parser.add_argument("--csv", action="store_true",
+                        help="batch lines are CSV rows: a,op,b")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE,
+                        help="lines evaluated per chunk (default %(default)s)")
+    parser.add_argument("--max-bits", type=int, default=MAX_BITS,
+                        help="largest integer result allowed (default %(default)s)")
+    parser.add_argument("--max-seconds", type=float, default=MAX_SECONDS,
+                        help="longest estimated compute time (default %(default)s)")
+    args = parser.parse_args()
+
+    budget["bits"] = args.max_bits
+    budget["seconds"] = args.max_seconds
+
+    if (args.batch is None) and args.expr:
+        interactive_expressions()
+    elif args.batch is None:
+        interactive()
+    elif args.batch == "-":
+        run_batch(sys.stdin, sys.stdout, args.csv, args.chunk_size)
+    else:
+        with open(args.batch) as in_file:
+            run_batch(in_file, sys.stdout, args.csv, args.chunk_size)
\ No newline at end of file